@@ -0,0 +1,64 @@
+import asyncio
+import time
+
+from metrics import registry
+
+ACTIONS_DEDUPLICATED = registry.counter(
+    "moderation_actions_deduplicated_total",
+    "Moderation actions not sent to CRCON because an identical one was running or had just succeeded",
+    ("action", "reason"))
+
+
+class ActionRegistry:
+    """
+    Laufende und gerade erfolgreiche Moderationsaktionen, Schlüssel (Server, player_id, Aktion, ...).
+    Doppelklicks oder zwei Admins am selben Report lösen so nur einen CRCON-Aufruf aus:
+    gleichzeitige Aufrufe warten auf den ersten und bekommen dessen Ergebnis, danach werden
+    Wiederholungen window_seconds lang abgelehnt. Fehlgeschlagene Aktionen dürfen sofort erneut laufen.
+    """
+    def __init__(self, window_seconds=10):
+        self.window_seconds = window_seconds
+        self.in_flight = {}
+        self.completed = {}
+
+    def _purge(self):
+        now = time.monotonic()
+        expired = [key for key, (finished_at, _) in self.completed.items()
+                   if now - finished_at > self.window_seconds]
+        for key in expired:
+            del self.completed[key]
+
+    async def run(self, key, func, *args):
+        """
+        func(*args) für key ausführen und (Ergebnis, True) zurückgeben. Ist dieselbe Aktion gerade
+        in Arbeit oder eben erfolgreich gewesen, wird nichts ausgeführt: (ihr Ergebnis, False).
+        """
+        action = key[2]
+        self._purge()
+        if key in self.completed:
+            ACTIONS_DEDUPLICATED.inc(action, "recent")
+            return self.completed[key][1], False
+        future = self.in_flight.get(key)
+        if future is not None:
+            ACTIONS_DEDUPLICATED.inc(action, "in_flight")
+            # shield: bricht ein Wartender ab, läuft die Aktion für die anderen weiter
+            return await asyncio.shield(future), False
+
+        future = asyncio.get_running_loop().create_future()
+        self.in_flight[key] = future
+        try:
+            result = await func(*args)
+        except Exception as e:
+            future.set_exception(e)
+            future.exception()  # ohne Wartende kein "exception was never retrieved"
+            raise
+        except BaseException:
+            future.cancel()
+            raise
+        else:
+            future.set_result(result)
+            if result and self.window_seconds > 0:
+                self.completed[key] = (time.monotonic(), result)
+        finally:
+            del self.in_flight[key]
+        return result, True
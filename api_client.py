@@ -1,16 +1,110 @@
+import asyncio
 import aiohttp
 import logging
 import json
+import time
+from urllib.parse import urlsplit
+from metrics import crcon_trace_config, CRCON_JSON_DECODE_SECONDS, CACHE_REQUESTS
+from tracing import http_spans
+from records import Player, PlayerStats, PlayerProfile, LogEntry
+
+# Schnellster verfügbare JSON-Decoder; orjson und msgspec sind optional (pip install orjson)
+try:
+    import orjson
+    json_loads = orjson.loads
+    JSON_DECODER = "orjson"
+except ImportError:
+    try:
+        import msgspec
+        json_loads = msgspec.json.decode
+        JSON_DECODER = "msgspec"
+    except ImportError:
+        json_loads = json.loads
+        JSON_DECODER = "json"
+
+
+class RateLimiter:
+    """Verteilt Anfragen gleichmäßig: höchstens rate Starts pro Sekunde (0 = unbegrenzt)."""
+    def __init__(self, rate=0):
+        self.interval = 1 / rate if rate > 0 else 0
+        self.next_slot = 0.0
+
+    async def wait(self):
+        if not self.interval:
+            return
+        now = time.monotonic()
+        slot = max(now, self.next_slot)
+        self.next_slot = slot + self.interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
 
 class APIClient:
-    def __init__(self, base_url, api_token):
+    def __init__(self, base_url, api_token, max_connections=10, server_name=None, message_rate=0,
+                 decode_offload_bytes=0, response_cache=None):
         self.base_url = base_url
+        self.server_name = server_name
         self.headers = {"Authorization": f"Bearer {api_token}"}
+        self.max_connections = max_connections
+        # Antworten ab dieser Größe im Thread dekodieren (0 = immer im Event-Loop)
+        self.decode_offload_bytes = decode_offload_bytes
+        # HTTP-Cache (ResponseCache) für Profile und Nachrichtenvorlagen, None = aus
+        self.response_cache = response_cache
         self.session = None
+        # Gilt für alle Sammelnachrichten dieses Servers zusammen, nicht pro Aufruf
+        self.message_limiter = RateLimiter(message_rate)
 
     async def create_session(self):
+        # Eine Session pro Client/Server: Verbindungen werden wiederverwendet und sind nach oben begrenzt
         if not self.session:
-            self.session = aiohttp.ClientSession(headers=self.headers)
+            connector = aiohttp.TCPConnector(limit=self.max_connections)
+            self.session = aiohttp.ClientSession(headers=self.headers, connector=connector,
+                                                 trace_configs=[http_spans(crcon_trace_config(self.server_name), "crcon")])
+
+    async def _json(self, response):
+        """
+        Antwort mit json_loads statt response.json() dekodieren. Große Antworten (z.B. get_detailed_players)
+        laufen im Thread-Pool, damit der Event-Loop zwischendurch weiterarbeiten kann.
+        """
+        return await self._decode(await response.read(), response.url.path)
+
+    async def _decode(self, body, endpoint):
+        started = time.perf_counter()
+        if self.decode_offload_bytes and len(body) >= self.decode_offload_bytes:
+            data = await asyncio.get_running_loop().run_in_executor(None, json_loads, body)
+        else:
+            data = json_loads(body)
+        CRCON_JSON_DECODE_SECONDS.observe(time.perf_counter() - started, endpoint)
+        return data
+
+    async def _get_cached(self, url):
+        """
+        GET über den ResponseCache: frische Einträge ohne Anfrage, sonst bedingte Anfrage mit
+        If-None-Match/If-Modified-Since; bei 304 wird der gespeicherte Body verwendet.
+        Gibt das dekodierte JSON zurück, Fehler wie raise_for_status.
+        """
+        endpoint = urlsplit(url).path
+        if self.response_cache is None:
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                return await self._json(response)
+
+        entry = self.response_cache.get(url)
+        if entry is not None and entry.is_fresh():
+            CACHE_REQUESTS.inc("crcon_http", "hit")
+            return await self._decode(entry.body, endpoint)
+        headers = entry.conditional_headers() if entry is not None else None
+        async with self.session.get(url, headers=headers) as response:
+            if response.status == 304 and entry is not None:
+                CACHE_REQUESTS.inc("crcon_http", "not_modified")
+                self.response_cache.revalidated(url, entry, response.headers)
+                body = entry.body
+            else:
+                response.raise_for_status()
+                CACHE_REQUESTS.inc("crcon_http", "miss")
+                body = await response.read()
+                self.response_cache.store(url, body, response.headers)
+        return await self._decode(body, endpoint)
 
     async def close_session(self):
         if self.session:
@@ -18,26 +112,30 @@ class APIClient:
             self.session = None
 
     async def get_player_data(self, player_id):
-        """Beispiel-Endpunkt zum Abfragen von Live-Stats."""
+        """Live-Stats eines Spielers als PlayerStats (None, wenn er nicht in get_live_game_stats steht)."""
         url = f'{self.base_url}/api/get_live_game_stats'
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    if response.status != 200:
-                        return None
-                    return await response.json()
+            async with self.session.get(url) as response:
+                if response.status != 200:
+                    return None
+                data = await self._json(response)
+                # Nur für den gesuchten Spieler einen Record anlegen
+                stats = next((item for item in data['result']['stats'] if item['player_id'] == player_id), None)
+                return PlayerStats.from_api(stats) if stats else None
         except Exception as e:
             logging.error(f"Error in get_player_data: {e}")
             return None
 
     async def get_detailed_players(self):
-        """Detaillierte Daten zu allen Spielern."""
+        """Alle Spieler mit Team, Einheit, Rolle und Stats als [Player]."""
         url = f'{self.base_url}/api/get_detailed_players'
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                data = await self._json(response)
+                return [Player.from_api(player) for player in data['result']['players'].values()]
         except Exception as e:
             logging.error(f"Error fetching detailed players data: {e}")
             return None
@@ -53,67 +151,54 @@ class APIClient:
         }
         logging.info(f"Sending kick request to API: {data}")
 
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.post(url, json=data) as response:
-                    response_text = await response.text()
-                    logging.info(f"API response for do_kick: Status {response.status}, Body {response_text}")
+            async with self.session.post(url, json=data) as response:
+                response_text = await response.text()
+                logging.info(f"API response for do_kick: Status {response.status}, Body {response_text}")
 
-                    if response.status != 200:
-                        logging.error(f"Fehler beim Kicken des Spielers: {response.status}, Antwort: {response_text}")
-                        return False
-                    return True
+                if response.status != 200:
+                    logging.error(f"Fehler beim Kicken des Spielers: {response.status}, Antwort: {response_text}")
+                    return False
+                return True
         except Exception as e:
             logging.error(f"Error sending kick request: {e}")
             return False
 
     async def get_player_by_steam_id(self, player_id):
-        """Spielername anhand einer Steam-ID holen (Beispiel)."""
-        url = f'{self.base_url}/api/get_player_profile?player_id={player_id}'
-        try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    if data and 'result' in data and 'names' in data['result']:
-                        first_name_record = data['result']['names'][0]
-                        return first_name_record['name']
-                    return None
-        except Exception as e:
-            logging.error(f"Error fetching player data for Steam ID {player_id}: {e}")
-            return None
+        """Spielername anhand einer Steam-ID holen (erster Name im Profil)."""
+        profile = await self.get_player_by_id(player_id)
+        return profile.name if profile else None
 
     async def get_player_by_id(self, player_id):
-        """Komplette Player-Daten anhand ID."""
+        """Profil eines Spielers als PlayerProfile."""
         url = f'{self.base_url}/api/get_player_profile?player_id={player_id}'
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    if data and 'result' in data:
-                        return data['result']
-                    return None
+            data = await self._get_cached(url)
+            if data and data.get('result'):
+                return PlayerProfile.from_api(data['result'])
+            return None
         except Exception as e:
             logging.error(f"Error fetching player data for Steam ID {player_id}: {e}")
             return None
 
     async def get_players(self):
-        """Schnelle Liste aller aktuell bekannten Spieler."""
+        """Schnelle Liste aller aktuell bekannten Spieler als [Player] (nur Name, ID, Level)."""
         url = f'{self.base_url}/api/get_players'
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            async with self.session.get(url) as response:
+                response.raise_for_status()
+                data = await self._json(response)
+                return [Player.from_api(player) for player in data['result']]
         except Exception as e:
             logging.error(f"Error fetching fast players data: {e}")
             return None
 
     async def do_temp_ban(self, player, player_id, duration_hours, reason):
         """Spieler temporär bannen."""
-        if not self.session:
-            await self.create_session()
+        await self.create_session()
         url = f'{self.base_url}/api/temp_ban'
         data = {
             'player_name': player,
@@ -136,8 +221,7 @@ class APIClient:
 
     async def do_perma_ban(self, player, player_id, reason):
         """Spieler permanent bannen."""
-        if not self.session:
-            await self.create_session()
+        await self.create_session()
         url = f'{self.base_url}/api/perma_ban'
         data = {
             'player_name': player,
@@ -161,8 +245,7 @@ class APIClient:
         """
         Fügt einen Blacklist-Eintrag hinzu, z.B. für Temp- oder Perma-Bans.
         """
-        if not self.session:
-            await self.create_session()
+        await self.create_session()
         url = f'{self.base_url}/api/add_blacklist_record'
         data = {
             'player_id': player_id,
@@ -190,18 +273,35 @@ class APIClient:
             "player_id": player_id,
             "message": message
         }
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.post(url, json=data) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            async with self.session.post(url, json=data) as response:
+                response.raise_for_status()
+                return await self._json(response)
         except Exception as e:
             logging.error(f"Error sending message to player {player}: {e}")
             return None
 
+    async def message_players(self, recipients, message, concurrency=4):
+        """
+        Dieselbe Nachricht an mehrere Spieler [(player_id, name)]: parallel über die Session,
+        höchstens concurrency gleichzeitig und gedrosselt über message_limiter.
+        Ergebnis pro Empfänger: {player_id: True/False}.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def send(player_id, name):
+            async with semaphore:
+                await self.message_limiter.wait()
+                return bool(await self.do_message_player(name, player_id, message))
+
+        recipients = list(dict(recipients).items())  # jeder Spieler nur einmal
+        results = await asyncio.gather(*(send(player_id, name) for player_id, name in recipients))
+        return {player_id: success for (player_id, _), success in zip(recipients, results)}
+
     async def get_structured_logs(self, since_min_ago, filter_action=None, filter_player=None):
         """
-        Strukturierte Logs abrufen.
+        Strukturierte Logs abrufen, als [LogEntry].
         """
         url = f'{self.base_url}/api/get_structured_logs'
         params = {
@@ -213,12 +313,12 @@ class APIClient:
         if filter_player is not None:
             params["filter_player"] = filter_player
 
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url, params=params) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data
+            async with self.session.get(url, params=params) as response:
+                response.raise_for_status()
+                data = await self._json(response)
+                return [LogEntry.from_api(log) for log in data['result']['logs']]
         except Exception as e:
             logging.error(f"Error fetching structured logs: {e}")
             return None
@@ -230,11 +330,11 @@ class APIClient:
             "player_id": player_id,
             "comment": comment
         }
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.post(url, json=data) as response:
-                    response.raise_for_status()
-                    return await response.json()
+            async with self.session.post(url, json=data) as response:
+                response.raise_for_status()
+                return await self._json(response)
         except Exception as e:
             logging.error(f"Error posting comment '{comment}' for player {player_id}: {e}")
             return None
@@ -252,12 +352,10 @@ class APIClient:
         oder {} bei Fehler.
         """
         url = f'{self.base_url}/api/get_all_message_templates'
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.get(url) as response:
-                    response.raise_for_status()
-                    data = await response.json()
-                    return data["result"]
+            data = await self._get_cached(url)
+            return data["result"]
         except Exception as e:
             logging.error(f"Error fetching message templates: {e}")
             return {}
@@ -273,16 +371,16 @@ class APIClient:
         }
         logging.info(f"Sending punish request to API: {data}")
 
+        await self.create_session()
         try:
-            async with aiohttp.ClientSession(headers=self.headers) as session:
-                async with session.post(url, json=data) as response:
-                    response_text = await response.text()
-                    logging.info(f"API response for punish: Status {response.status}, Body {response_text}")
+            async with self.session.post(url, json=data) as response:
+                response_text = await response.text()
+                logging.info(f"API response for punish: Status {response.status}, Body {response_text}")
 
-                    if response.status != 200:
-                        logging.error(f"Fehler beim Punishen des Spielers: {response.status}, Antwort: {response_text}")
-                        return False
-                    return True
+                if response.status != 200:
+                    logging.error(f"Fehler beim Punishen des Spielers: {response.status}, Antwort: {response_text}")
+                    return False
+                return True
         except Exception as e:
             logging.error(f"Error sending punish request: {e}")
             return False
@@ -0,0 +1,213 @@
+"""
+Offline-Benchmark für den Aufbau der Report-Embeds (playerreportembed, unitreportembed,
+unitleadersembed, player_not_found_embed).
+
+Baut für ein synthetisches Roster (wie mock_crcon) die Embeds aller Reporttypen in allen
+Sprachen aus languages.json und misst die Kosten pro Report, kein Netzwerk, kein Discord:
+
+    python benchmarks/embed_benchmark.py
+    python benchmarks/embed_benchmark.py --compare legacy
+    python benchmarks/embed_benchmark.py --players 100 --iterations 200 --json
+
+'templates' = aktuelle Embeds aus messages.py (Vorlage pro Sprache und Reporttyp),
+'legacy' = ursprünglicher Aufbau Feld für Feld mit get_translation. Vor der Messung wird
+geprüft, dass beide Varianten identische Embeds liefern.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# languages.json und die Bot-Module werden relativ zum Repository geladen
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
+
+import discord  # noqa: E402
+from helpers import get_translation, translations  # noqa: E402
+from messages import playerreportembed, unitreportembed, unitleadersembed, player_not_found_embed  # noqa: E402
+from mock_crcon import build_roster  # noqa: E402
+from records import Player, PlayerStats, PlayerProfile  # noqa: E402
+
+
+async def legacy_unitreportembed(player_additional_data, user_lang, unit_name, roles, team, player):
+    embed_title = get_translation(user_lang, "players_in_unit").format(unit_name, ', '.join(roles), team)
+    embed = discord.Embed(title=embed_title, color=0xd85f0e)
+    total_playtime_hours = player_additional_data.total_playtime_seconds / 3600
+    embed.add_field(name=get_translation(user_lang, "name"), value=player.name, inline=True)
+    embed.add_field(name=get_translation(user_lang, "level"), value=player.level, inline=True)
+    embed.add_field(name=get_translation(user_lang, "total_playtime"),
+                    value=f"{total_playtime_hours:.2f} " + get_translation(user_lang, "hours"), inline=True)
+    embed.add_field(name=get_translation(user_lang, "kills"), value=player.kills, inline=True)
+    embed.add_field(name=get_translation(user_lang, "deaths"), value=player.deaths, inline=True)
+    embed.add_field(name=get_translation(user_lang, "steam_id"), value=player.player_id, inline=True)
+    return embed
+
+
+async def legacy_unitleadersembed(user_lang, unit_name, roles, team, players, players_additional_data):
+    embed_title = get_translation(user_lang, "players_in_unit").format(unit_name, ', '.join(roles), team)
+    embed = discord.Embed(title=embed_title, color=0xd85f0e)
+    for player, player_additional_data in list(zip(players, players_additional_data))[:25]:
+        total_playtime_hours = player_additional_data.total_playtime_seconds / 3600
+        value = (
+            f"{get_translation(user_lang, 'level')}: {player.level} | "
+            f"{get_translation(user_lang, 'kills')}: {player.kills} | "
+            f"{get_translation(user_lang, 'deaths')}: {player.deaths}\n"
+            f"{get_translation(user_lang, 'total_playtime')}: {total_playtime_hours:.2f} "
+            f"{get_translation(user_lang, 'hours')}\n"
+            f"{get_translation(user_lang, 'steam_id')}: {player.player_id}"
+        )
+        embed.add_field(name=f"{player.name} ({player.role}, {player.team})", value=value, inline=False)
+    return embed
+
+
+async def legacy_player_not_found_embed(player_id, player_name, user_lang):
+    embed = discord.Embed(title=get_translation(user_lang, "no_matching_player_found"), color=discord.Colour.magenta())
+    embed.add_field(name=get_translation(user_lang, "name"), value=player_name, inline=True)
+    embed.add_field(name=get_translation(user_lang, "steam_id"), value=player_id, inline=True)
+    return embed
+
+
+async def legacy_playerreportembed(user_lang, best_match, player_stats, total_playtime_hours, best_player_data,
+                                   alternatives=None):
+    embed_title = get_translation(user_lang, "report_for_player").format(best_match)
+    embed = discord.Embed(title=embed_title, color=0xd85f0e)
+    if alternatives:
+        alternatives_text = "\n".join(
+            f"`{score:.2f}` {player.name}" for score, player in alternatives
+            if player.player_id != best_player_data.player_id
+        )
+        if alternatives_text:
+            embed.add_field(name=get_translation(user_lang, "possible_alternatives"), value=alternatives_text,
+                            inline=False)
+    if player_stats.realname:
+        embed.add_field(name=get_translation(user_lang, "realname"), value=player_stats.realname, inline=True)
+    embed.add_field(name=get_translation(user_lang, "information"),
+                    value=get_translation(user_lang, "check_report_match"), inline=False)
+    embed.add_field(name=get_translation(user_lang, "total_playtime"),
+                    value=f"{total_playtime_hours:.2f} " + get_translation(user_lang, "hours"), inline=True)
+    embed.add_field(name="Steam-ID", value=best_player_data.player_id, inline=True)
+    embed.add_field(name=get_translation(user_lang, "kills"), value=player_stats.kills, inline=True)
+    embed.add_field(name=get_translation(user_lang, "kill_streak"), value=player_stats.kills_streak, inline=True)
+    embed.add_field(name=get_translation(user_lang, "kill_death_ratio"), value=player_stats.kill_death_ratio,
+                    inline=True)
+    embed.add_field(name=get_translation(user_lang, "kills_per_minute"), value=player_stats.kills_per_minute,
+                    inline=True)
+    embed.add_field(name=get_translation(user_lang, "deaths"), value=player_stats.deaths, inline=True)
+    embed.add_field(name=get_translation(user_lang, "teamkills"), value=player_stats.teamkills, inline=True)
+    embed.add_field(name=get_translation(user_lang, "teamkill_streak"), value=player_stats.teamkills_streak,
+                    inline=True)
+    return embed
+
+
+BUILDERS = {
+    "templates": (playerreportembed, unitreportembed, unitleadersembed, player_not_found_embed),
+    "legacy": (legacy_playerreportembed, legacy_unitreportembed, legacy_unitleadersembed,
+               legacy_player_not_found_embed),
+}
+
+
+def build_cases(roster):
+    """Ein Aufruf pro Spieler und Sprache, abwechselnd die vier Reporttypen."""
+    players = [Player.from_api(player) for player in roster]
+    cases = []
+    for index, player in enumerate(players):
+        stats = PlayerStats.from_api({
+            "player_id": player.player_id,
+            "kills": player.kills,
+            "kills_streak": player.kills // 5,
+            "kill_death_ratio": round(player.kills / max(player.deaths, 1), 2),
+            "kills_per_minute": round(player.kills / 60, 2),
+            "deaths": player.deaths,
+            "teamkills": player.kills % 4,
+            "teamkills_streak": player.kills % 2,
+            "steaminfo": {"profile": {"realname": f"Real {index}" if index % 3 == 0 else None}},
+        })
+        additional = PlayerProfile(player.player_id, player.name, total_playtime_seconds=index * 3731)
+        alternatives = [(0.1, player), (0.4, players[index - 1])] if index % 4 == 0 else None
+        for lang in translations.bundles:
+            kind = index % 4
+            if kind == 0:
+                args = (lang, player.name, stats, additional.total_playtime_hours, player, alternatives)
+            elif kind == 1:
+                args = (additional, lang, player.unit_name, [player.role], player.team, player)
+            elif kind == 2:
+                leaders = [player, players[index - 1]]
+                args = (lang, "command", ["armycommander"], player.team, leaders, [additional, additional])
+            else:
+                args = (player.player_id, player.name, lang)
+            cases.append((kind, args))
+    return cases
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def build_all(builders, cases):
+    return [await builders[kind](*args) for kind, args in cases]
+
+
+async def run(builders, cases, iterations):
+    latencies = []
+    # Aufwärmen, damit die Reihenfolge beim Vergleich keine Rolle spielt (und die Vorlagen gebaut sind)
+    await build_all(builders, cases)
+    for _ in range(iterations):
+        for kind, args in cases:
+            started = time.perf_counter()
+            await builders[kind](*args)
+            latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    total = len(latencies)
+    return {
+        "embeds": total,
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p95_us": percentile(latencies, 0.95) * 1e6,
+        "p99_us": percentile(latencies, 0.99) * 1e6,
+        "throughput_per_s": total / sum(latencies),
+    }
+
+
+def print_result(name, result):
+    print(f"{name}")
+    print(f"  embeds:         {result['embeds']}")
+    print(f"  latency p50/95/99: {result['p50_us']:.1f} / {result['p95_us']:.1f} / {result['p99_us']:.1f} us")
+    print(f"  throughput:     {result['throughput_per_s']:.0f} embeds/s")
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for report embed construction")
+    parser.add_argument('--builder', default='templates', choices=sorted(BUILDERS))
+    parser.add_argument('--compare', default=None, choices=sorted(BUILDERS), help="second variant side by side")
+    parser.add_argument('--players', type=int, default=60)
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    cases = build_cases(build_roster(args.players))
+    specs = list(filter(None, [args.builder, args.compare]))
+    if len(specs) == 2:
+        first = await build_all(BUILDERS[specs[0]], cases)
+        second = await build_all(BUILDERS[specs[1]], cases)
+        mismatches = sum(a.to_dict() != b.to_dict() for a, b in zip(first, second))
+        if mismatches:
+            sys.exit(f"{mismatches} embeds differ between {specs[0]} and {specs[1]}")
+
+    results = {spec: await run(BUILDERS[spec], cases, args.iterations) for spec in specs}
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for spec, result in results.items():
+        print_result(spec, result)
+    if args.compare:
+        base, other = results[args.builder], results[args.compare]
+        print(f"p50 ratio {args.builder} / {args.compare}: {base['p50_us'] / other['p50_us']:.2f}x")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
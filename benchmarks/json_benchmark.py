@@ -0,0 +1,105 @@
+"""
+Offline-Benchmark für das Dekodieren der großen CRCON-Antworten (get_detailed_players,
+get_live_game_stats, get_structured_logs) mit den verfügbaren JSON-Decodern.
+
+Die Antworten kommen aus mock_crcon (synthetisches Roster), kein Netzwerk:
+
+    python benchmarks/json_benchmark.py
+    python benchmarks/json_benchmark.py --players 100 --logs 2000 --iterations 200 --json
+
+'json' ist immer dabei, orjson und msgspec nur, wenn sie installiert sind.
+"""
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(REPO_ROOT, 'benchmarks'))
+
+from mock_crcon import MockCRCON  # noqa: E402
+
+
+def available_decoders():
+    decoders = {"json": json.loads}
+    try:
+        import orjson
+        decoders["orjson"] = orjson.loads
+    except ImportError:
+        pass
+    try:
+        import msgspec
+        decoders["msgspec"] = msgspec.json.decode
+    except ImportError:
+        pass
+    return decoders
+
+
+async def build_payloads(players, logs):
+    mock = MockCRCON(roster_size=players)
+    now_ms = int(time.time() * 1000)
+    log_payload = {"result": {"logs": [{
+        "timestamp_ms": now_ms - index * 1000,
+        "action": "KILL",
+        "player_name_1": mock.players[index % players]["name"],
+        "player_id_1": mock.players[index % players]["player_id"],
+        "player_name_2": mock.players[(index + 1) % players]["name"],
+        "player_id_2": mock.players[(index + 1) % players]["player_id"],
+        "weapon": "M1 GARAND",
+        "message": f"log line {index}",
+    } for index in range(logs)], "actions": ["KILL"], "players": []}, "failed": False, "error": None}
+    return {
+        "get_detailed_players": (await mock.get_detailed_players(None)).body,
+        "get_live_game_stats": (await mock.get_live_game_stats(None)).body,
+        "get_structured_logs": json.dumps(log_payload).encode(),
+    }
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(decode, body, iterations):
+    decode(body)  # Aufwärmen
+    latencies = []
+    for _ in range(iterations):
+        started = time.perf_counter()
+        decode(body)
+        latencies.append(time.perf_counter() - started)
+    latencies.sort()
+    return {
+        "p50_us": percentile(latencies, 0.50) * 1e6,
+        "p95_us": percentile(latencies, 0.95) * 1e6,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for decoding CRCON responses")
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--logs', type=int, default=1000, help="log lines in get_structured_logs")
+    parser.add_argument('--iterations', type=int, default=100)
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    payloads = await build_payloads(args.players, args.logs)
+    decoders = available_decoders()
+    results = {
+        endpoint: {"bytes": len(body), **{name: run(decode, body, args.iterations) for name, decode in decoders.items()}}
+        for endpoint, body in payloads.items()
+    }
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for endpoint, result in results.items():
+        print(f"{endpoint} ({result['bytes'] / 1024:.0f} KiB)")
+        for name in decoders:
+            ratio = result["json"]["p50_us"] / result[name]["p50_us"]
+            print(f"  {name:8} p50/95: {result[name]['p50_us']:8.1f} / {result[name]['p95_us']:8.1f} us  "
+                  f"({ratio:.1f}x json)")
+
+
+if __name__ == '__main__':
+    asyncio.run(main())
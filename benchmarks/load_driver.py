@@ -0,0 +1,292 @@
+"""
+Lasttreiber: feuert synthetische Report-Embeds an MyBot.on_message und misst
+End-to-End-Latenz sowie CRCON-Aufrufe pro Report.
+
+Startet standardmäßig einen MockCRCON im selben Prozess:
+
+    python benchmarks/load_driver.py --reports 200 --concurrency 20 --latency-ms 40
+
+Alternativ gegen einen separat gestarteten Mock (python benchmarks/mock_crcon.py):
+
+    python benchmarks/load_driver.py --url http://127.0.0.1:8010 --reports 200
+
+Mit --metrics-file wird am Ende der Stand von /metrics (Prometheus-Textformat) in eine Datei geschrieben,
+mit --trace-file werden die Spans aller Reports als JSON Lines aufgezeichnet.
+Mit --channels N verteilt der Treiber die Reports reihum auf N Report-Kanäle (abwechselnde Sprachen),
+die sich wie im Betrieb einen Bot-Prozess teilen.
+"""
+import argparse
+import asyncio
+import contextlib
+import itertools
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+from collections import Counter
+
+import aiohttp
+import discord
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from mock_crcon import MockCRCON, start_server, UNITS  # noqa: E402
+
+CHANNEL_ID = 4242
+SERVER_NAME = "Loadtest"
+_message_ids = itertools.count(1)
+
+
+class FakeChannel:
+    def __init__(self, channel_id):
+        self.id = channel_id
+        self.messages = {}
+
+    async def fetch_message(self, message_id):
+        return self.messages[message_id]
+
+
+_channels = [FakeChannel(CHANNEL_ID)]
+
+
+class FakeAuthor:
+    def __init__(self, name):
+        self.name = name
+        self.display_name = name
+
+
+class FakeMessage:
+    """Minimaler Ersatz für discord.Message, so weit on_message ihn benutzt."""
+    def __init__(self, embed=None, reference_message=None, view=None, channel=None):
+        self.id = next(_message_ids)
+        self.author = FakeAuthor("CRCON Webhook")
+        self.channel = channel or (reference_message.channel if reference_message else _channels[0])
+        self.channel.messages[self.id] = self
+        self.embeds = [embed] if embed else []
+        self.components = [view] if view else []
+        self.reference_message = reference_message
+        self.replies = []
+        self.reactions = []
+        self.done = asyncio.Event()
+
+    async def reply(self, content=None, embed=None, view=None, **kwargs):
+        response = FakeMessage(embed, reference_message=self, view=view)
+        self.replies.append(response)
+        self.done.set()
+        return response
+
+    async def edit(self, **kwargs):
+        if 'embed' in kwargs:
+            self.embeds = [kwargs['embed']]
+        if 'view' in kwargs:
+            self.components = [kwargs['view']] if kwargs['view'] else []
+        return self
+
+    async def add_reaction(self, emoji):
+        self.reactions.append(emoji)
+        self.done.set()
+
+
+def typo(name, rng):
+    """Zufälliger Tippfehler, wie ihn Spieler beim Melden machen."""
+    if len(name) < 4 or rng.random() < 0.5:
+        return name
+    index = rng.randrange(1, len(name) - 1)
+    return name[:index] + name[index + 1:]
+
+
+def build_reports(players, count, rng, hot_ratio=0.0):
+    """
+    Mischung aus Spieler-, Squad- und Autorespond-Reports. Liefert (kind, author, team, text).
+    hot_ratio: Anteil der Spieler-Reports, die alle denselben Spieler melden (Massenmeldung).
+    """
+    reports = []
+    hot_target = rng.choice(players)
+    for _ in range(count):
+        author = rng.choice(players)
+        team = "Allies" if author["team"] == "allies" else "Axis"
+        roll = rng.random()
+        if roll < 0.7:
+            target = hot_target if rng.random() < hot_ratio else rng.choice(players)
+            text = f"{typo(target['name'], rng)} {rng.choice(['teamkill', 'cheater', 'camping hq', 'kein mic'])}"
+            reports.append(("player", author["name"], team, text))
+        elif roll < 0.95:
+            reports.append(("unit", author["name"], team, f"{rng.choice(UNITS[:6])} sl no comms"))
+        else:
+            reports.append(("autorespond", author["name"], team, "!admin"))
+    return reports
+
+
+def build_embed(author, team, text):
+    embed = discord.Embed(description=text)
+    embed.set_author(name=f"{author} [{team}]")
+    embed.set_footer(text=SERVER_NAME)
+    return embed
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+async def fetch_stats(base_url, reset=False):
+    async with aiohttp.ClientSession() as session:
+        if reset:
+            async with session.post(f"{base_url}/stats/reset") as response:
+                return await response.json()
+        async with session.get(f"{base_url}/stats") as response:
+            return await response.json()
+
+
+async def fetch_roster(base_url):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{base_url}/api/get_detailed_players") as response:
+            data = await response.json()
+    return list(data["result"]["players"].values())
+
+
+async def run(args):
+    runner = None
+    base_url = args.url
+    if base_url is None:
+        mock = MockCRCON(args.players, args.latency_ms, args.jitter_ms, args.error_rate, args.seed, args.etag,
+                         args.max_age)
+        runner = await start_server(mock, port=args.port)
+        base_url = f"http://127.0.0.1:{args.port}"
+
+    # bot.py liest seine Konfiguration beim Import
+    os.environ.update({
+        "DISCORD_BOT_TOKEN": "loadtest",
+        "RCON_API_TOKEN": "loadtest",
+        "ALLOWED_CHANNEL_ID": str(CHANNEL_ID),
+        "MAX_CHANNELS": str(args.channels),
+        "MAX_SERVERS": "1",
+        "SERVER_NAME_1": SERVER_NAME,
+        "API_BASE_URL_1": base_url,
+        # Button-Zustand der Testreports nicht ins Repo schreiben
+        "REPORT_DB_FILE": os.path.join(tempfile.mkdtemp(), "reports.db"),
+    })
+    languages = ["en", "de"]
+    _channels[:] = [FakeChannel(CHANNEL_ID + index) for index in range(args.channels)]
+    for index, channel in enumerate(_channels, start=1):
+        os.environ.update({
+            f"CHANNEL_ID_{index}": str(channel.id),
+            f"CHANNEL_LANG_{index}": languages[(index - 1) % len(languages)],
+            f"CHANNEL_SERVERS_{index}": SERVER_NAME,
+        })
+    import bot as bot_module
+
+    client = bot_module.MyBot(bot_module.intents)
+    client.start_report_queue()
+    client.outbox.start()
+    client.register_metrics()
+    if args.trace_file:
+        client.start_tracing(trace_file=args.trace_file)
+    rng = random.Random(args.seed)
+    roster = await fetch_roster(base_url)
+    reports = build_reports(roster, args.reports, rng, args.hot_ratio)
+    await fetch_stats(base_url, reset=True)
+
+    semaphore = asyncio.Semaphore(args.concurrency)
+    latencies = {}
+    timeouts = Counter()
+
+    async def fire(index, report):
+        kind, author, team, text = report
+        async with semaphore:
+            message = FakeMessage(build_embed(author, team, text), channel=_channels[index % len(_channels)])
+            started = time.perf_counter()
+            await client.on_message(message)
+            try:
+                await asyncio.wait_for(message.done.wait(), args.timeout)
+            except asyncio.TimeoutError:
+                # Auch von der Queue als Duplikat verworfene Reports bekommen keine Antwort
+                timeouts[kind] += 1
+                return
+            latencies.setdefault(kind, []).append(time.perf_counter() - started)
+
+    started = time.perf_counter()
+    # Konsolenausgaben des Bots nach stderr, damit stdout reines JSON bleibt
+    with contextlib.redirect_stdout(sys.stderr):
+        await asyncio.gather(*(fire(index, report) for index, report in enumerate(reports)))
+    elapsed = time.perf_counter() - started
+    stats = await fetch_stats(base_url)
+    if args.metrics_file:
+        with open(args.metrics_file, 'w', encoding='utf8') as file:
+            file.write(bot_module.metrics.registry.render())
+
+    await client.report_queue.stop()
+    await client.outbox.stop()
+    for api_client in client.api_clients.values():
+        await api_client.close_session()
+    client.report_store.close()
+    await bot_module.tracing.tracer.close()
+    if runner:
+        await runner.cleanup()
+
+    all_latencies = sorted(itertools.chain.from_iterable(latencies.values()))
+    result = {
+        "reports": len(reports),
+        "completed": len(all_latencies),
+        "timeouts": dict(timeouts),
+        "elapsed_s": elapsed,
+        "throughput_per_s": len(all_latencies) / elapsed if elapsed else 0,
+        "latency_ms": {
+            kind: {
+                "count": len(values),
+                "p50": percentile(sorted(values), 0.50) * 1000,
+                "p95": percentile(sorted(values), 0.95) * 1000,
+                "p99": percentile(sorted(values), 0.99) * 1000,
+            }
+            for kind, values in latencies.items()
+        },
+        "crcon_calls": stats["calls"],
+        "crcon_errors": stats["errors"],
+        "crcon_not_modified": stats.get("not_modified", {}),
+        "crcon_calls_per_report": stats["total_calls"] / len(reports) if reports else 0,
+        "report_views": client.view_registry.stats(),
+        "replies_per_channel": {
+            channel.id: sum(1 for message in channel.messages.values() if message.reference_message is not None)
+            for channel in _channels
+        },
+    }
+    if all_latencies:
+        result["latency_ms"]["all"] = {
+            "count": len(all_latencies),
+            "p50": percentile(all_latencies, 0.50) * 1000,
+            "p95": percentile(all_latencies, 0.95) * 1000,
+            "p99": percentile(all_latencies, 0.99) * 1000,
+        }
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load driver for MyBot.on_message against a CRCON stand-in")
+    parser.add_argument('--url', default=None, help="use an already running mock instead of starting one")
+    parser.add_argument('--port', type=int, default=8010)
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=20)
+    parser.add_argument('--jitter-ms', type=float, default=10)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--reports', type=int, default=100)
+    parser.add_argument('--concurrency', type=int, default=10)
+    parser.add_argument('--timeout', type=float, default=30)
+    parser.add_argument('--hot-ratio', type=float, default=0.0, help="share of player reports hitting one player")
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--channels', type=int, default=1, help="spread the reports over this many report channels")
+    parser.add_argument('--etag', action='store_true', help="mock sends ETags for profiles and message templates")
+    parser.add_argument('--max-age', type=int, default=0, help="Cache-Control max-age of the mock with --etag")
+    parser.add_argument('--metrics-file', default=None, help="write the final /metrics output to this file")
+    parser.add_argument('--trace-file', default=None, help="record per-report spans as JSON lines")
+    args = parser.parse_args()
+
+    print(json.dumps(asyncio.run(run(args)), indent=2))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,166 @@
+"""
+Offline-Benchmark für den Spielerabgleich aus find_and_respond_player.
+
+Spielt aufgezeichnete Reporttexte gegen aufgezeichnete get_players-Antworten ab
+(Fixtures, kein Netzwerk, kein Discord) und misst Latenz, Durchsatz und Trefferquote:
+
+    python benchmarks/match_benchmark.py
+    python benchmarks/match_benchmark.py --compare legacy
+    python benchmarks/match_benchmark.py --roster-size 100 --iterations 50
+
+Ein Matcher ist eine Funktion matcher(potential_names, players, **kwargs) -> [(score, player), ...],
+sortiert vom besten zum schlechtesten Treffer; players sind records.Player wie aus APIClient.get_players.
+"""
+import argparse
+import importlib
+import json
+import os
+import sys
+import time
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES_DIR = os.path.join(REPO_ROOT, 'benchmarks', 'fixtures')
+
+# exclude_words.json wird relativ zum Arbeitsverzeichnis geladen
+os.chdir(REPO_ROOT)
+sys.path.insert(0, REPO_ROOT)
+
+from Levenshtein import distance as levenshtein_distance  # noqa: E402
+from Levenshtein import jaro_winkler  # noqa: E402
+from helpers import remove_markdown, remove_bracketed_content, find_player_names, load_excluded_words, \
+    remove_clantags  # noqa: E402
+from records import Player  # noqa: E402
+
+
+def legacy_best_match(potential_names, players, max_combined_score_threshold=0.8, jaro_winkler_threshold=0.85,
+                      **kwargs):
+    """Ursprünglicher Abgleich (nur ein best_match), als Vergleichsbasis."""
+    best_player_data = None
+    best_score = float('inf')
+    for player in players:
+        cleaned_player_name = remove_clantags(player.name.lower())
+        player_name_words = cleaned_player_name.split()
+        for reported_word in potential_names:
+            for player_word in player_name_words:
+                levenshtein_score = levenshtein_distance(reported_word.lower(), player_word)
+                jaro_score = jaro_winkler(reported_word.lower(), player_word)
+                if levenshtein_score <= max_combined_score_threshold or jaro_score >= jaro_winkler_threshold:
+                    combined_score = levenshtein_score + (1 - jaro_score)
+                    if combined_score < best_score and combined_score <= max_combined_score_threshold:
+                        best_score = combined_score
+                        best_player_data = player
+    if best_player_data is None:
+        return []
+    return [(best_score, best_player_data)]
+
+
+def load_matcher(spec):
+    """'modul:funktion' auflösen, z.B. 'matcher:rank_player_matches'. 'legacy' = alter Abgleich."""
+    if spec == 'legacy':
+        return legacy_best_match
+    module_name, function_name = spec.split(':', 1)
+    return getattr(importlib.import_module(module_name), function_name)
+
+
+def load_fixtures(reports_file, roster_size=None):
+    with open(reports_file, 'r', encoding='utf8') as file:
+        reports = json.load(file)
+    rosters = {}
+    for report in reports:
+        if report['server'] not in rosters:
+            with open(os.path.join(FIXTURES_DIR, report['server']), 'r', encoding='utf8') as file:
+                # Wie APIClient.get_players: Records einmal beim Laden
+                players = [Player.from_api(player) for player in json.load(file)['result']]
+            if roster_size and len(players) < roster_size:
+                # Mit synthetischen Namen auffüllen, um volle Server zu simulieren
+                players = players + [
+                    Player(f"filler-{index}", f"Filler{index:03d}") for index in range(roster_size - len(players))
+                ]
+            rosters[report['server']] = players
+    return reports, rosters
+
+
+def prepare(description, excluded_words):
+    """Gleiche Vorverarbeitung wie in on_message / find_and_respond_player."""
+    reported_identifier = " ".join(remove_markdown(description).split())
+    return find_player_names(remove_bracketed_content(reported_identifier), excluded_words)
+
+
+def percentile(sorted_values, fraction):
+    index = min(len(sorted_values) - 1, int(round(fraction * (len(sorted_values) - 1))))
+    return sorted_values[index]
+
+
+def run(matcher, reports, rosters, excluded_words, iterations, matcher_kwargs):
+    latencies = []
+    correct = 0
+    top_k_hits = 0
+    # Aufwärmen, damit die Reihenfolge beim Vergleich keine Rolle spielt
+    for report in reports:
+        matcher(prepare(report['description'], excluded_words), rosters[report['server']], **matcher_kwargs)
+    for _ in range(iterations):
+        for report in reports:
+            started = time.perf_counter()
+            potential_names = prepare(report['description'], excluded_words)
+            matches = matcher(potential_names, rosters[report['server']], **matcher_kwargs)
+            latencies.append(time.perf_counter() - started)
+
+            expected = report['expected_player_id']
+            found = matches[0][1].player_id if matches else None
+            if found == expected:
+                correct += 1
+            if expected is None and not matches or any(player.player_id == expected for _, player in matches):
+                top_k_hits += 1
+
+    latencies.sort()
+    total = len(latencies)
+    return {
+        "reports": total,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p95_ms": percentile(latencies, 0.95) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+        "throughput_per_s": total / sum(latencies),
+        "accuracy": correct / total,
+        "top_k_accuracy": top_k_hits / total,
+    }
+
+
+def print_result(name, result):
+    print(f"{name}")
+    print(f"  reports:        {result['reports']}")
+    print(f"  latency p50/95/99: {result['p50_ms']:.3f} / {result['p95_ms']:.3f} / {result['p99_ms']:.3f} ms")
+    print(f"  throughput:     {result['throughput_per_s']:.0f} reports/s")
+    print(f"  accuracy:       {result['accuracy']:.1%} (top-k: {result['top_k_accuracy']:.1%})")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark for report player matching")
+    parser.add_argument('--matcher', default='matcher:rank_player_matches')
+    parser.add_argument('--compare', default=None, help="second matcher to run side by side")
+    parser.add_argument('--reports', default=os.path.join(FIXTURES_DIR, 'reports.json'))
+    parser.add_argument('--roster-size', type=int, default=None)
+    parser.add_argument('--iterations', type=int, default=20)
+    parser.add_argument('--threshold', type=float, default=float(os.getenv('MAX_COMBINED_SCORE_THRESHOLD', 1.1)))
+    parser.add_argument('--json', action='store_true', help="print results as JSON")
+    args = parser.parse_args()
+
+    excluded_words = load_excluded_words('exclude_words.json')
+    reports, rosters = load_fixtures(args.reports, args.roster_size)
+    matcher_kwargs = {"max_combined_score_threshold": args.threshold, "jaro_winkler_threshold": 0.85}
+
+    results = {}
+    for spec in filter(None, [args.matcher, args.compare]):
+        results[spec] = run(load_matcher(spec), reports, rosters, excluded_words, args.iterations, matcher_kwargs)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return
+    for spec, result in results.items():
+        print_result(spec, result)
+    if args.compare:
+        base, other = results[args.matcher], results[args.compare]
+        print(f"p50 ratio {args.matcher} / {args.compare}: {base['p50_ms'] / other['p50_ms']:.2f}x")
+
+
+if __name__ == '__main__':
+    main()
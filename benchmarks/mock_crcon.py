@@ -0,0 +1,221 @@
+"""
+Lokaler CRCON-Ersatz für Lasttests.
+
+Implementiert die Endpunkte, die APIClient benutzt, mit synthetischem Roster,
+konfigurierbarer Latenz und Fehlerinjektion:
+
+    python benchmarks/mock_crcon.py --players 100 --latency-ms 40 --jitter-ms 20 --error-rate 0.02
+
+Mit --etag (und optional --max-age) liefern Profile und Nachrichtenvorlagen HTTP-Cache-Header
+und beantworten passende If-None-Match-Anfragen mit 304.
+
+Aufrufzähler pro Endpunkt: GET /stats, zurücksetzen mit POST /stats/reset.
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import os
+import random
+import time
+from collections import Counter
+
+from aiohttp import web
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'fixtures')
+
+UNITS = ["able", "baker", "charlie", "dog", "easy", "fox", "george", "how", "item", "jig", "king", "love"]
+ROLES = ["rifleman", "assault", "automaticrifleman", "medic", "support", "heavymachinegunner", "antitank", "engineer"]
+
+
+def build_roster(size, seed=1):
+    """Deterministisches Roster: Namen aus den Fixtures, danach synthetische Spieler."""
+    rng = random.Random(seed)
+    with open(os.path.join(FIXTURES_DIR, 'roster_server1.json'), 'r', encoding='utf8') as file:
+        names = [player['name'] for player in json.load(file)['result']]
+    players = []
+    for index in range(size):
+        name = names[index] if index < len(names) else f"Soldat{index:03d}"
+        team = "allies" if index % 2 == 0 else "axis"
+        slot = index // 2 - 1  # Position im Team, Slot -1 ist der Kommandant
+        if slot < 0:
+            unit_name, role = "command", "armycommander"
+        elif slot // 6 < len(UNITS):
+            unit_name = UNITS[slot // 6]
+            role = "officer" if slot % 6 == 0 else rng.choice(ROLES)
+        else:
+            unit_name, role = None, rng.choice(ROLES)
+        players.append({
+            "name": name,
+            "player_id": f"7656119{8000000000 + index * 7919:010d}",
+            "team": team,
+            "unit_name": unit_name,
+            "role": role,
+            "level": rng.randint(1, 400),
+            "kills": rng.randint(0, 60),
+            "deaths": rng.randint(0, 60),
+        })
+    return players
+
+
+class MockCRCON:
+    def __init__(self, roster_size=100, latency_ms=0, jitter_ms=0, error_rate=0.0, seed=1, etag=False, max_age=0):
+        self.players = build_roster(roster_size, seed)
+        self.by_id = {player["player_id"]: player for player in self.players}
+        self.latency_ms = latency_ms
+        self.jitter_ms = jitter_ms
+        self.error_rate = error_rate
+        self.rng = random.Random(seed)
+        self.calls = Counter()
+        self.errors = Counter()
+        self.not_modified = Counter()
+        self.etag = etag
+        self.max_age = max_age
+        self.started = time.monotonic()
+
+    @web.middleware
+    async def middleware(self, request, handler):
+        endpoint = request.path
+        if not endpoint.startswith('/api/'):
+            return await handler(request)
+        self.calls[endpoint] += 1
+        delay = self.latency_ms + self.rng.uniform(0, self.jitter_ms)
+        if delay:
+            await asyncio.sleep(delay / 1000)
+        if self.error_rate and self.rng.random() < self.error_rate:
+            self.errors[endpoint] += 1
+            return web.json_response({"result": None, "failed": True, "error": "injected"}, status=500)
+        return await handler(request)
+
+    def ok(self, result):
+        return web.json_response({"result": result, "failed": False, "error": None})
+
+    def cacheable(self, request, result):
+        """Wie ok(), mit ETag/max-age (falls eingeschaltet); passt If-None-Match, kommt 304 ohne Body."""
+        if not self.etag:
+            return self.ok(result)
+        body = json.dumps({"result": result, "failed": False, "error": None}).encode()
+        headers = {"ETag": f'"{hashlib.sha1(body).hexdigest()[:16]}"'}
+        if self.max_age:
+            headers["Cache-Control"] = f"max-age={self.max_age}"
+        if request.headers.get("If-None-Match") == headers["ETag"]:
+            self.not_modified[request.path] += 1
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=body, content_type="application/json", headers=headers)
+
+    async def get_players(self, request):
+        return self.ok([{"name": p["name"], "player_id": p["player_id"], "level": p["level"]} for p in self.players])
+
+    async def get_detailed_players(self, request):
+        return self.ok({"players": {p["player_id"]: p for p in self.players}, "fail_count": 0})
+
+    async def get_live_game_stats(self, request):
+        stats = [{
+            "player_id": p["player_id"],
+            "player": p["name"],
+            "kills": p["kills"],
+            "kills_streak": p["kills"] // 5,
+            "kill_death_ratio": round(p["kills"] / max(p["deaths"], 1), 2),
+            "kills_per_minute": round(p["kills"] / 60, 2),
+            "deaths": p["deaths"],
+            "teamkills": p["kills"] % 4,
+            "teamkills_streak": p["kills"] % 2,
+            "steaminfo": {"profile": {"realname": None}},
+        } for p in self.players]
+        return self.ok({"snapshot_timestamp": time.time(), "stats": stats})
+
+    async def get_player_profile(self, request):
+        player = self.by_id.get(request.query.get("player_id"))
+        if player is None:
+            return web.json_response({"result": None, "failed": True, "error": "not found"}, status=404)
+        return self.cacheable(request, {
+            "player_id": player["player_id"],
+            "names": [{"name": player["name"]}],
+            "total_playtime_seconds": player["level"] * 3600,
+            "sessions_count": player["level"],
+        })
+
+    async def get_structured_logs(self, request):
+        now_ms = int(time.time() * 1000)
+        name = request.query.get("filter_player")
+        logs = [{
+            "timestamp_ms": now_ms - index * 60000,
+            "action": "KILL",
+            "player_name_1": name or self.players[0]["name"],
+            "message": f"log line {index}",
+        } for index in range(5)]
+        return self.ok({"logs": logs, "actions": ["KILL"], "players": []})
+
+    async def get_all_message_templates(self, request):
+        return self.cacheable(request, {
+            "MESSAGE": [{"title": "Warnung", "content": "Bitte halte dich an die Regeln."}],
+            "REASON": [{"title": "Teamkill", "content": "Teamkilling"}, {"title": "Cheat", "content": "Cheating"}],
+            "WELCOME": [],
+            "BROADCAST": [],
+        })
+
+    async def post_action(self, request):
+        await request.read()
+        return self.ok(True)
+
+    async def stats(self, request):
+        return web.json_response({
+            "uptime_s": time.monotonic() - self.started,
+            "calls": dict(self.calls),
+            "errors": dict(self.errors),
+            "not_modified": dict(self.not_modified),
+            "total_calls": sum(self.calls.values()),
+        })
+
+    async def reset(self, request):
+        self.calls.clear()
+        self.errors.clear()
+        self.not_modified.clear()
+        return web.json_response({"ok": True})
+
+    def make_app(self):
+        app = web.Application(middlewares=[self.middleware])
+        app.add_routes([
+            web.get('/api/get_players', self.get_players),
+            web.get('/api/get_detailed_players', self.get_detailed_players),
+            web.get('/api/get_live_game_stats', self.get_live_game_stats),
+            web.get('/api/get_player_profile', self.get_player_profile),
+            web.get('/api/get_structured_logs', self.get_structured_logs),
+            web.get('/api/get_all_message_templates', self.get_all_message_templates),
+            web.get('/stats', self.stats),
+            web.post('/stats/reset', self.reset),
+        ])
+        for endpoint in ('kick', 'punish', 'temp_ban', 'perma_ban', 'message_player', 'add_blacklist_record',
+                         'post_player_comment'):
+            app.router.add_post(f'/api/{endpoint}', self.post_action)
+        return app
+
+
+async def start_server(mock, host='127.0.0.1', port=8010):
+    """Server im laufenden Event-Loop starten (für den Lasttreiber). Gibt den AppRunner zurück."""
+    runner = web.AppRunner(mock.make_app())
+    await runner.setup()
+    await web.TCPSite(runner, host, port).start()
+    return runner
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local CRCON stand-in for load testing")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8010)
+    parser.add_argument('--players', type=int, default=100)
+    parser.add_argument('--latency-ms', type=float, default=0)
+    parser.add_argument('--jitter-ms', type=float, default=0)
+    parser.add_argument('--error-rate', type=float, default=0.0)
+    parser.add_argument('--seed', type=int, default=1)
+    parser.add_argument('--etag', action='store_true', help="send ETags for profiles and message templates")
+    parser.add_argument('--max-age', type=int, default=0, help="Cache-Control max-age with --etag")
+    args = parser.parse_args()
+
+    mock = MockCRCON(args.players, args.latency_ms, args.jitter_ms, args.error_rate, args.seed, args.etag,
+                     args.max_age)
+    web.run_app(mock.make_app(), host=args.host, port=args.port)
+
+
+if __name__ == '__main__':
+    main()
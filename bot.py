@@ -1,31 +1,50 @@
 # Importing necessary libraries for the bot and API interaction
+import asyncio
+import functools
+import io
 import os
 import re
+import signal
+import time
+import weakref
 import discord
+from discord import app_commands
 from discord.ext import commands
 from discord.ui import View
 
 from dotenv import load_dotenv
-from api_client import APIClient  # Annahme: Du hast dort die Logik, die den Token automatisch nutzt
-from Levenshtein import distance as levenshtein_distance
-from Levenshtein import jaro_winkler
+from api_client import APIClient, JSON_DECODER  # Annahme: Du hast dort die Logik, die den Token automatisch nutzt
 from helpers import (
     remove_markdown,
     remove_bracketed_content,
     find_player_names,
     get_translation,
-    get_author_name,
-    set_author_name,
     load_excluded_words,
-    remove_clantags,
     add_modlog,
     add_emojis_to_messages,
     only_remove_buttons,
-    get_playerid_from_name,
-    load_autorespond_tigger
+    apply_modlog,
+    translations
 )
 import logging
-from messages import unitreportembed, playerreportembed, player_not_found_embed, Reportview
+from messages import unitreportembed, unitleadersembed, playerreportembed, player_not_found_embed, Reportview, \
+    set_additional_reporters_field, is_report_custom_id
+from matcher import rank_player_matches, is_ambiguous
+from report_queue import ReportQueue, PRIORITY_HIGH, PRIORITY_NORMAL
+from report_coalescer import ReportCoalescer
+from action_registry import ActionRegistry
+from outbox import Outbox
+from roster_cache import RosterCache
+from report_channels import load_report_channels
+from response_cache import ResponseCache
+from records import PlayerProfile
+from report_store import ReportStore
+from view_registry import ViewRegistry
+from modals import Finish_Report_Button
+from report_classifier import ReportClassifier, REPORT_AUTORESPOND, REPORT_UNIT, REPORT_PLAYER
+import metrics
+import tracing
+from profiler import LoopProfiler, LoopWatchdog, format_summary, format_report
 
 # Konfiguration des Loggings
 logging.basicConfig(
@@ -40,9 +59,38 @@ load_dotenv()
 # Discord Bot configuration
 TOKEN = os.getenv('DISCORD_BOT_TOKEN')
 API_TOKEN = os.getenv('RCON_API_TOKEN')
-ALLOWED_CHANNEL_ID = int(os.getenv('ALLOWED_CHANNEL_ID'))  # Assuming channel ID is an integer
+ALLOWED_CHANNEL_ID = int(os.getenv('ALLOWED_CHANNEL_ID') or 0)  # Einzelner Kanal, wenn MAX_CHANNELS fehlt
 MAX_SERVERS = int(os.getenv('MAX_SERVERS'))
+MAX_CHANNELS = int(os.getenv('MAX_CHANNELS', 0))  # CHANNEL_ID_n/CHANNEL_LANG_n/CHANNEL_SERVERS_n
 user_lang = os.getenv('USER_LANG', 'en')  # Standardwert auf 'en' gesetzt
+MATCH_TOP_K = int(os.getenv('MATCH_TOP_K', 3))
+MATCH_AMBIGUITY_MARGIN = float(os.getenv('MATCH_AMBIGUITY_MARGIN', 0.15))
+REPORT_QUEUE_SIZE = int(os.getenv('REPORT_QUEUE_SIZE', 100))
+REPORT_WORKERS = int(os.getenv('REPORT_WORKERS', 4))
+REPORT_SERVER_CONCURRENCY = int(os.getenv('REPORT_SERVER_CONCURRENCY', 2))
+CRCON_MAX_CONNECTIONS = int(os.getenv('CRCON_MAX_CONNECTIONS', 10))
+MESSAGE_RATE_PER_SECOND = float(os.getenv('MESSAGE_RATE_PER_SECOND', 10))  # pro Server, 0 = ungedrosselt
+CRCON_JSON_OFFLOAD_BYTES = int(os.getenv('CRCON_JSON_OFFLOAD_BYTES', 262144))  # 0 = nie im Thread dekodieren
+CRCON_HTTP_CACHE_BYTES = int(os.getenv('CRCON_HTTP_CACHE_BYTES', 4194304))  # alle Server zusammen, 0 = aus
+REPORT_COALESCE_WINDOW = int(os.getenv('REPORT_COALESCE_WINDOW', 60))  # Sekunden, 0 = aus
+ACTION_DUPLICATE_WINDOW = int(os.getenv('ACTION_DUPLICATE_WINDOW', 10))  # Sekunden, 0 = nur gleichzeitige
+ROSTER_CACHE_TTL = int(os.getenv('ROSTER_CACHE_TTL', 30))  # Sekunden
+REPORTER_MATCH_THRESHOLD = float(os.getenv('REPORTER_MATCH_THRESHOLD', 0.9))  # unscharfe Reporter-Suche
+REPORT_DB_FILE = os.getenv('REPORT_DB_FILE', 'data/reports.db')
+REPORT_STATE_MAX_AGE = int(os.getenv('REPORT_STATE_MAX_AGE', 7))  # Tage
+OUTBOX_MAX_ATTEMPTS = int(os.getenv('OUTBOX_MAX_ATTEMPTS', 8))
+OUTBOX_RETRY_SECONDS = int(os.getenv('OUTBOX_RETRY_SECONDS', 5))  # erste Wiederholung, danach doppelt so lang
+REPORT_MAX_LIVE_VIEWS = int(os.getenv('REPORT_MAX_LIVE_VIEWS', 500))
+LANGUAGES_RELOAD_INTERVAL = int(os.getenv('LANGUAGES_RELOAD_INTERVAL', 0))  # Sekunden, 0 = aus
+METRICS_PORT = int(os.getenv('METRICS_PORT', 0))  # 0 = kein /metrics-Endpunkt
+METRICS_HOST = os.getenv('METRICS_HOST', '127.0.0.1')
+TRACE_FILE = os.getenv('TRACE_FILE', '')  # Spans als JSON Lines, leer = aus
+TRACE_OTLP_ENDPOINT = os.getenv('TRACE_OTLP_ENDPOINT', '')  # z.B. http://localhost:4318, leer = aus
+PROFILE_CHANNEL_ID = int(os.getenv('PROFILE_CHANNEL_ID', 0))  # Kanal für /profile-Ergebnisse, 0 = aus
+PROFILE_MAX_SECONDS = int(os.getenv('PROFILE_MAX_SECONDS', 120))
+# Dauer bei SIGUSR1 und Standard von /profile, höchstens PROFILE_MAX_SECONDS
+PROFILE_SIGNAL_SECONDS = min(int(os.getenv('PROFILE_SIGNAL_SECONDS', 30)), PROFILE_MAX_SECONDS)
+LOOP_BLOCK_THRESHOLD_MS = int(os.getenv('LOOP_BLOCK_THRESHOLD_MS', 0))  # 0 = keine Blockade-Erkennung
 
 # Setting up Discord client
 intents = discord.Intents.default()
@@ -53,14 +101,263 @@ intents.guild_messages = True
 
 class MyBot(commands.Bot):
     def __init__(self, intents):
-        super().__init__(command_prefix="!", intents=intents)
-        # Wir übergeben keinen Username/Password mehr, sondern nur unseren Token
-        # In deiner APIClient-Klasse sollte der Bearer-Token im Header oder entsprechend verwendet werden.
-        self.api_client = APIClient(None, API_TOKEN)  # Initialisieren ohne API_BASE_URL, aber mit Token
-        self.api_base_url = None
+        # Anzahl, Status und Dauer aller Discord-API-Aufrufe für /metrics
+        super().__init__(command_prefix="!", intents=intents,
+                         http_trace=tracing.http_spans(metrics.discord_trace_config(), "discord"))
+        # Pro Server ein eigener APIClient (mit eigener Session), damit parallele Reports sich nicht
+        # gegenseitig die base_url überschreiben.
+        self.api_clients = {}
+        self.roster_caches = {}
+        # Alle Report-Kanäle (auch aus mehreren Guilds) teilen sich Sessions, Caches und die Queue
+        self.report_channels = load_report_channels(MAX_CHANNELS, ALLOWED_CHANNEL_ID, user_lang)
+        # Ein HTTP-Cache mit einem Speicherbudget für alle Server (Schlüssel ist die vollständige URL)
+        self.response_cache = ResponseCache(CRCON_HTTP_CACHE_BYTES) if CRCON_HTTP_CACHE_BYTES > 0 else None
         self.excluded_words = load_excluded_words('exclude_words.json')
-        self.autorespond_trigger = load_autorespond_tigger('autorespond_trigger.json')
+        # Trigger-Wörter, Prioritäts-Wörter und Autorespond-Texte werden einmal beim Start geladen
+        self.classifier = ReportClassifier.from_files('trigger_words.json', 'autorespond_trigger.json')
         self.user_lang = os.getenv('USER_LANG', 'en')  # oder eine andere Standard-Sprache
+        self.report_queue = None
+        self.report_coalescer = ReportCoalescer(REPORT_COALESCE_WINDOW)
+        self.action_registry = ActionRegistry(ACTION_DUPLICATE_WINDOW)
+        self.report_store = ReportStore(REPORT_DB_FILE, REPORT_STATE_MAX_AGE * 24 * 3600)
+        # Spielerkommentare, Reporter-Nachrichten und Modlog-Einträge laufen über die Outbox
+        self.outbox = Outbox(self.report_store, OUTBOX_MAX_ATTEMPTS, OUTBOX_RETRY_SECONDS)
+        self.outbox.register("comment", self.outbox_comment)
+        self.outbox.register("message", self.outbox_message)
+        self.outbox.register("modlog", self.outbox_modlog)
+        # Eine Sperre pro Report-Nachricht, solange sie jemand hält (Modlog, angehängte Reporter)
+        self.message_locks = weakref.WeakValueDictionary()
+        # Nur die zuletzt benutzten Report-Views bleiben im Speicher, ältere werden bei Bedarf neu aufgebaut
+        self.view_registry = ViewRegistry(REPORT_MAX_LIVE_VIEWS)
+        self.translations_watcher = None
+        self.profiler = LoopProfiler()
+        self.profile_task = None
+        self.loop_watchdog = None
+
+    async def setup_hook(self):
+        logging.info(f"CRCON JSON decoder: {JSON_DECODER}")
+        if not self.report_channels:
+            logging.error("No report channel configured (ALLOWED_CHANNEL_ID or MAX_CHANNELS/CHANNEL_ID_n)")
+        for channel in self.report_channels.values():
+            logging.info(f"Report channel {channel.channel_id}: language {channel.lang}, "
+                         f"servers {', '.join(sorted(channel.servers)) or 'all'}")
+        self.start_report_queue()
+        await self.restore_report_views()
+        # Startet auch mit den vor einem Neustart noch offenen Einträgen
+        self.outbox.start()
+        # Geänderte (gemountete) languages.json ohne Neustart übernehmen
+        if LANGUAGES_RELOAD_INTERVAL > 0:
+            self.translations_watcher = asyncio.create_task(translations.watch(LANGUAGES_RELOAD_INTERVAL))
+        self.register_metrics()
+        self.start_tracing()
+        if METRICS_PORT > 0:
+            await metrics.registry.start(METRICS_HOST, METRICS_PORT)
+        if LOOP_BLOCK_THRESHOLD_MS > 0:
+            self.loop_watchdog = LoopWatchdog(LOOP_BLOCK_THRESHOLD_MS / 1000)
+            self.loop_watchdog.start()
+        self.install_profile_signal()
+        if PROFILE_CHANNEL_ID:
+            await self.register_profile_command()
+
+    async def register_profile_command(self):
+        """/profile nur in der Guild des Profil-Kanals anlegen (dort sofort verfügbar) und nur für Admins."""
+        @app_commands.command(name="profile", description="Profile the bot for a number of seconds")
+        @app_commands.describe(seconds="Duration of the profile")
+        @app_commands.default_permissions(administrator=True)
+        @app_commands.guild_only()
+        async def profile(interaction: discord.Interaction,
+                          seconds: app_commands.Range[int, 1, PROFILE_MAX_SECONDS] = PROFILE_SIGNAL_SECONDS):
+            await self.profile_command(interaction, seconds)
+
+        channel = await self.fetch_channel(PROFILE_CHANNEL_ID)
+        self.tree.add_command(profile, guild=channel.guild)
+        await self.tree.sync(guild=channel.guild)
+
+    async def profile_command(self, interaction, seconds):
+        texts = translations.bundle(self.user_lang)
+        if not interaction.user.guild_permissions.administrator:
+            await interaction.response.send_message(texts["no_permission"], ephemeral=True)
+            return
+        if self.profiler.running:
+            await interaction.response.send_message(texts["profile_already_running"], ephemeral=True)
+            return
+        await interaction.response.send_message(texts["profile_started"].format(seconds, PROFILE_CHANNEL_ID),
+                                                ephemeral=True)
+        await self.post_profile(seconds, str(interaction.user))
+
+    def install_profile_signal(self):
+        """kill -USR1 <pid> startet ebenfalls ein Profil (ohne Discord-Befehl, z.B. wenn der Bot hängt)."""
+        try:
+            asyncio.get_running_loop().add_signal_handler(signal.SIGUSR1, self.profile_from_signal)
+        except (AttributeError, NotImplementedError):
+            pass  # kein SIGUSR1 unter Windows
+
+    def profile_from_signal(self):
+        if self.profiler.running:
+            logging.warning("SIGUSR1 ignored, a profile is already running")
+            return
+        self.profile_task = asyncio.ensure_future(self.post_profile(PROFILE_SIGNAL_SECONDS, "SIGUSR1"))
+
+    async def post_profile(self, seconds, requested_by):
+        """Profil aufnehmen und als Datei in den Profil-Kanal posten (ohne Kanal: nach data/ schreiben)."""
+        logging.info(f"Profiling for {seconds}s, requested by {requested_by}")
+        try:
+            stats = await self.profiler.profile(seconds)
+        except RuntimeError as e:
+            logging.warning(f"Profile not started: {e}")
+            return
+        summary = format_summary(stats, seconds)
+        report = format_report(stats)
+        filename = f"profile-{time.strftime('%Y%m%d-%H%M%S')}.txt"
+        if not PROFILE_CHANNEL_ID:
+            path = os.path.join(os.path.dirname(REPORT_DB_FILE) or '.', filename)
+            with open(path, 'w', encoding='utf8') as file:
+                file.write(report)
+            logging.info(f"{summary}\nFull profile written to {path}")
+            return
+        try:
+            channel = self.get_channel(PROFILE_CHANNEL_ID) or await self.fetch_channel(PROFILE_CHANNEL_ID)
+            requested = translations.bundle(self.user_lang)["profile_requested_by"].format(requested_by)
+            await channel.send(content=f"{summary}\n{requested}",
+                               file=discord.File(io.BytesIO(report.encode('utf8')), filename=filename))
+        except discord.HTTPException as e:
+            logging.error(f"Posting the profile failed: {e}")
+
+    def start_tracing(self, trace_file=TRACE_FILE, otlp_endpoint=TRACE_OTLP_ENDPOINT):
+        """Spans pro Report exportieren, wenn eine Datei oder ein OTLP-Collector konfiguriert ist."""
+        if otlp_endpoint:
+            tracing.tracer.configure(tracing.OtlpHttpExporter(otlp_endpoint))
+        elif trace_file:
+            tracing.tracer.configure(tracing.JsonLinesExporter(trace_file))
+        else:
+            return
+        tracing.tracer.start()
+        logging.info(f"Tracing enabled: {otlp_endpoint or trace_file}")
+
+    def register_metrics(self):
+        """Werte, die erst beim Abruf von /metrics gelesen werden."""
+        registry = metrics.registry
+        registry.callback("report_queue_depth", "Reports waiting in the queue", lambda: self.report_queue.depth)
+        registry.callback("report_views_live", "Report views currently held in memory",
+                          lambda: self.view_registry.live)
+        registry.callback("report_views_evicted_total", "Report views dropped by the LRU limit",
+                          lambda: self.view_registry.evicted, kind="counter")
+        registry.callback("report_views_restored_total", "Report views rebuilt from the report store on a click",
+                          lambda: self.view_registry.restored, kind="counter")
+        if self.response_cache is not None:
+            registry.callback("crcon_http_cache_bytes", "Bytes of CRCON responses held in the HTTP cache",
+                              lambda: self.response_cache.size)
+            registry.callback("crcon_http_cache_evicted_total", "CRCON responses dropped by the HTTP cache budget",
+                              lambda: self.response_cache.evicted, kind="counter")
+
+    async def restore_report_views(self):
+        """Buttons der zuletzt offenen Reports nach einem Neustart wieder registrieren (ohne CRCON-Abfragen)."""
+        restored = 0
+        for message_id, state in (await self.report_store.load(limit=self.view_registry.max_views)).items():
+            view = self.build_stored_view(state)
+            if view is None:
+                continue
+            self.attach_stored_view(message_id, view)
+            restored += 1
+        logging.info(f"Restored {restored} persistent report views")
+
+    def build_stored_view(self, state):
+        """View eines gespeicherten Reports aufbauen. None, wenn der Server nicht mehr konfiguriert ist."""
+        api_client = self.get_api_client(state["server"])
+        if api_client is None:
+            return None
+        if state["kind"] == "finish":
+            return Finish_Report_Button(state["lang"], api_client)
+        return Reportview.restore(
+            api_client,
+            state,
+            on_alternative_selected=functools.partial(
+                self.select_alternative_player, api_client=api_client, author_name=state["author_name"],
+                user_lang=state["lang"]
+            )
+        )
+
+    def attach_stored_view(self, message_id, view):
+        self.view_registry.register(message_id, view)
+        self.add_view(view, message_id=message_id)
+
+    async def on_interaction(self, interaction):
+        """
+        Klick auf einen Report, dessen View aus dem Speicher verdrängt wurde:
+        View aus dem ReportStore neu aufbauen und den Klick an sie weiterreichen.
+        Nur Buttons von Report-Nachrichten des Bots; Folge-Dialoge (ephemeral) und Komponenten
+        anderer Bots gehen nicht an den ReportStore.
+        """
+        if interaction.type != discord.InteractionType.component or interaction.message is None:
+            return
+        if not is_report_custom_id(interaction.data.get('custom_id', "")):
+            return
+        if not self.is_report_message(interaction.message):
+            return
+        message_id = interaction.message.id
+        if message_id in self.view_registry:
+            self.view_registry.touch(message_id)
+            metrics.CACHE_REQUESTS.inc("report_views", "hit")
+            return
+        state = await self.report_store.get(message_id, open_only=True)
+        if state is None:
+            return  # kein (offener) Report, z.B. Auswahlmenüs der Folge-Dialoge
+        metrics.CACHE_REQUESTS.inc("report_views", "miss")
+        view = self.build_stored_view(state)
+        if view is None:
+            return
+        self.attach_stored_view(message_id, view)
+        self.view_registry.restored += 1
+        logging.info(f"Report view for message {message_id} restored on demand: {self.view_registry.stats()}")
+        self._connection._view_store.dispatch_view(
+            interaction.data['component_type'], interaction.data['custom_id'], interaction
+        )
+
+    def is_report_message(self, message):
+        return (message.author.id == self.user.id and not message.flags.ephemeral
+                and message.channel.id in self.report_channels)
+
+    async def outbox_comment(self, payload):
+        api_client = self.get_api_client(payload["server"])
+        if api_client is None:
+            logging.error(f"Comment dropped, server {payload['server']} is no longer configured")
+            return True
+        return await api_client.post_player_comment(payload["player_id"], payload["comment"]) is not None
+
+    async def outbox_message(self, payload):
+        api_client = self.get_api_client(payload["server"])
+        if api_client is None:
+            logging.error(f"Message dropped, server {payload['server']} is no longer configured")
+            return True
+        return await api_client.do_message_player(
+            payload["player_name"], payload["player_id"], payload["message"]
+        ) is not None
+
+    def message_lock(self, message_id):
+        """Holen und Bearbeiten des Report-Embeds nacheinander, damit keine Änderung eine andere überschreibt."""
+        lock = self.message_locks.get(message_id)
+        if lock is None:
+            lock = self.message_locks[message_id] = asyncio.Lock()
+        return lock
+
+    async def outbox_modlog(self, payload):
+        """Modlog in die aktuelle Fassung der Report-Nachricht schreiben (überschreibt keine neueren Einträge)."""
+        async with self.message_lock(payload["message_id"]):
+            try:
+                channel = self.get_channel(payload["channel_id"]) or await self.fetch_channel(payload["channel_id"])
+                message = await channel.fetch_message(payload["message_id"])
+            except discord.NotFound:
+                logging.warning(f"Modlog dropped, report message {payload['message_id']} no longer exists")
+                return True
+            await apply_modlog(message, payload["lang"], payload["text"], payload["delete_buttons"],
+                               payload["add_entry"])
+        return True
+
+    def start_report_queue(self):
+        # Die Queue muss im laufenden Event-Loop angelegt werden
+        if self.report_queue is None:
+            self.report_queue = ReportQueue(REPORT_QUEUE_SIZE, REPORT_WORKERS, REPORT_SERVER_CONCURRENCY)
+            self.report_queue.start()
 
     def extract_server_name(self, embed):
         if embed.footer:
@@ -75,169 +372,226 @@ class MyBot(commands.Bot):
                 return os.getenv(f"API_BASE_URL_{i}")
         return None  # Keine passende API-Basis-URL gefunden
 
+    def get_roster_cache(self, api_client):
+        """Roster-Cache (Squad-Index) des Servers, zu dem der APIClient gehört."""
+        if api_client.base_url not in self.roster_caches:
+            self.roster_caches[api_client.base_url] = RosterCache(api_client, ROSTER_CACHE_TTL,
+                                                                  REPORTER_MATCH_THRESHOLD)
+        return self.roster_caches[api_client.base_url]
+
+    async def resolve_reporter(self, api_client, author_name):
+        """player_id des Reporters über den Namensindex des Servers (einmal pro Report)."""
+        return await self.get_roster_cache(api_client).resolve_player_id(author_name)
+
+    def get_api_client(self, server_name):
+        """APIClient für den Server holen bzw. beim ersten Report anlegen. None, wenn der Server unbekannt ist."""
+        if server_name not in self.api_clients:
+            api_base_url = self.get_api_base_url_from_server_name(server_name)
+            if not api_base_url:
+                return None
+            self.api_clients[server_name] = APIClient(api_base_url, API_TOKEN, CRCON_MAX_CONNECTIONS, server_name,
+                                                       MESSAGE_RATE_PER_SECOND, CRCON_JSON_OFFLOAD_BYTES,
+                                                       self.response_cache)
+            print(get_translation(user_lang, "api_login_successful").format(api_base_url))
+        return self.api_clients[server_name]
+
     async def on_ready(self):
         print(f'{self.user} has logged in.')
 
     async def on_message(self, message):
         # Prüfen Sie zuerst, ob die Nachricht von Ihrem Bot oder von einem unerlaubten Kanal kommt.
-        if message.author == self.user or message.channel.id != ALLOWED_CHANNEL_ID:
+        report_channel = self.report_channels.get(message.channel.id)
+        if message.author == self.user or report_channel is None:
             return
+        user_lang = report_channel.lang
 
-        server_name = None
-        api_base_url = None
-
-        # Falls ein Embed vorhanden ist, extrahieren wir hier den Servernamen
-        if message.embeds:
-            embed = message.embeds[0]
-            if embed.footer:
-                server_name = self.extract_server_name(embed)
-                if server_name:
-                    api_base_url = self.get_api_base_url_from_server_name(server_name)
-                    if api_base_url:
-                        self.api_client.base_url = api_base_url
-                        print(get_translation(user_lang, "api_login_successful").format(api_base_url))
-                    else:
-                        print(get_translation(user_lang, "no_api_base_url_found"))
-                else:
-                    print(get_translation(user_lang, "no_server_name_found"))
-
-        if server_name is not None:
-            api_base_url = self.get_api_base_url_from_server_name(server_name)
+        if not message.embeds:
+            return
 
-        # Wenn eine gültige URL gefunden wurde, setzen wir sie im Client
-        if api_base_url:
-            self.api_client.base_url = api_base_url
+        # Servernamen aus dem Embed-Footer extrahieren und passenden APIClient wählen
+        embed = message.embeds[0]
+        server_name = self.extract_server_name(embed)
+        if not server_name:
+            print(get_translation(user_lang, "no_server_name_found"))
+            return
+        if not report_channel.accepts(server_name):
+            logging.info(f"Report for server {server_name} ignored in channel {report_channel.channel_id}")
+            return
+        api_client = self.get_api_client(server_name)
+        if api_client is None:
+            print(get_translation(user_lang, "no_api_base_url_found"))
+            return
 
-        # Trigger Words für Squadnamen
-        trigger_words = [
-            "able", "baker", "charlie", "commander", "kommandant", "dog", "easy", "fox",
-            "george", "how", "item", "jig", "king", "love", "mike", "negat", "option",
-            "prep", "queen", "roger", "sugar", "tare", "uncle", "victor", "william",
-            "x-ray", "yoke", "zebra"
-        ]
         team = None  # Initialisierung von 'team'
+        author_name = None
 
-        if message.embeds:
-            embed = message.embeds[0]
-            message_author = message.author.display_name if message.author else "Unbekannter Sender"
-            logging.info(f"Message send from Author: {message_author}")
-
-            # Aktualisiertes Regex-Muster
-            updated_regex_pattern = r"(.+?)\s+\[(Axis|Allies)\](?:\[\w+\])?"
-
-            if embed.author and embed.author.name:
-                match = re.match(updated_regex_pattern, embed.author.name)
-                if match:
-                    set_author_name(match.group(1).strip())
-                    team = match.group(2).strip()
-                    logging.info(f"Embed Author Name: {get_author_name()}")
-                    logging.info(f"Detected team: {team}")
-                else:
-                    logging.error("Could not extract author name and team from the embed author.")
-
-            if embed.description:
-                clean_description = remove_markdown(embed.description)
-                logging.info(f"Cleaned Embed Description: {clean_description}")
-                command_parts = clean_description.split()
-
-            if not "clean_description" in locals():
-                return
+        message_author = message.author.display_name if message.author else "Unbekannter Sender"
+        logging.info(f"Message send from Author: {message_author}")
 
-            # Automatische Antwort, falls der Meldungstext in autorespond_trigger.json hinterlegt ist
-            if clean_description.lower() in self.autorespond_trigger:
-                author_name = get_author_name()
-                playerid = await get_playerid_from_name(get_author_name(), api_client=self.api_client)
-                message_content = get_translation(user_lang, "no_reason_or_player")
-                success = await self.api_client.do_message_player(author_name, playerid, message_content)
-                if success:
-                    await message.add_reaction("✅")
-                    await message.add_reaction("📨")
-                return
+        # Aktualisiertes Regex-Muster
+        updated_regex_pattern = r"(.+?)\s+\[(Axis|Allies)\](?:\[\w+\])?"
 
-            # Prüfen, ob es sich um eine Squad-Meldung oder eine Spieler-Meldung handelt
-            if "watched on:" not in clean_description: # Don't react on watchlist messages
-                reported_parts = command_parts
-
-                if reported_parts:
-                    if any(word in reported_parts for word in trigger_words):
-                        logging.info("Identified as unit report.")
-                        trigger_word_index = next(i for i, part in enumerate(reported_parts) if part in trigger_words)
-                        unit_name = reported_parts[trigger_word_index]
-
-                        # Accept 'commander' and 'kommandant' as trigger words
-                        if "commander" in reported_parts or "kommandant" in reported_parts:
-                            unit_name = "command"
-
-                        roles = ["officer", "spotter", "tankcommander", "armycommander"]
-                        logging.info(f"Unit name: {unit_name}, Roles: {roles}")
-
-                        # Stellen Sie sicher, dass 'team' vor dem Aufruf gesetzt ist
-                        if team:
-                            await self.find_and_respond_unit(team, unit_name, roles, message)
-                        else:
-                            logging.error("Team not identified for unit report.")
-                    else:
-                        logging.info("Identified as player report.")
-                        reported_identifier = " ".join(reported_parts)
-                        logging.info(f"Reported identifier: {reported_identifier}")
-                        await self.find_and_respond_player(message, reported_identifier)
-                        logging.info("find_and_respond_player called.")
-
-
-    async def find_and_respond_unit(self, team, unit_name, roles, message):
-        player_data = await self.api_client.get_detailed_players()
-
-        if player_data is None or 'result' not in player_data or 'players' not in player_data['result']:
-            logging.error("Failed to retrieve player data or player data is incomplete.")
+        if embed.author and embed.author.name:
+            match = re.match(updated_regex_pattern, embed.author.name)
+            if match:
+                author_name = match.group(1).strip()
+                team = match.group(2).strip()
+                logging.info(f"Embed Author Name: {author_name}")
+                logging.info(f"Detected team: {team}")
+            else:
+                logging.error("Could not extract author name and team from the embed author.")
+
+        if not embed.description:
+            return
+        clean_description = remove_markdown(embed.description)
+        logging.info(f"Cleaned Embed Description: {clean_description}")
+        classification = self.classifier.classify(clean_description)
+        metrics.REPORTS_RECEIVED.inc(server_name, classification.kind)
+
+        # Derselbe Report in zwei Kanälen wird in beiden beantwortet
+        dedup_key = (message.channel.id, server_name, author_name, clean_description)
+        # Ein Trace pro bearbeitetem Report, bis die Queue mit ihm fertig ist
+        report_span = None
+        if classification.kind in (REPORT_AUTORESPOND, REPORT_UNIT, REPORT_PLAYER):
+            report_span = tracing.start_span("report", server=server_name, type=classification.kind,
+                                             message_id=message.id)
+
+        # Automatische Antwort, falls der Meldungstext in autorespond_trigger.json hinterlegt ist
+        if classification.kind == REPORT_AUTORESPOND:
+            await self.report_queue.submit(server_name, dedup_key, PRIORITY_NORMAL,
+                                           self.autorespond, message, api_client, author_name, user_lang,
+                                           span=report_span)
             return
 
+        # Cheater/Teamkill-Meldungen werden bevorzugt bearbeitet
+        priority = PRIORITY_HIGH if classification.priority else PRIORITY_NORMAL
+
+        # Prüfen, ob es sich um eine Squad-Meldung oder eine Spieler-Meldung handelt
+        # (leere Meldungen und Watchlist-Nachrichten werden ignoriert)
+        if classification.kind == REPORT_UNIT:
+            logging.info("Identified as unit report.")
+            unit_name = classification.unit_name
+            roles = ["officer", "spotter", "tankcommander", "armycommander"]
+            logging.info(f"Unit name: {unit_name}, Roles: {roles}")
+
+            # Stellen Sie sicher, dass 'team' vor dem Aufruf gesetzt ist (beim Kommandanten suchen wir in beiden Teams)
+            if team or unit_name == "command":
+                await self.report_queue.submit(server_name, dedup_key, priority, self.find_and_respond_unit,
+                                               team, unit_name, roles, message, api_client, author_name,
+                                               user_lang, span=report_span)
+            else:
+                logging.error("Team not identified for unit report.")
+                if report_span:
+                    report_span.set("skipped", "no team")
+                    report_span.end()
+        elif classification.kind == REPORT_PLAYER:
+            logging.info("Identified as player report.")
+            reported_identifier = " ".join(classification.parts)
+            logging.info(f"Reported identifier: {reported_identifier}")
+            await self.report_queue.submit(server_name, dedup_key, priority, self.find_and_respond_player,
+                                           message, reported_identifier, api_client, author_name, user_lang,
+                                           span=report_span)
+
+    async def autorespond(self, message, api_client, author_name, user_lang):
+        playerid = await self.resolve_reporter(api_client, author_name)
+        message_content = get_translation(user_lang, "no_reason_or_player")
+        success = await api_client.do_message_player(author_name, playerid, message_content)
+        if success:
+            await message.add_reaction("✅")
+            await message.add_reaction("📨")
+
+    async def find_and_respond_unit(self, team, unit_name, roles, message, api_client, author_name, user_lang):
         if unit_name is None:
             unit_name = ""
 
-        matching_player = []
-        for player_id, player_info in player_data['result']['players'].items():
-            player_unit_name = player_info.get('unit_name', "") or ""
-
-            # Gleiche Teamzugehörigkeit, Squad-Name und entsprechende Rolle
-            if (
-                player_info['team'] and player_info['team'].lower() == team.lower()
-                and player_unit_name.lower() == unit_name.lower()
-                and player_info['role'].lower() in [role.lower() for role in roles]
-            ):
-                player_details = {
-                    "name": player_info['name'],
-                    "level": player_info['level'],
-                    "kills": player_info['kills'],
-                    "deaths": player_info['deaths'],
-                    "player_id": player_info['player_id'],
-                }
-                matching_player = player_details
-                break
-
-        if matching_player:
-            player_additional_data = await self.api_client.get_player_by_id(matching_player['player_id'])
-            embed = await unitreportembed(
-                player_additional_data,
-                user_lang,
-                unit_name,
-                roles,
-                team,
-                matching_player
-            )
-            view = Reportview(self.api_client)
-            await view.add_buttons(
-                user_lang,
-                matching_player['name'],
-                player_additional_data['player_id']
-            )
-            response_message = await message.reply(embed=embed, view=view)
-            self.last_response_message_id = response_message.id
+        # Dieselbe Einheit gerade schon gemeldet: ohne CRCON-Abfragen dort anhängen
+        # (pro Kanal zusammenfassen: die Antwort muss im Kanal des Reporters stehen)
+        entry, first_report = self.report_coalescer.claim((message.channel.id, api_client.base_url),
+                                                          ("unit", team or "", unit_name.lower()))
+        if not first_report and await self.coalesce_report(entry, message, author_name, user_lang):
+            return
+        try:
+            await self.respond_unit(team, unit_name, roles, message, api_client, author_name, user_lang,
+                                    entry if first_report else None)
+        finally:
+            if first_report and entry.response_message is None:
+                self.report_coalescer.release(entry)
+
+    async def respond_unit(self, team, unit_name, roles, message, api_client, author_name, user_lang,
+                           coalesce_entry=None):
+        squad_index = await self.get_roster_cache(api_client).get_squad_index()
+        if squad_index is None:
+            return
+
+        # Beim Kommandanten-Report beide Teams berücksichtigen, das eigene zuerst
+        teams = [team] if team else []
+        if unit_name == "command":
+            teams += [other for other in ("Allies", "Axis") if other.lower() != (team or "").lower()]
+
+        # Gleiche Teamzugehörigkeit, Squad-Name und entsprechende Rolle: alle Treffer, nicht nur der erste
+        matching_players = [
+            player for unit_team in teams for player in squad_index.leaders(unit_team, unit_name, roles)
+        ]
+
+        if matching_players:
+            if coalesce_entry and await self.coalesce_into_player(coalesce_entry, matching_players[0].player_id,
+                                                                  message, author_name, user_lang):
+                return
+            await self.respond_unit_players(matching_players, team, unit_name, roles, message, api_client,
+                                            author_name, user_lang, coalesce_entry)
         else:
-            await self.player_not_found(message)
+            await self.player_not_found(message, api_client, author_name, user_lang)
 
         logging.info(get_translation(user_lang, "response_sent").format(unit_name, ', '.join(roles), team))
 
-    async def find_and_respond_player(self, message, reported_identifier,
+    async def respond_unit_players(self, matching_players, team, unit_name, roles, message, api_client, author_name,
+                                   user_lang, coalesce_entry=None):
+        """Unit-Report für alle gefundenen Squadleader/Kommandanten in einem Embed posten."""
+        # Profile aller Treffer in einem parallelen Batch holen
+        players_additional_data = await asyncio.gather(
+            *(api_client.get_player_by_id(player.player_id) for player in matching_players)
+        )
+        players_additional_data = [
+            profile or PlayerProfile(player.player_id)
+            for player, profile in zip(matching_players, players_additional_data)
+        ]
+
+        author_player_id = await self.resolve_reporter(api_client, author_name)
+        with tracing.span("build_response", players=len(matching_players)):
+            view = Reportview(api_client)
+            if len(matching_players) == 1:
+                matching_player = matching_players[0]
+                embed = await unitreportembed(
+                    players_additional_data[0],
+                    user_lang,
+                    unit_name,
+                    roles,
+                    team,
+                    matching_player
+                )
+                await view.add_buttons(
+                    user_lang,
+                    matching_player.name,
+                    matching_player.player_id,
+                    author_name=author_name,
+                    author_player_id=author_player_id
+                )
+            else:
+                embed = await unitleadersembed(user_lang, unit_name, roles, team, matching_players,
+                                               players_additional_data)
+                await view.add_unit_buttons(user_lang, matching_players, author_name=author_name,
+                                            author_player_id=author_player_id)
+
+        with tracing.span("reply"):
+            response_message = await message.reply(embed=embed, view=view)
+        tracing.set_attribute("response_message_id", response_message.id)
+        self.last_response_message_id = response_message.id
+        self.view_registry.register(response_message.id, view)
+        await self.report_store.save(response_message.id, view.state)
+        if coalesce_entry:
+            self.report_coalescer.publish(coalesce_entry, response_message, author_name)
+
+    async def find_and_respond_player(self, message, reported_identifier, api_client, author_name, user_lang,
                                       max_levenshtein_distance=3,
                                       jaro_winkler_threshold=0.85):
         logging.info("find_and_respond_player function called")
@@ -245,113 +599,225 @@ class MyBot(commands.Bot):
 
         reported_identifier_cleaned = remove_bracketed_content(reported_identifier)
         potential_names = find_player_names(reported_identifier_cleaned, self.excluded_words)
+        if not potential_names:
+            # Kein Name im Text: nichts, woran sich andere Reports anhängen könnten
+            await self.respond_player(message, potential_names, api_client, author_name, user_lang, None,
+                                      jaro_winkler_threshold)
+            return
 
+        # Derselbe Name gerade schon gemeldet: ohne Roster-Abfrage und Abgleich dort anhängen
+        entry, first_report = self.report_coalescer.claim((message.channel.id, api_client.base_url),
+                                                          ("player", " ".join(potential_names).lower()))
+        if not first_report and await self.coalesce_report(entry, message, author_name, user_lang):
+            return
+        try:
+            await self.respond_player(message, potential_names, api_client, author_name, user_lang,
+                                      entry if first_report else None, jaro_winkler_threshold)
+        finally:
+            if first_report and entry.response_message is None:
+                self.report_coalescer.release(entry)
+
+    async def respond_player(self, message, potential_names, api_client, author_name, user_lang, coalesce_entry,
+                             jaro_winkler_threshold):
         # Erster, schneller API-Call (weniger Details, aber reicht für den Namensabgleich)
-        players_fast = await self.api_client.get_players()
-        if not players_fast or 'result' not in players_fast:
+        players_fast = await api_client.get_players()
+        if players_fast is None:
             logging.error("Failed to retrieve players list")
             return
 
-        max_combined_score_threshold = float(os.getenv('MAX_COMBINED_SCORE_THRESHOLD', 0.8))
+        # Dieselbe Liste dient gleich der Auflösung des Reporters
+        self.get_roster_cache(api_client).update_players(players_fast)
 
-        best_match = None
-        best_player_data = None
-        best_score = float('inf')
-
-        for player in players_fast['result']:
-            cleaned_player_name = remove_clantags(player['name'].lower())
-            player_name_words = cleaned_player_name.split()
-
-            for reported_word in potential_names:
-                for player_word in player_name_words:
-                    levenshtein_score = levenshtein_distance(reported_word.lower(), player_word)
-                    jaro_score = jaro_winkler(reported_word.lower(), player_word)
-                    # Kombinierte Heuristik
-                    if levenshtein_score <= max_combined_score_threshold or jaro_score >= jaro_winkler_threshold:
-                        combined_score = levenshtein_score + (1 - jaro_score)
-                        logging.info(
-                            f"Scores for '{reported_word}' vs '{cleaned_player_name}': "
-                            f"Levenshtein = {levenshtein_score}, Jaro = {jaro_score}, Combined = {combined_score}"
-                        )
-
-                        if combined_score < best_score and combined_score <= max_combined_score_threshold:
-                            best_score = combined_score
-                            best_match = player['name']
-                            best_player_data = player
-                            logging.info(f"New best match found: {best_match} with score {best_score}")
-
-        if best_match:
-            live_game_stats = await self.api_client.get_player_data(best_player_data['player_id'])
-            if not live_game_stats or 'result' not in live_game_stats or 'stats' not in live_game_stats['result']:
-                logging.error("Failed to retrieve live game stats for the best matching player")
-                return
+        max_combined_score_threshold = float(os.getenv('MAX_COMBINED_SCORE_THRESHOLD', 0.8))
 
-            player_stats = next(
-                (item for item in live_game_stats['result']['stats']
-                 if item['player_id'] == best_player_data['player_id']),
-                None
+        match_started = time.perf_counter()
+        with tracing.span("match", roster_size=len(players_fast)) as match_span:
+            matches = rank_player_matches(
+                potential_names,
+                players_fast,
+                top_k=MATCH_TOP_K,
+                max_combined_score_threshold=max_combined_score_threshold,
+                jaro_winkler_threshold=jaro_winkler_threshold
             )
+            if match_span:
+                match_span.set("matches", len(matches))
+        metrics.MATCH_SECONDS.observe(time.perf_counter() - match_started)
 
-            if player_stats:
-                logging.info(get_translation(user_lang, "best_match_found").format(best_match))
-                player_additional_data = await self.api_client.get_player_by_id(best_player_data['player_id'])
-                total_playtime_seconds = player_additional_data.get('total_playtime_seconds', 0)
-                total_playtime_hours = total_playtime_seconds / 3600
-                embed = await playerreportembed(
-                    user_lang,
-                    best_match,
-                    player_stats,
-                    total_playtime_hours,
-                    best_player_data
-                )
+        if not matches:
+            await self.player_not_found(message, api_client, author_name, user_lang)
+            return
 
-                response_message = await message.reply(embed=embed)
-                self.last_response_message_id = response_message.id
-                view = Reportview(self.api_client)
-                await view.add_buttons(
-                    user_lang,
-                    best_match,
-                    best_player_data['player_id']
-                )
-                await response_message.edit(view=view)
-            else:
-                await self.player_not_found(message)
-        else:
-            await self.player_not_found(message)
+        best_score, best_player_data = matches[0]
+        logging.info(f"Best match found: {best_player_data.name} with score {best_score}")
+
+        # Liegen die besten Treffer zu nah beieinander, bieten wir Alternativen zur Auswahl an
+        alternatives = matches if is_ambiguous(matches, MATCH_AMBIGUITY_MARGIN) else None
+        if alternatives:
+            logging.info(f"Ambiguous match, alternatives: {[player.name for _, player in alternatives]}")
+
+        # Wurde derselbe Spieler (anders formuliert) gerade schon gemeldet, hängen wir den Reporter dort an
+        if coalesce_entry and await self.coalesce_into_player(coalesce_entry, best_player_data.player_id,
+                                                              message, author_name, user_lang):
+            return
+
+        report = await self.build_player_report(best_player_data, api_client, author_name, user_lang,
+                                                alternatives)
+        if report is None:
+            await self.player_not_found(message, api_client, author_name, user_lang)
+            return
 
-    async def player_not_found(self, message):
+        embed, view = report
+        with tracing.span("reply"):
+            response_message = await message.reply(embed=embed)
+            await response_message.edit(view=view)
+        tracing.set_attribute("response_message_id", response_message.id)
+        self.last_response_message_id = response_message.id
+        self.view_registry.register(response_message.id, view)
+        await self.report_store.save(response_message.id, view.state)
+        if coalesce_entry:
+            self.report_coalescer.publish(coalesce_entry, response_message, author_name)
+
+    async def coalesce_into_player(self, entry, player_id, message, author_name, user_lang):
+        """
+        Erster Report zu seinem Ziel: an die player_id binden. Gibt es für den Spieler schon einen Report,
+        wird dieser (samt der auf entry Wartenden) dort angehängt und True zurückgegeben.
+        """
+        existing = self.report_coalescer.bind(entry, player_id)
+        if existing is None or not await self.coalesce_report(existing, message, author_name, user_lang):
+            return False
+        self.report_coalescer.forward(entry, existing)
+        return True
+
+    async def coalesce_report(self, entry, message, author_name, user_lang):
+        """Report an eine bestehende Antwort anhängen statt neu zu posten. False, wenn das nicht (mehr) geht."""
+        try:
+            await asyncio.wait_for(entry.ready.wait(), timeout=30)
+        except asyncio.TimeoutError:
+            return False
+        if entry.response_message is None:
+            return False
+
+        with tracing.span("coalesce", response_message_id=entry.response_message.id):
+            async with self.message_lock(entry.response_message.id):
+                # Im Store schon abgeschlossen, auch wenn die Outbox die Buttons noch nicht entfernt hat
+                if await self.report_store.get(entry.response_message.id, open_only=True) is None:
+                    return False
+                # Aktuellen Stand holen, damit inzwischen ergänzte Modlog-Einträge nicht überschrieben werden
+                response_message = await entry.response_message.channel.fetch_message(entry.response_message.id)
+                if not response_message.components:
+                    return False  # Report wurde bereits bearbeitet
+                if author_name not in entry.reporters:
+                    entry.reporters.append(author_name)
+                embed = response_message.embeds[0]
+                set_additional_reporters_field(embed, user_lang, entry.reporters[1:])
+                entry.response_message = await response_message.edit(embed=embed)
+                await self.report_store.add_reporter(entry.response_message.id, author_name)
+
+        await message.add_reaction("🔗")
+        logging.info(f"Report by {author_name} coalesced into message {entry.response_message.id}")
+        return True
+
+    async def build_player_report(self, player, api_client, author_name, user_lang, alternatives=None):
+        """Embed und View für einen gefundenen Spieler erstellen. None, falls keine Live-Stats vorhanden sind."""
+        player_stats = await api_client.get_player_data(player.player_id)
+        if player_stats is None:
+            logging.error("Failed to retrieve live game stats for the best matching player")
+            return None
+
+        logging.info(get_translation(user_lang, "best_match_found").format(player.name))
+        player_additional_data = await api_client.get_player_by_id(player.player_id)
+        total_playtime_hours = player_additional_data.total_playtime_hours if player_additional_data else 0
+        with tracing.span("embed"):
+            embed = await playerreportembed(
+                user_lang,
+                player.name,
+                player_stats,
+                total_playtime_hours,
+                player,
+                alternatives
+            )
+
+        view = Reportview(api_client)
+        await view.add_buttons(
+            user_lang,
+            player.name,
+            player.player_id,
+            author_name=author_name,
+            author_player_id=await self.resolve_reporter(api_client, author_name),
+            alternatives=alternatives,
+            on_alternative_selected=functools.partial(
+                self.select_alternative_player, api_client=api_client, author_name=author_name,
+                user_lang=user_lang
+            )
+        )
+        return embed, view
+
+    async def select_alternative_player(self, interaction, player, api_client, author_name, user_lang):
+        """Admin hat im Report einen alternativen Spieler gewählt: Report an Ort und Stelle ersetzen."""
+        await interaction.response.defer()
+        logging.info(f"Alternative player selected by {interaction.user.display_name}: {player.name}")
+        report = await self.build_player_report(player, api_client, author_name, user_lang)
+        if report is None:
+            await interaction.followup.send(get_translation(user_lang, "no_matching_player_found"), ephemeral=True)
+            return
+        embed, view = report
+        # Alte View stoppen, bevor die neue an die Nachricht gehängt wird
+        self.view_registry.register(interaction.message.id, view)
+        await interaction.message.edit(embed=embed, view=view)
+        await self.report_store.save(interaction.message.id, view.state)
+
+    async def player_not_found(self, message, api_client, author_name, user_lang):
         # 1) Reporter ermitteln
-        author_name = get_author_name()
-        author_player_id = await get_playerid_from_name(author_name, self.api_client)
+        author_player_id = await self.resolve_reporter(api_client, author_name)
 
         # 2) Dem Melder (Reporter) automatisch eine Nachricht schicken
-        not_found_text = get_translation(self.user_lang, "player_not_found_auto_msg")  # <--- neuen Key in languages.json ergänzen
+        not_found_text = get_translation(user_lang, "player_not_found_auto_msg")  # <--- neuen Key in languages.json ergänzen
         if author_player_id:
-            await self.api_client.do_message_player(author_name, author_player_id, not_found_text)
+            await self.outbox.put("message", {"server": api_client.server_name, "player_name": author_name,
+                                              "player_id": author_player_id, "message": not_found_text})
 
         # 3) Embed für "nicht gefunden" erstellen
-        embed = await player_not_found_embed(author_player_id, author_name, self.user_lang)
+        with tracing.span("embed"):
+            embed = await player_not_found_embed(author_player_id, author_name, user_lang)
 
         # 4) View erstellen, aber OHNE Kick/Temp-Ban/Perma-Ban
-        view = Reportview(self.api_client)
+        view = Reportview(api_client)
         # Wichtig: self_report=False, damit der „Message Reporter“-Button sichtbar ist;
         #          player_found=False, damit wir Kick/TempBan/PermaBan nicht hinzufügen.
         await view.add_buttons(
-            user_lang=self.user_lang,
+            user_lang=user_lang,
             reported_player_name=author_name,        # hier stecken wir den Melder rein
             player_id=author_player_id,
             self_report=False,
-            player_found=False  # <-- sorgt gleich dafür, dass Kick, Temp-Ban, Perma-Ban NICHT hinzugefügt werden
+            player_found=False,  # <-- sorgt gleich dafür, dass Kick, Temp-Ban, Perma-Ban NICHT hinzugefügt werden
+            author_name=author_name,
+            author_player_id=author_player_id
         )
 
         # 5) Abschicken
-        await message.reply(embed=embed, view=view)
-
-    async def on_close(self):
-        if self.api_client.session:
-            await self.api_client.close_session()
+        with tracing.span("reply"):
+            response_message = await message.reply(embed=embed, view=view)
+        tracing.set_attribute("response_message_id", response_message.id)
+        self.view_registry.register(response_message.id, view)
+        await self.report_store.save(response_message.id, view.state)
+
+    async def close(self):
+        if self.report_queue:
+            await self.report_queue.stop()
+        await self.outbox.stop()
+        if self.translations_watcher:
+            self.translations_watcher.cancel()
+        for api_client in self.api_clients.values():
+            await api_client.close_session()
+        self.report_store.close()
+        await metrics.registry.stop()
+        await tracing.tracer.close()
+        if self.loop_watchdog:
+            self.loop_watchdog.stop()
+        await super().close()
 
 
 # Running the bot
-bot = MyBot(intents)
-bot.run(TOKEN)
+if __name__ == "__main__":
+    bot = MyBot(intents)
+    bot.run(TOKEN)
@@ -1,10 +1,12 @@
 # In helpers.py
+import os
 import re
 import json
 from datetime import datetime
 import time
 import logging
 import tempfile
+from translations import TranslationCatalog
 
 def remove_markdown(content):
     # Entfernt Discord Markdown-Formatierung (fett, kursiv, unterstrichen, durchgestrichen, Inline-Code)
@@ -32,13 +34,13 @@ def find_player_names(text, excluded_words):
                 potential_names.append(words[i] + " " + words[i + 1])
     return potential_names
 
-# Load the language file
-with open('languages.json', 'r', encoding="utf8") as file:
-    languages = json.load(file)
+# Load the language file (einmal, relativ zum Bot-Verzeichnis statt zum Arbeitsverzeichnis)
+LANGUAGES_FILE = os.getenv('LANGUAGES_FILE', os.path.join(os.path.dirname(os.path.abspath(__file__)), 'languages.json'))
+translations = TranslationCatalog(LANGUAGES_FILE)
 
 def get_translation(lang, key):
     '''Fetches the translation for a specific key and language.'''
-    return languages.get(lang, {}).get(key, "")
+    return translations.bundle(lang)[key]
 
 author_name = None
 
@@ -71,31 +73,77 @@ def remove_clantags(name):
 
 # Ads Modlog and Clears Buttons
 async def add_modlog(interaction, logmessage, player_id, user_lang, api_client, original_message = False, delete_buttons = True, add_entry = False):
+    """
+    Modlog-Eintrag im Report (und als Spielerkommentar) über die Outbox: der Callback wartet nur
+    aufs Eintragen, Discord- und CRCON-Aufrufe macht der Outbox-Worker, bei Fehlern wiederholt.
+    """
     now = datetime.now()  # current date and time
     date_time = now.strftime("%d.%m.%Y %H:%M:%S:")
     logging.info(date_time + logmessage) # Log in File
     if player_id is not False:
-        await api_client.post_player_comment(player_id, logmessage)
+        await queue_player_comment(interaction, api_client, player_id, logmessage)
     actiontime = "<t:" + str(int(time.time())) + ":f>: "
     logmessage = actiontime + logmessage
-    mesg_id = interaction.message.id
     if not original_message:
-        original_message = await interaction.channel.fetch_message(interaction.message.id)
-    new_embed = original_message.embeds[0]
+        original_message = interaction.message
+    if delete_buttons:
+        # Lokal sofort abschließen, die Buttons verschwinden mit dem Modlog-Eintrag
+        await close_report(interaction, original_message.id)
+    await interaction.client.outbox.put("modlog", {
+        "channel_id": original_message.channel.id,
+        "message_id": original_message.id,
+        "lang": user_lang,
+        "text": logmessage,
+        "delete_buttons": delete_buttons,
+        "add_entry": add_entry,
+    }, sequence_key=f"modlog:{original_message.channel.id}:{original_message.id}")
+
+
+async def apply_modlog(message, user_lang, logmessage, delete_buttons=True, add_entry=False):
+    """Modlog-Eintrag in die (frisch geholte) Report-Nachricht schreiben, ausgeführt vom Outbox-Worker."""
+    new_embed = message.embeds[0]
     if not add_entry:
         new_embed.add_field(name=get_translation(user_lang, "logbook"),value=logmessage, inline=False)
     else:
         value = new_embed.fields[-1].value + "\n" + logmessage
         new_embed.set_field_at(index=-1, name=new_embed.fields[-1].name, value=value, inline=False)
     if delete_buttons:
-        await original_message.edit(view=None, embed=new_embed)
+        await message.edit(view=None, embed=new_embed)
     else:
-        await original_message.edit(embed=new_embed)
+        await message.edit(embed=new_embed)
+
+
+async def queue_player_comment(interaction, api_client, player_id, comment):
+    """Spielerkommentar in CRCON über die Outbox posten."""
+    await interaction.client.outbox.put("comment", {
+        "server": api_client.server_name, "player_id": player_id, "comment": comment
+    })
+
+
+async def queue_player_message(interaction, api_client, player_name, player_id, message):
+    """Nachricht an einen Spieler (z.B. den Reporter) über die Outbox senden, notfalls später wiederholt."""
+    await interaction.client.outbox.put("message", {
+        "server": api_client.server_name, "player_name": player_name, "player_id": player_id, "message": message
+    })
+
+
+async def close_report(interaction, message_id):
+    """Buttons des Reports wurden entfernt: View freigeben und nach einem Neustart nicht mehr registrieren."""
+    interaction.client.view_registry.discard(message_id)
+    await interaction.client.report_store.close_report(message_id)
+
+
+async def record_outcome(interaction, outcome, message_id=None):
+    """Ergebnis eines Reports (z.B. "unjustified", "no_action") im Report-Store festhalten."""
+    if message_id is None:
+        message_id = interaction.message.id
+    await interaction.client.report_store.record_outcome(message_id, outcome, interaction.user.display_name)
 
 
 async def only_remove_buttons(interaction):
     original_message = await interaction.channel.fetch_message(interaction.message.id)
     await original_message.edit(view=None)
+    await close_report(interaction, original_message.id)
 
 
 async def add_check_to_messages(interaction, original_message = False):
@@ -111,8 +159,9 @@ async def remove_emojis_to_messages(interaction, emoji = '⚠️'):
     reportmessage = await original_message.channel.fetch_message(original_message.reference.message_id)
     await reportmessage.clear_reaction(emoji)
 
-async def add_emojis_to_messages(interaction, emoji = '⚠️'):
-    original_message = await interaction.channel.fetch_message(interaction.message.id)
+async def add_emojis_to_messages(interaction, emoji = '⚠️', original_message = False):
+    if original_message == False:
+        original_message = await interaction.channel.fetch_message(interaction.message.id)
     await original_message.add_reaction(emoji)
     reportmessage = await original_message.channel.fetch_message(original_message.reference.message_id)
     await reportmessage.add_reaction(emoji)
@@ -128,12 +177,12 @@ async def get_playername(player_id, api_client):
 
 async def get_logs(api_client, player_name):
     logs = await api_client.get_structured_logs(60, None, player_name)  # Fetching logs without filtering by name
-    if logs and len(logs['result']['logs']) > 0:
+    if logs:
         log_message = ""
-        for log in logs['result']['logs']:
-            timestamp = datetime.fromtimestamp(log['timestamp_ms']/1000)
+        for log in logs:
+            timestamp = datetime.fromtimestamp(log.timestamp_ms/1000)
             timestr = timestamp.strftime("%d.%m.%Y %H:%M:%S")
-            log_messages = f"{timestr}: {log['action']} by {log['player_name_1']} - {log['message']}"
+            log_messages = f"{timestr}: {log.action} by {log.player_name_1} - {log.message}"
             log_message = log_message + log_messages + "\n"
         if log_message:
             with tempfile.NamedTemporaryFile(delete=False, mode='w', suffix='.txt') as temp_log_file:
@@ -144,11 +193,11 @@ async def get_logs(api_client, player_name):
        return False
 
 async def get_playerid_from_name(name, api_client):
-    players_data = await api_client.get_players()
-    if players_data and 'result' in players_data:
-        players_list = players_data['result']
-        author_player = next((p for p in players_list if p['name'].lower() == name.lower()), None)
+    players_list = await api_client.get_players()
+    if players_list is not None:
+        name = name.lower()
+        author_player = next((p for p in players_list if p.name_lower == name), None)
         if author_player:
-            player_id = author_player['player_id']
+            player_id = author_player.player_id
             return player_id
 
@@ -0,0 +1,50 @@
+import heapq
+import logging
+from Levenshtein import distance as levenshtein_distance
+from Levenshtein import jaro_winkler
+
+
+def score_player(potential_names, player_name_words, max_combined_score_threshold, jaro_winkler_threshold):
+    """
+    Bester (kleinster) kombinierter Score eines Spielers über alle Wortkombinationen.
+    Gibt None zurück, wenn keine Kombination unter der Schwelle liegt.
+    """
+    best_score = None
+    for reported_word in potential_names:
+        for player_word in player_name_words:
+            levenshtein_score = levenshtein_distance(reported_word, player_word)
+            jaro_score = jaro_winkler(reported_word, player_word)
+            # Kombinierte Heuristik
+            if levenshtein_score <= max_combined_score_threshold or jaro_score >= jaro_winkler_threshold:
+                combined_score = levenshtein_score + (1 - jaro_score)
+                if combined_score <= max_combined_score_threshold and (best_score is None or combined_score < best_score):
+                    best_score = combined_score
+    return best_score
+
+
+def rank_player_matches(potential_names, players, top_k=3,
+                        max_combined_score_threshold=0.8, jaro_winkler_threshold=0.85):
+    """
+    Liefert die top_k besten Treffer [Player] als Liste von (score, player), aufsteigend nach Score.
+    Es wird nur ein Heap der Größe top_k gehalten, nicht die komplette Rangliste.
+    top_k unter 1 (z.B. MATCH_TOP_K=0) gilt als 1: der beste Treffer wird immer geliefert.
+    """
+    top_k = max(1, top_k)
+    reported_words = [name.lower() for name in potential_names]
+    heap = []  # Max-Heap über (-score, index, player)
+    for index, player in enumerate(players):
+        score = score_player(reported_words, player.name_words, max_combined_score_threshold, jaro_winkler_threshold)
+        if score is None:
+            continue
+        logging.debug(f"Score for '{player.name}': {score}")
+        entry = (-score, -index, player)
+        if len(heap) < top_k:
+            heapq.heappush(heap, entry)
+        elif entry > heap[0]:
+            heapq.heapreplace(heap, entry)
+    return [(-neg_score, player) for neg_score, _, player in sorted(heap, reverse=True)]
+
+
+def is_ambiguous(matches, margin):
+    """True, wenn die beiden besten Treffer innerhalb von margin liegen."""
+    return len(matches) >= 2 and (matches[1][0] - matches[0][0]) <= margin
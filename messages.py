@@ -1,115 +1,330 @@
 import discord
 from discord.ui import View, Button
-from helpers import get_translation, get_author_name, get_playerid_from_name
+from helpers import get_translation, get_author_name, get_playerid_from_name, translations
 from modals import TempBanButton, MessagePlayerButton, MessageReportedPlayerButton, Show_logs_button, PermaBanButton, \
-    PunishButton, KickButton, Unjustified_Report, No_Action_Button, Manual_process
+    PunishButton, KickButton, Unjustified_Report, No_Action_Button, Manual_process, AlternativePlayerSelect, \
+    ReportContext, BatchActionButton, BroadcastButton
+from records import Player
+
+
+REPORT_COLOR = 0xd85f0e
+NOT_FOUND_COLOR = discord.Colour.magenta().value
+
+# (Übersetzungs-Key, Attribut von PlayerStats) in der Reihenfolge der Felder im Spieler-Report
+PLAYER_STAT_FIELDS = (
+    ("kills", "kills"),
+    ("kill_streak", "kills_streak"),
+    ("kill_death_ratio", "kill_death_ratio"),
+    ("kills_per_minute", "kills_per_minute"),
+    ("deaths", "deaths"),
+    ("teamkills", "teamkills"),
+    ("teamkill_streak", "teamkills_streak"),
+)
+
+
+def _escape_format(text):
+    return text.replace("{", "{{").replace("}", "}}")
+
+
+def _player_report_template(texts):
+    return {
+        "title": texts["report_for_player"],
+        "alternatives": texts["possible_alternatives"],
+        "realname": texts["realname"],
+        "information": (texts["information"], texts["check_report_match"]),
+        "total_playtime": texts["total_playtime"],
+        "hours": " " + texts["hours"],
+        "stats": tuple((texts[key], stat) for key, stat in PLAYER_STAT_FIELDS),
+    }
+
+
+def _unit_report_template(texts):
+    return {
+        "title": texts["players_in_unit"],
+        "name": texts["name"],
+        "level": texts["level"],
+        "total_playtime": texts["total_playtime"],
+        "hours": " " + texts["hours"],
+        "kills": texts["kills"],
+        "deaths": texts["deaths"],
+        "steam_id": texts["steam_id"],
+        # Ein Feld pro Spieler, wenn mehrere Spieler in einem Embed stehen
+        "leader_value": (
+            f"{_escape_format(texts['level'])}: {{}} | {_escape_format(texts['kills'])}: {{}} | "
+            f"{_escape_format(texts['deaths'])}: {{}}\n"
+            f"{_escape_format(texts['total_playtime'])}: {{:.2f}} {_escape_format(texts['hours'])}\n"
+            f"{_escape_format(texts['steam_id'])}: {{}}"
+        ),
+    }
+
+
+def _not_found_template(texts):
+    return {
+        "title": texts["no_matching_player_found"],
+        "name": texts["name"],
+        "steam_id": texts["steam_id"],
+    }
+
+
+EMBED_TEMPLATES = {
+    "player": _player_report_template,
+    "unit": _unit_report_template,
+    "not_found": _not_found_template,
+}
+_embed_template_cache = {}
+
+
+def embed_template(user_lang, report_type):
+    """
+    Titel und Feldnamen eines Report-Embeds, einmal pro Sprache und Reporttyp aufgelöst.
+    Nach einem Reload der Übersetzungen werden die Vorlagen neu gebaut.
+    """
+    key = (user_lang, report_type)
+    cached = _embed_template_cache.get(key)
+    if cached is None or cached[0] != translations.version:
+        cached = (translations.version, EMBED_TEMPLATES[report_type](translations.bundle(user_lang)))
+        _embed_template_cache[key] = cached
+    return cached[1]
+
+
+def _field(name, value, inline=True):
+    # Immer ein neues Dict: discord.py ändert Felder bei set_field_at an Ort und Stelle
+    return {"name": name, "value": str(value), "inline": inline}
+
+
+def _embed(title, color, fields):
+    return discord.Embed.from_dict({"type": "rich", "title": title, "color": color, "fields": fields})
 
 
 async def unitreportembed(player_additional_data, user_lang, unit_name, roles, team, player):
-    embed_title = get_translation(user_lang, "players_in_unit").format(unit_name, ', '.join(roles), team)
-    embed = discord.Embed(title=embed_title, color=0xd85f0e)
-    total_playtime_seconds = player_additional_data.get('total_playtime_seconds', 0)
-    total_playtime_hours = total_playtime_seconds / 3600
-    embed.add_field(name=get_translation(user_lang, "name"), value=player["name"], inline=True)
-    embed.add_field(name=get_translation(user_lang, "level"), value=player["level"], inline=True)
-    embed.add_field(name=get_translation(user_lang, "total_playtime"),
-                    value=f"{total_playtime_hours:.2f} " + get_translation(user_lang, "hours"), inline=True)
-    embed.add_field(name=get_translation(user_lang, "kills"), value=player["kills"], inline=True)
-    embed.add_field(name=get_translation(user_lang, "deaths"), value=player["deaths"], inline=True)
-    embed.add_field(name=get_translation(user_lang, "steam_id"), value=player["player_id"], inline=True)
-    return embed
+    template = embed_template(user_lang, "unit")
+    return _embed(template["title"].format(unit_name, ', '.join(roles), team), REPORT_COLOR, [
+        _field(template["name"], player.name),
+        _field(template["level"], player.level),
+        _field(template["total_playtime"], f"{player_additional_data.total_playtime_hours:.2f}" + template["hours"]),
+        _field(template["kills"], player.kills),
+        _field(template["deaths"], player.deaths),
+        _field(template["steam_id"], player.player_id),
+    ])
+
+
+async def unitleadersembed(user_lang, unit_name, roles, team, players, players_additional_data):
+    """Ein Embed für mehrere Spieler einer Einheit (z.B. beide Kommandanten oder Officer und Spotter)."""
+    template = embed_template(user_lang, "unit")
+    leader_value = template["leader_value"]
+    fields = [
+        _field(
+            f"{player.name} ({player.role}, {player.team})",
+            leader_value.format(player.level, player.kills, player.deaths,
+                                player_additional_data.total_playtime_hours, player.player_id),
+            inline=False
+        )
+        for player, player_additional_data in list(zip(players, players_additional_data))[:25]
+    ]
+    return _embed(template["title"].format(unit_name, ', '.join(roles), team), REPORT_COLOR, fields)
 
 
 async def player_not_found_embed(player_id, player_name, user_lang):
-    embed = discord.Embed(title=get_translation(user_lang, "no_matching_player_found"), color=discord.Colour.magenta())
-    embed.add_field(name=get_translation(user_lang, "name"), value=player_name, inline=True)
-    embed.add_field(name=get_translation(user_lang, "steam_id"), value=player_id, inline=True)
-    return embed
+    template = embed_template(user_lang, "not_found")
+    return _embed(template["title"], NOT_FOUND_COLOR, [
+        _field(template["name"], player_name),
+        _field(template["steam_id"], player_id),
+    ])
 
 
-async def playerreportembed(user_lang, best_match, player_stats, total_playtime_hours, best_player_data):
-    embed_title = get_translation(user_lang, "report_for_player").format(best_match)
-    embed = discord.Embed(title=embed_title, color=0xd85f0e)
-
-    realname = None
-    if player_stats.get('steaminfo') and player_stats['steaminfo'].get('profile'):
-        realname = player_stats['steaminfo']['profile'].get('realname')
-
-    if realname:
-        embed.add_field(name=get_translation(user_lang, "realname"), value=realname, inline=True)
-    embed.add_field(name=get_translation(user_lang, "information"),
-                    value=get_translation(user_lang, "check_report_match"), inline=False)
-    embed.add_field(name=get_translation(user_lang, "total_playtime"),
-                    value=f"{total_playtime_hours:.2f} " + get_translation(user_lang, "hours"), inline=True)
-    embed.add_field(name="Steam-ID", value=best_player_data['player_id'], inline=True)
-    embed.add_field(name=get_translation(user_lang, "kills"), value=player_stats['kills'], inline=True)
-    embed.add_field(name=get_translation(user_lang, "kill_streak"), value=player_stats['kills_streak'], inline=True)
-    embed.add_field(name=get_translation(user_lang, "kill_death_ratio"), value=player_stats['kill_death_ratio'],
-                    inline=True)
-    embed.add_field(name=get_translation(user_lang, "kills_per_minute"), value=player_stats['kills_per_minute'],
-                    inline=True)
-    embed.add_field(name=get_translation(user_lang, "deaths"), value=player_stats['deaths'], inline=True)
-    embed.add_field(name=get_translation(user_lang, "teamkills"), value=player_stats['teamkills'], inline=True)
-    embed.add_field(name=get_translation(user_lang, "teamkill_streak"), value=player_stats['teamkills_streak'],
-                    inline=True)
+async def playerreportembed(user_lang, best_match, player_stats, total_playtime_hours, best_player_data,
+                            alternatives=None):
+    template = embed_template(user_lang, "player")
+    fields = []
+
+    # Nicht eindeutiger Treffer: alternative Kandidaten kompakt auflisten
+    if alternatives:
+        alternatives_text = "\n".join(
+            f"`{score:.2f}` {player.name}" for score, player in alternatives
+            if player.player_id != best_player_data.player_id
+        )
+        if alternatives_text:
+            fields.append(_field(template["alternatives"], alternatives_text, inline=False))
+
+    if player_stats.realname:
+        fields.append(_field(template["realname"], player_stats.realname))
+    information_name, information_value = template["information"]
+    fields.append(_field(information_name, information_value, inline=False))
+    fields.append(_field(template["total_playtime"], f"{total_playtime_hours:.2f}" + template["hours"]))
+    fields.append(_field("Steam-ID", best_player_data.player_id))
+    fields.extend(_field(name, getattr(player_stats, stat)) for name, stat in template["stats"])
+    return _embed(template["title"].format(best_match), REPORT_COLOR, fields)
+
+
+def set_additional_reporters_field(embed, user_lang, reporters):
+    """Feld mit weiteren Reportern eines zusammengefassten Reports setzen bzw. aktualisieren."""
+    field_name = get_translation(user_lang, "additional_reporters")
+    value = ", ".join(reporters)
+    if len(value) > 1024:
+        value = value[:1020] + " ..."
+    for index, field in enumerate(embed.fields):
+        if field.name == field_name:
+            embed.set_field_at(index, name=field_name, value=value, inline=False)
+            return embed
+    embed.add_field(name=field_name, value=value, inline=False)
     return embed
 
 
+def report_custom_id(action, player_id, server_name):
+    """
+    Stabile custom_id für Spieler-Buttons (Aktion, Spieler-ID, Server), damit ein Button-Klick
+    auch nach einem Neustart dem richtigen Spieler zugeordnet wird. Discord erlaubt max. 100 Zeichen.
+    """
+    return f"{action}:{player_id}:{server_name or ''}"[:100]
+
+
+# Aktionen aus report_custom_id und die festen custom_ids der übrigen Report-Buttons
+REPORT_BUTTON_ACTIONS = frozenset({"message_reported_player", "punish", "kick", "temp_ban", "perma_ban",
+                                   "message_player", "batch_action", "broadcast"})
+REPORT_STATIC_CUSTOM_IDS = frozenset({"unjustified_report", "no_action", "logs", "alternative_player",
+                                      "manual_process", "finished_processing"})
+
+
+def is_report_custom_id(custom_id):
+    """True, wenn custom_id zu einem Button bzw. Auswahlmenü einer Report-Nachricht (Reportview) gehört."""
+    if custom_id in REPORT_STATIC_CUSTOM_IDS:
+        return True
+    action, separator, _ = custom_id.partition(":")
+    return bool(separator) and action in REPORT_BUTTON_ACTIONS
+
+
 class Reportview(discord.ui.View):
     def __init__(self, api_client):
-        super().__init__(timeout=3600)
+        # Persistente View ohne Timeout: der Zustand für das Wiederherstellen nach einem Neustart
+        # steht in self.state und wird im ReportStore gespeichert
+        super().__init__(timeout=None)
         self.api_client = api_client
+        self.server_name = api_client.server_name
+        self.context = None
+        self.state = None
         self.message = None  # damit wir on_timeout überschreiben können, falls nötig
 
+    @classmethod
+    def restore(cls, api_client, state, on_alternative_selected=None):
+        """View aus einem gespeicherten Zustand (ReportStore) ohne CRCON-Abfragen neu aufbauen."""
+        view = cls(api_client)
+        if state["kind"] == "unit":
+            players = [Player(player_id, name) for player_id, name in state["players"]]
+            view.add_unit_player_buttons(state["lang"], players, state["author_name"], state["author_player_id"])
+        else:
+            alternatives = [
+                (score, Player(player_id, name))
+                for score, player_id, name in state.get("alternatives", [])
+            ]
+            view.add_player_buttons(
+                state["lang"],
+                state["name"],
+                state["player_id"],
+                state["author_name"],
+                state["author_player_id"],
+                self_report=state["self_report"],
+                player_found=state["player_found"],
+                alternatives=alternatives or None,
+                on_alternative_selected=on_alternative_selected
+            )
+        return view
+
     async def add_buttons(
         self,
         user_lang,
         reported_player_name,
         player_id,
         self_report=False,
-        player_found=True  # <--- Neu
+        player_found=True,  # <--- Neu
+        alternatives=None,
+        on_alternative_selected=None,
+        author_name=None,
+        author_player_id=None
     ):
         """
         Fügt je nach Parametern bestimmte Buttons hinzu.
         - self_report=False => 'Message Reporter'-Button
         - player_found=False => KEINE Kick/Temp-Ban/Perma-Ban-Buttons
+        - alternatives => Auswahlmenü für alternative Spieler bei mehrdeutigem Treffer
+        - author_name => Reporter dieses Reports (sonst der zuletzt global gesetzte)
+        - author_player_id => bereits aufgelöste ID des Reporters (sonst Suche über get_players)
         """
         # Autor herausfinden (Reporter), falls wir ihn kontaktieren wollen
         if not self_report:
-            author_name = get_author_name()
-            author_player_id = await get_playerid_from_name(author_name, self.api_client)
+            if author_name is None:
+                author_name = get_author_name()
+            if author_player_id is None:
+                author_player_id = await get_playerid_from_name(author_name, self.api_client)
         else:
             author_name = False
             author_player_id = False
 
+        self.add_player_buttons(
+            user_lang,
+            reported_player_name,
+            player_id,
+            author_name,
+            author_player_id,
+            self_report=self_report,
+            player_found=player_found,
+            alternatives=alternatives,
+            on_alternative_selected=on_alternative_selected
+        )
+
+    def add_player_buttons(
+        self,
+        user_lang,
+        reported_player_name,
+        player_id,
+        author_name,
+        author_player_id,
+        self_report=False,
+        player_found=True,
+        alternatives=None,
+        on_alternative_selected=None
+    ):
+        """Buttons eines Spieler-Reports aufbauen, Reporter-ID bereits bekannt (keine CRCON-Abfragen)."""
+        texts = translations.bundle(user_lang)
+        self.context = context = ReportContext(
+            self.api_client, user_lang, texts, author_name, author_player_id, self_report
+        )
+        self.state = {
+            "kind": "player",
+            "server": self.server_name,
+            "lang": user_lang,
+            "name": reported_player_name,
+            "player_id": player_id,
+            "author_name": author_name,
+            "author_player_id": author_player_id,
+            "self_report": self_report,
+            "player_found": player_found,
+        }
+        if alternatives:
+            self.state["alternatives"] = [
+                [score, player.player_id, player.name] for score, player in alternatives
+            ]
+
         #
         # 1) Button: Nachricht an den REPORTED Spieler („MessageReportedPlayerButton“)
         #    Nur sinnvoll, wenn tatsächlich ein Player gefunden wurde
         #
         if player_found:
-            message_reported_player_button_label = get_translation(user_lang, "message_reported_player").format(reported_player_name)
+            message_reported_player_button_label = texts["message_reported_player"].format(reported_player_name)
             message_reported_player_button = MessageReportedPlayerButton(
                 label=message_reported_player_button_label,
-                custom_id=f"message_reported_player_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                author_name=author_name,
-                author_player_id=author_player_id,
-                self_report=self_report
+                custom_id=report_custom_id("message_reported_player", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(message_reported_player_button)
 
             # 2) Punish-Button (sofern erwünscht)
-            punish_button_label = get_translation(user_lang, "punish_button_label").format(reported_player_name)
+            punish_button_label = texts["punish_button_label"].format(reported_player_name)
             punish_button = PunishButton(
                 label=punish_button_label,
-                custom_id=f"punish_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                author_player_id=author_player_id,
-                self_report=self_report
+                custom_id=report_custom_id("punish", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(punish_button)
 
@@ -118,42 +333,32 @@ class Reportview(discord.ui.View):
         #
         if player_found:
             # Kick
-            kick_button_label = get_translation(user_lang, "kick_player")
+            kick_button_label = texts["kick_player"]
             kick_button = KickButton(
                 label=kick_button_label,
-                custom_id=f"kick_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                author_player_id=author_player_id,
-                author_name=author_name,
-                self_report=self_report
+                custom_id=report_custom_id("kick", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(kick_button)
 
             # Temp-Ban
-            temp_ban_button_label = get_translation(user_lang, "temp_ban_player").format(reported_player_name)
+            temp_ban_button_label = texts["temp_ban_player"].format(reported_player_name)
             temp_ban_button = TempBanButton(
                 label=temp_ban_button_label,
-                custom_id=f"temp_ban_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                author_player_id=author_player_id,
-                self_report=self_report
+                custom_id=report_custom_id("temp_ban", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(temp_ban_button)
 
             # Perma-Ban
-            perma_ban_button_label = get_translation(user_lang, "perma_ban_button_label").format(reported_player_name)
+            perma_ban_button_label = texts["perma_ban_button_label"].format(reported_player_name)
             perma_ban_button = PermaBanButton(
                 label=perma_ban_button_label,
-                custom_id=f"perma_ban_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                author_player_id=author_player_id,
-                self_report=self_report
+                custom_id=report_custom_id("perma_ban", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(perma_ban_button)
 
@@ -161,43 +366,146 @@ class Reportview(discord.ui.View):
         # 4) Button: an den MELDER schreiben (nur falls self_report=False)
         #
         if self_report == False:
-            message_player_button_label = get_translation(user_lang, "message_player").format(reported_player_name)
+            message_player_button_label = texts["message_player"].format(reported_player_name)
             message_player_button = MessagePlayerButton(
                 label=message_player_button_label,
-                custom_id=f"message_player_{player_id}",
-                api_client=self.api_client,
-                player_id=player_id,
-                user_lang=user_lang,
-                self_report=self_report
+                custom_id=report_custom_id("message_player", player_id, self.server_name),
+                context=context,
+                player_id=player_id
             )
             self.add_item(message_player_button)
 
+        #
+        # 4b) Sammelnachricht an Squad/Team des Spielers oder an alle Reporter
+        #
+        if player_found:
+            self.add_item(BroadcastButton(
+                custom_id=report_custom_id("broadcast", player_id, self.server_name),
+                context=context,
+                player_ids=[player_id]
+            ))
+
         #
         # 5) Unjustified (Report unbegründet)
         #
-        unjustified_report_button = Unjustified_Report(
-            author_name, 
-            author_player_id, 
-            user_lang, 
-            self.api_client
-        )
+        unjustified_report_button = Unjustified_Report(context)
         self.add_item(unjustified_report_button)
 
         #
         # 6) Müll / Falschreport
         #
-        no_action_button = No_Action_Button(user_lang, self.api_client)
+        no_action_button = No_Action_Button(context)
         self.add_item(no_action_button)
 
         #
         # 7) Logs-Button -> Nur sinnvoll, wenn wir tatsächlich einen Spieler gefunden haben
         #
         if player_found:
-            show_logs_buttonobj = Show_logs_button(self, reported_player_name, custom_id="logs", user_lang=user_lang)
+            show_logs_buttonobj = Show_logs_button(context, reported_player_name, custom_id="logs")
             self.add_item(show_logs_buttonobj)
 
         #
         # 8) Manuelle Bearbeitung
         #
-        manual_process_button = Manual_process(user_lang, self.api_client)
-        self.add_item(manual_process_button)
\ No newline at end of file
+        manual_process_button = Manual_process(context)
+        self.add_item(manual_process_button)
+
+        #
+        # 9) Alternative Spieler (nur bei mehrdeutigem Treffer)
+        #
+        if alternatives and on_alternative_selected:
+            self.add_item(AlternativePlayerSelect(user_lang, alternatives, on_alternative_selected))
+
+    async def add_unit_buttons(self, user_lang, players, author_name=None, author_player_id=None):
+        """
+        Buttons für mehrere Spieler einer Einheit: pro Spieler eine Zeile mit
+        Nachricht/Punish/Kick/Temp-Ban/Perma-Ban (max. 4 Spieler), in der letzten Zeile
+        die Buttons für den Report selbst.
+        """
+        if author_name is None:
+            author_name = get_author_name()
+        if author_player_id is None:
+            author_player_id = await get_playerid_from_name(author_name, self.api_client)
+        self.add_unit_player_buttons(user_lang, players, author_name, author_player_id)
+
+    def add_unit_player_buttons(self, user_lang, players, author_name, author_player_id):
+        """Buttons eines Unit-Reports aufbauen, Reporter-ID bereits bekannt (keine CRCON-Abfragen)."""
+        texts = translations.bundle(user_lang)
+        self.context = context = ReportContext(self.api_client, user_lang, texts, author_name, author_player_id, False)
+        self.state = {
+            "kind": "unit",
+            "server": self.server_name,
+            "lang": user_lang,
+            "players": [[player.player_id, player.name] for player in players[:4]],
+            "author_name": author_name,
+            "author_player_id": author_player_id,
+        }
+
+        for row, player in enumerate(players[:4]):
+            player_id = player.player_id
+            buttons = [
+                MessageReportedPlayerButton(
+                    label=texts["message_reported_player"].format(player.name),
+                    custom_id=report_custom_id("message_reported_player", player_id, self.server_name),
+                    context=context,
+                    player_id=player_id
+                ),
+                PunishButton(
+                    label=texts["punish_button_label"].format(player.name),
+                    custom_id=report_custom_id("punish", player_id, self.server_name),
+                    context=context,
+                    player_id=player_id
+                ),
+                KickButton(
+                    label=texts["kick_player"],
+                    custom_id=report_custom_id("kick", player_id, self.server_name),
+                    context=context,
+                    player_id=player_id
+                ),
+                TempBanButton(
+                    label=texts["temp_ban_player"].format(player.name),
+                    custom_id=report_custom_id("temp_ban", player_id, self.server_name),
+                    context=context,
+                    player_id=player_id
+                ),
+                PermaBanButton(
+                    label=texts["perma_ban_button_label"].format(player.name),
+                    custom_id=report_custom_id("perma_ban", player_id, self.server_name),
+                    context=context,
+                    player_id=player_id
+                ),
+            ]
+            for button in buttons:
+                button.row = row
+                self.add_item(button)
+
+        common_row = min(len(players), 4)
+        buttons = [
+            MessagePlayerButton(
+                label=texts["message_player"],
+                custom_id=report_custom_id("message_player", players[0].player_id, self.server_name),
+                context=context,
+                player_id=players[0].player_id
+            ),
+            Unjustified_Report(context),
+            No_Action_Button(context),
+            Manual_process(context),
+        ]
+        if len(players) > 1:
+            buttons.append(BatchActionButton(
+                custom_id=report_custom_id("batch_action", players[0].player_id, self.server_name),
+                context=context,
+                players=[(player.player_id, player.name) for player in players[:4]]
+            ))
+        for button in buttons:
+            button.row = common_row
+            self.add_item(button)
+        # Die Reihe mit den Report-Buttons ist voll; Discord erlaubt nur 5 Reihen
+        if common_row < 4:
+            broadcast_button = BroadcastButton(
+                custom_id=report_custom_id("broadcast", players[0].player_id, self.server_name),
+                context=context,
+                player_ids=[player.player_id for player in players[:4]]
+            )
+            broadcast_button.row = common_row + 1
+            self.add_item(broadcast_button)
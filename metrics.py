@@ -0,0 +1,213 @@
+import bisect
+import logging
+import time
+
+import aiohttp
+from aiohttp import web
+
+# Sekunden; deckt Matching (ms) bis langsame CRCON-Antworten ab
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+def _escape(value):
+    return str(value).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+
+def _format_labels(labelnames, labels, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(labelnames, labels)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """Monoton steigender Zähler, ein Wert pro Label-Kombination."""
+    kind = "counter"
+
+    def __init__(self, name, documentation, labelnames=()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.values = {}
+
+    def inc(self, *labels, amount=1):
+        self.values[labels] = self.values.get(labels, 0) + amount
+
+    def render(self):
+        for labels, value in self.values.items():
+            yield f"{self.name}{_format_labels(self.labelnames, labels)} {value}"
+
+
+class Histogram:
+    """Verteilung (z.B. Latenzen) mit festen Buckets; observe() ist eine Binärsuche und drei Additionen."""
+    kind = "histogram"
+
+    def __init__(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(buckets)
+        self.values = {}  # labels -> [Zähler pro Bucket (+Inf zuletzt), Summe]
+
+    def observe(self, value, *labels):
+        entry = self.values.get(labels)
+        if entry is None:
+            entry = self.values[labels] = [[0] * (len(self.buckets) + 1), 0.0]
+        entry[0][bisect.bisect_left(self.buckets, value)] += 1
+        entry[1] += value
+
+    def render(self):
+        for labels, (counts, total) in self.values.items():
+            cumulative = 0
+            for bound, count in zip(self.buckets + ("+Inf",), counts):
+                cumulative += count
+                le = f'le="{bound}"'
+                yield f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}"
+            yield f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total}"
+            yield f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}"
+
+
+class CallbackMetric:
+    """Wert, der erst beim Abruf ermittelt wird (Queue-Tiefe, aktive Views, ...)."""
+    def __init__(self, name, documentation, func, kind="gauge"):
+        self.name = name
+        self.documentation = documentation
+        self.func = func
+        self.kind = kind
+
+    def render(self):
+        try:
+            yield f"{self.name} {self.func()}"
+        except Exception as e:
+            logging.error(f"Metric {self.name} failed: {e}")
+
+
+class MetricsRegistry:
+    """
+    Alle Metriken des Bots im Prometheus-Textformat. Zählen kostet nur Dict-Zugriffe im
+    Event-Loop, die Messung bleibt deshalb immer an; der HTTP-Endpunkt ist optional.
+    """
+    def __init__(self):
+        self.metrics = {}
+        self.runner = None
+
+    def _register(self, metric):
+        self.metrics[metric.name] = metric
+        return metric
+
+    def counter(self, name, documentation, labelnames=()):
+        return self._register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name, documentation, labelnames=(), buckets=DEFAULT_BUCKETS):
+        return self._register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback(self, name, documentation, func, kind="gauge"):
+        """Wert per Funktion; eine erneute Registrierung unter demselben Namen ersetzt die alte."""
+        return self._register(CallbackMetric(name, documentation, func, kind))
+
+    def render(self):
+        lines = []
+        for metric in self.metrics.values():
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+    async def handle_metrics(self, request):
+        return web.Response(text=self.render(), content_type="text/plain", charset="utf-8",
+                            headers={"X-Content-Type-Options": "nosniff"})
+
+    async def start(self, host, port):
+        app = web.Application()
+        app.router.add_get('/metrics', self.handle_metrics)
+        self.runner = web.AppRunner(app, access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+        logging.info(f"Metrics endpoint listening on http://{host}:{port}/metrics")
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+
+registry = MetricsRegistry()
+
+REPORTS_RECEIVED = registry.counter(
+    "reports_received_total", "Report messages by server and classified type", ("server", "type"))
+REPORTS_PROCESSED = registry.counter(
+    "reports_processed_total", "Reports handled by the queue workers", ("server", "handler", "result"))
+REPORT_PROCESSING_SECONDS = registry.histogram(
+    "report_processing_seconds", "Time a worker spent on a report", ("handler",))
+REPORT_QUEUE_WAIT_SECONDS = registry.histogram(
+    "report_queue_wait_seconds", "Time a report waited in the queue before a worker picked it up")
+MATCH_SECONDS = registry.histogram(
+    "player_match_seconds", "Ranking the roster against the reported names (rank_player_matches) in respond_player",
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1))
+CRCON_REQUESTS = registry.counter(
+    "crcon_requests_total", "CRCON API requests by endpoint and HTTP status ('error' = no response)",
+    ("server", "endpoint", "status"))
+CRCON_REQUEST_SECONDS = registry.histogram(
+    "crcon_request_seconds", "CRCON API request latency", ("server", "endpoint"))
+CRCON_JSON_DECODE_SECONDS = registry.histogram(
+    "crcon_json_decode_seconds", "JSON decoding of CRCON responses by endpoint", ("endpoint",),
+    buckets=(0.0001, 0.00025, 0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1))
+DISCORD_REQUESTS = registry.counter(
+    "discord_requests_total", "Discord API requests by resource and HTTP status", ("method", "resource", "status"))
+DISCORD_REQUEST_SECONDS = registry.histogram(
+    "discord_request_seconds", "Discord API request latency", ("resource",))
+CACHE_REQUESTS = registry.counter(
+    "cache_requests_total", "Cache lookups by cache and result (hit/miss)", ("cache", "result"))
+
+
+def _trace_config(on_end, on_error):
+    """aiohttp-TraceConfig, die Dauer und Status jeder Anfrage einer Session meldet."""
+    async def on_request_start(session, context, params):
+        context.started = time.perf_counter()
+
+    async def on_request_end(session, context, params):
+        on_end(params.method, params.url, params.response.status, time.perf_counter() - context.started)
+
+    async def on_request_exception(session, context, params):
+        on_error(params.method, params.url, time.perf_counter() - context.started)
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
+
+
+def crcon_trace_config(server_name):
+    """Für die Session eines APIClients: Endpunkt = URL-Pfad ohne Query (z.B. /api/get_players)."""
+    server = server_name or ""
+
+    def on_end(method, url, status, elapsed):
+        CRCON_REQUESTS.inc(server, url.path, status)
+        CRCON_REQUEST_SECONDS.observe(elapsed, server, url.path)
+
+    def on_error(method, url, elapsed):
+        CRCON_REQUESTS.inc(server, url.path, "error")
+        CRCON_REQUEST_SECONDS.observe(elapsed, server, url.path)
+
+    return _trace_config(on_end, on_error)
+
+
+def _discord_resource(url):
+    # /api/v10/channels/<id>/messages -> channels; IDs würden zu viele Label-Werte erzeugen
+    parts = url.path.split('/')
+    return parts[3] if len(parts) > 3 else url.path
+
+
+def discord_trace_config():
+    def on_end(method, url, status, elapsed):
+        resource = _discord_resource(url)
+        DISCORD_REQUESTS.inc(method, resource, status)
+        DISCORD_REQUEST_SECONDS.observe(elapsed, resource)
+
+    def on_error(method, url, elapsed):
+        resource = _discord_resource(url)
+        DISCORD_REQUESTS.inc(method, resource, "error")
+        DISCORD_REQUEST_SECONDS.observe(elapsed, resource)
+
+    return _trace_config(on_end, on_error)
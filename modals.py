@@ -1,211 +1,137 @@
+import asyncio
+import logging
+import os
 import discord
+from collections import namedtuple
 from discord.ui import Select, Button
 from helpers import (
-    get_translation, get_author_name, add_modlog, add_check_to_messages,
+    get_translation, add_modlog, add_check_to_messages,
     add_emojis_to_messages, only_remove_buttons, get_logs, remove_emojis_to_messages,
-    get_playername
+    get_playername, close_report, record_outcome, translations, queue_player_comment, queue_player_message
 )
 from datetime import datetime, timedelta
+from tracing import traced
 
-class MessageReportedPlayerButton(discord.ui.Button):
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, author_player_id, author_name, self_report):
-        super().__init__(style=discord.ButtonStyle.grey, label=label, custom_id=custom_id)
-        self.api_client = api_client
-        self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_player_id = author_player_id
-        self.author_name = author_name
-        self.self_report = self_report
-
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        view = ReasonSelect(
-            user_lang=self.user_lang,
-            api_client=self.api_client,
-            player_id=self.player_id,
-            action="Message",
-            author_player_id=self.author_player_id,
-            author_name=self.author_name,
-            original_report_message=interaction.message,
-            self_report=self.self_report
-        )
-        await view.initialize_view()
-        await interaction.followup.send(
-            get_translation(self.user_lang, "message_placeholder"),
-            view=view,
-            ephemeral=True
-        )
+# Höchstens so viele CRCON-Aufrufe gleichzeitig bei einer Aktion oder Nachricht für mehrere Spieler
+BATCH_ACTION_CONCURRENCY = int(os.getenv('BATCH_ACTION_CONCURRENCY', 4))
 
-class PunishButton(discord.ui.Button):
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, author_player_id, self_report):
-        super().__init__(style=discord.ButtonStyle.blurple, label=label, custom_id=custom_id)
-        self.api_client = api_client
-        self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_player_id = author_player_id
-        self.self_report = self_report
+# Unveränderlicher Kontext eines Reports: einmal pro Report erzeugt und von der View und
+# allen Buttons/Folge-Dialogen gemeinsam benutzt, statt die Werte in jedes Objekt zu kopieren
+ReportContext = namedtuple(
+    "ReportContext", ["api_client", "user_lang", "texts", "author_name", "author_player_id", "self_report"]
+)
 
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        view = ReasonSelect(
-            user_lang=self.user_lang,
-            api_client=self.api_client,
-            player_id=self.player_id,
-            action="Punish",
-            author_player_id=self.author_player_id,
-            author_name=get_author_name(),
-            original_report_message=interaction.message,
-            self_report=self.self_report
-        )
-        await view.initialize_view()
-        await interaction.followup.send(
-            get_translation(self.user_lang, "select_reason"),
-            view=view,
-            ephemeral=True
-        )
+class ReasonActionButton(discord.ui.Button):
+    """
+    Basis für Buttons, die zuerst einen Grund/eine Nachricht abfragen (ReasonSelect)
+    und danach die Aktion gegen player_id ausführen.
+    """
+    action = None
+    button_style = discord.ButtonStyle.green
+    placeholder_key = "select_reason"
 
-class KickButton(discord.ui.Button):
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, author_player_id, author_name, self_report):
-        super().__init__(style=discord.ButtonStyle.green, label=label, custom_id=custom_id)
-        self.api_client = api_client
+    def __init__(self, label: str, custom_id: str, context, player_id):
+        super().__init__(style=self.button_style, label=label, custom_id=custom_id)
+        self.context = context
         self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_player_id = author_player_id
-        self.author_name = author_name
-        self.self_report = self_report
 
+    @traced("button.reason_action")
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
         view = ReasonSelect(
-            user_lang=self.user_lang,
-            api_client=self.api_client,
+            context=self.context,
             player_id=self.player_id,
-            action="Kick",
-            author_player_id=self.author_player_id,
-            author_name=self.author_name,
-            original_report_message=interaction.message,
-            self_report=self.self_report
+            action=self.action,
+            original_report_message=interaction.message
         )
-        await view.initialize_view()
+        await view.initialize_view(interaction.client.report_store)
         await interaction.followup.send(
-            get_translation(self.user_lang, "select_kick_reason"),
+            self.context.texts[self.placeholder_key],
             view=view,
             ephemeral=True
         )
 
-class TempBanButton(discord.ui.Button):
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, author_player_id, self_report):
-        super().__init__(style=discord.ButtonStyle.green, label=label, custom_id=custom_id)
-        self.api_client = api_client
-        self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_player_id = author_player_id
-        self.self_report = self_report
+class MessageReportedPlayerButton(ReasonActionButton):
+    action = "Message"
+    button_style = discord.ButtonStyle.grey
+    placeholder_key = "message_placeholder"
 
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        view = ReasonSelect(
-            user_lang=self.user_lang,
-            api_client=self.api_client,
-            player_id=self.player_id,
-            action="Temp-Ban",
-            author_player_id=self.author_player_id,
-            author_name=get_author_name(),
-            original_report_message=interaction.message,
-            self_report=self.self_report
-        )
-        await view.initialize_view()
-        await interaction.followup.send(
-            get_translation(self.user_lang, "select_reason"),
-            view=view,
-            ephemeral=True
-        )
+class PunishButton(ReasonActionButton):
+    action = "Punish"
+    button_style = discord.ButtonStyle.blurple
 
-class PermaBanButton(discord.ui.Button):
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, author_player_id, self_report):
-        super().__init__(style=discord.ButtonStyle.red, label=label, custom_id=custom_id)
-        self.api_client = api_client
-        self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_player_id = author_player_id
-        self.self_report = self_report
+class KickButton(ReasonActionButton):
+    action = "Kick"
+    placeholder_key = "select_kick_reason"
 
-    async def callback(self, interaction: discord.Interaction):
-        await interaction.response.defer(ephemeral=True)
-        view = ReasonSelect(
-            user_lang=self.user_lang,
-            api_client=self.api_client,
-            player_id=self.player_id,
-            action="Perma-Ban",
-            author_player_id=self.author_player_id,
-            author_name=get_author_name(),
-            original_report_message=interaction.message,
-            self_report=self.self_report
-        )
-        await view.initialize_view()
-        await interaction.followup.send(
-            get_translation(self.user_lang, "select_reason"),
-            view=view,
-            ephemeral=True
-        )
+class TempBanButton(ReasonActionButton):
+    action = "Temp-Ban"
+
+class PermaBanButton(ReasonActionButton):
+    action = "Perma-Ban"
+    button_style = discord.ButtonStyle.red
 
 class MessagePlayerModal(discord.ui.Modal):
     """
     Modal zum direkten Schreiben an einen Spieler
     (wird über den MessagePlayerButton aufgerufen).
     """
-    def __init__(self, title: str, api_client, player_id, user_lang, author_name, self_report):
-        super().__init__(title=get_translation(user_lang, "message_player_modal_title").format(author_name))
-        self.api_client = api_client
+    def __init__(self, context, player_id):
+        super().__init__(
+            title=context.texts["message_player_modal_title"].format(context.author_name)
+        )
+        self.context = context
         self.player_id = player_id
-        self.user_lang = user_lang
-        self.author_name = author_name
-        self.self_report = self_report
 
         self.message = discord.ui.TextInput(
-            label=get_translation(user_lang, "message_label"),
-            placeholder=get_translation(user_lang, "message_placeholder"),
+            label=context.texts["message_label"],
+            placeholder=context.texts["message_placeholder"],
             style=discord.TextStyle.long,
             required=True,
             max_length=300
         )
         self.add_item(self.message)
 
+    @traced("modal.message_player")
     async def on_submit(self, interaction: discord.Interaction):
+        api_client = self.context.api_client
+        user_lang = self.context.user_lang
+        texts = self.context.texts
+        author_name = self.context.author_name
         message_content = self.message.value
-        players_data = await self.api_client.get_players()
-        if players_data and 'result' in players_data:
-            players_list = players_data['result']
-            # author_name => aus self.author_name
-            author_player = next((p for p in players_list if p['name'].lower() == self.author_name.lower()), None)
+        players_list = await api_client.get_players()
+        if players_list is not None:
+            # author_name => aus dem Report-Kontext
+            author_name_lower = author_name.lower()
+            author_player = next((p for p in players_list if p.name_lower == author_name_lower), None)
             if author_player:
                 # Player ID des Autors
-                player_id = author_player['player_id']
-                success = await self.api_client.do_message_player(self.author_name, player_id, message_content)
+                player_id = author_player.player_id
+                success = await api_client.do_message_player(author_name, player_id, message_content)
 
                 if success:
-                    confirmation_message = get_translation(self.user_lang, "message_sent_successfully").format(
-                        self.author_name, message_content
+                    confirmation_message = texts["message_sent_successfully"].format(
+                        author_name, message_content
                     )
                 else:
-                    confirmation_message = get_translation(self.user_lang, "error_sending_message")
+                    confirmation_message = texts["error_sending_message"]
 
                 await interaction.response.send_message(confirmation_message, ephemeral=True)
-                modlog = get_translation(self.user_lang, "log_message").format(
-                    interaction.user.display_name, self.author_name, message_content
+                modlog = texts["log_message"].format(
+                    interaction.user.display_name, author_name, message_content
                 )
-                await add_modlog(interaction, modlog, player_id, self.user_lang, self.api_client)
+                await add_modlog(interaction, modlog, player_id, user_lang, api_client)
                 await add_check_to_messages(interaction)
             else:
                 await interaction.response.send_message(
-                    get_translation(self.user_lang, "author_name_not_found"),
+                    texts["author_name_not_found"],
                     ephemeral=True
                 )
                 await add_emojis_to_messages(interaction)
                 await only_remove_buttons(interaction)
         else:
             await interaction.response.send_message(
-                get_translation(self.user_lang, "error_retrieving_players"),
+                texts["error_retrieving_players"],
                 ephemeral=True
             )
             await add_emojis_to_messages(interaction)
@@ -213,134 +139,163 @@ class MessagePlayerModal(discord.ui.Modal):
 
 class MessagePlayerButton(discord.ui.Button):
     """Button, der direkt ein Modal öffnet, um eine Nachricht an den Spieler zu schreiben."""
-    def __init__(self, label: str, custom_id: str, api_client, player_id, user_lang, self_report):
+
+    def __init__(self, label: str, custom_id: str, context, player_id):
         super().__init__(style=discord.ButtonStyle.grey, label=label, custom_id=custom_id)
-        self.api_client = api_client
+        self.context = context
         self.player_id = player_id
-        self.user_lang = user_lang
-        self.self_report = self_report
 
+    @traced("button.message_player")
     async def callback(self, interaction: discord.Interaction):
-        author_name = get_author_name()
-        modal = MessagePlayerModal(
-            get_translation(self.user_lang, "message_player_modal_title"),
-            self.api_client,
-            self.player_id,
-            self.user_lang,
-            author_name,
-            self.self_report
-        )
-        await interaction.response.send_modal(modal)
+        await interaction.response.send_modal(MessagePlayerModal(self.context, self.player_id))
 
 class Unjustified_Report(discord.ui.Button):
-    def __init__(self, author_name, author_id, user_lang, api_client):
+    def __init__(self, context):
         super().__init__(
             style=discord.ButtonStyle.grey,
-            label=get_translation(user_lang, "unjustified_report"),
+            label=context.texts["unjustified_report"],
             custom_id="unjustified_report"
         )
-        self.author_name = author_name
-        self.author_id = author_id
-        self.user_lang = user_lang
-        self.api_client = api_client
+        self.context = context
 
+    @traced("button.unjustified")
     async def callback(self, interaction: discord.Interaction):
+        user_lang = self.context.user_lang
+        texts = self.context.texts
         new_view = discord.ui.View(timeout=None)
         await interaction.message.edit(view=new_view)
+        await close_report(interaction, interaction.message.id)
+        await record_outcome(interaction, "unjustified")
         await add_emojis_to_messages(interaction, '❌')
-        confirm_message = get_translation(self.user_lang, "unjustified_report_acknowledged")
+        confirm_message = texts["unjustified_report_acknowledged"]
         await interaction.response.send_message(confirm_message, ephemeral=True)
 
-        if self.author_id:
-            message_to_send = get_translation(self.user_lang, "report_not_granted")
-            await self.api_client.do_message_player(self.author_name, self.author_id, message_to_send)
-            modlog = get_translation(self.user_lang, "log_unjustified").format(interaction.user.display_name)
-            await add_modlog(interaction, modlog, False, self.user_lang, self.api_client)
+        if self.context.author_player_id:
+            message_to_send = texts["report_not_granted"]
+            await queue_player_message(
+                interaction, self.context.api_client, self.context.author_name, self.context.author_player_id,
+                message_to_send
+            )
+            modlog = texts["log_unjustified"].format(interaction.user.display_name)
+            await add_modlog(interaction, modlog, False, user_lang, self.context.api_client)
 
 class No_Action_Button(discord.ui.Button):
-    def __init__(self, user_lang, api_client):
+    def __init__(self, context):
         super().__init__(
-            label=get_translation(user_lang, "wrong_player_reported"),
+            label=context.texts["wrong_player_reported"],
             style=discord.ButtonStyle.grey,
             custom_id="no_action"
         )
-        self.user_lang = user_lang
-        self.api_client = api_client
+        self.context = context
 
+    @traced("button.no_action")
     async def callback(self, interaction: discord.Interaction):
+        user_lang = self.context.user_lang
+        texts = self.context.texts
         await only_remove_buttons(interaction)
-        modlog = get_translation(self.user_lang, "log_no-action").format(interaction.user.display_name)
-        await add_modlog(interaction, modlog, False, self.user_lang, self.api_client)
-        confirm_message = get_translation(self.user_lang, "no_action_performed")
+        await record_outcome(interaction, "no_action")
+        modlog = texts["log_no-action"].format(interaction.user.display_name)
+        await add_modlog(interaction, modlog, False, user_lang, self.context.api_client)
+        confirm_message = texts["no_action_performed"]
         await interaction.response.send_message(confirm_message, ephemeral=True)
         await add_emojis_to_messages(interaction, '🗑')
 
 class Show_logs_button(discord.ui.Button):
-    def __init__(self, view, player_name, custom_id, user_lang):
+    def __init__(self, context, player_name, custom_id):
         super().__init__(style=discord.ButtonStyle.grey, label="Logs", emoji="📄", custom_id=custom_id)
-        self.api_client = view.api_client
+        self.context = context
         self.player_name = player_name
-        self.msg_view = view
-        self.user_lang = user_lang
 
+    @traced("button.show_logs")
     async def callback(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=True)
-        temp_log_file_path = await get_logs(self.api_client, self.player_name)
+        temp_log_file_path = await get_logs(self.context.api_client, self.player_name)
         if temp_log_file_path is False:
             await interaction.response.send_message(
-                get_translation(self.user_lang, "no_logs_found").format(self.player_name)
+                self.context.texts["no_logs_found"].format(self.player_name)
             )
         else:
-            msg = get_translation(self.user_lang, "logs_for").format(self.player_name)
+            msg = self.context.texts["logs_for"].format(self.player_name)
             await interaction.followup.send(msg, file=discord.File(temp_log_file_path))
         self.disabled = True
         emb = interaction.message.embeds[0]
-        await interaction.message.edit(embed=emb, view=self.msg_view)
+        await interaction.message.edit(embed=emb, view=self.view)
+
+class AlternativePlayerSelect(discord.ui.Select):
+    """
+    Auswahl alternativer Spieler, wenn der Abgleich nicht eindeutig war.
+    on_select(interaction, player) baut den Report für den gewählten Spieler neu auf.
+    """
+
+    def __init__(self, user_lang, alternatives, on_select):
+        options = [
+            discord.SelectOption(label=player.name[:100], value=str(index), description=f"Score {score:.2f}")
+            for index, (score, player) in enumerate(alternatives[:25])
+        ]
+        super().__init__(
+            placeholder=get_translation(user_lang, "select_alternative_player"),
+            min_values=1,
+            max_values=1,
+            options=options,
+            custom_id="alternative_player"
+        )
+        self.alternatives = alternatives
+        self.on_select = on_select
+
+    @traced("select.alternative_player")
+    async def callback(self, interaction: discord.Interaction):
+        _, player = self.alternatives[int(self.values[0])]
+        await self.on_select(interaction, player)
 
 class Manual_process(discord.ui.Button):
-    def __init__(self, user_lang, api_client):
+    def __init__(self, context):
         super().__init__(
-            label=get_translation(user_lang, "button_manual_process"),
+            label=context.texts["button_manual_process"],
             style=discord.ButtonStyle.grey,
             custom_id="manual_process"
         )
-        self.user_lang = user_lang
-        self.api_client = api_client
+        self.context = context
 
+    @traced("button.manual")
     async def callback(self, interaction: discord.Interaction):
-        view = Finish_Report_Button(user_lang=self.user_lang, api_client=self.api_client)
-        modlog = get_translation(self.user_lang, "log_manual").format(interaction.user.display_name)
+        user_lang = self.context.user_lang
+        texts = self.context.texts
+        view = Finish_Report_Button(user_lang=user_lang, api_client=self.context.api_client)
+        modlog = texts["log_manual"].format(interaction.user.display_name)
+        # Report-View durch den Abschluss-Button ersetzen (alte View wird dabei gestoppt)
+        interaction.client.view_registry.register(interaction.message.id, view)
         await interaction.message.edit(view=view)
-        await add_modlog(interaction, modlog, False, self.user_lang, self.api_client, delete_buttons=False)
-        confirm_message = get_translation(self.user_lang, "manual_process_respond")
+        # Nach einem Neustart den Abschluss-Button statt der Report-Buttons wiederherstellen
+        await interaction.client.report_store.set_kind(interaction.message.id, "finish")
+        await record_outcome(interaction, "manual")
+        await add_modlog(interaction, modlog, False, user_lang, self.context.api_client, delete_buttons=False)
+        confirm_message = texts["manual_process_respond"]
         await interaction.response.send_message(confirm_message, ephemeral=True)
         await add_emojis_to_messages(interaction, '👀')
 
 class Finish_Report_Button(discord.ui.View):
     def __init__(self, user_lang, api_client):
-        super().__init__(timeout=3600)
+        # Persistent (kein Timeout), wird beim Start aus dem ReportStore wieder registriert
+        super().__init__(timeout=None)
         self.user_lang = user_lang
+        self.texts = translations.bundle(user_lang)
         self.api_client = api_client
         self.message = None
         self.add_buttons()
 
-    async def on_timeout(self) -> None:
-        for item in self.children:
-            item.disabled = True
-        if self.message:
-            await self.message.edit(view=self)
-
     def add_buttons(self):
-        button_label = get_translation(self.user_lang, "report_finished")
+        button_label = self.texts["report_finished"]
         button = Button(label=button_label, style=discord.ButtonStyle.green, custom_id="finished_processing")
         button.callback = self.button_callback
         self.add_item(button)
 
+    @traced("button.finish")
     async def button_callback(self, interaction: discord.Interaction):
         await add_check_to_messages(interaction)
         await only_remove_buttons(interaction)
         await remove_emojis_to_messages(interaction, "👀")
-        logmessage = get_translation(self.user_lang, "has_finished_report").format(interaction.user.display_name)
+        await record_outcome(interaction, "finished")
+        logmessage = self.texts["has_finished_report"].format(interaction.user.display_name)
         await add_modlog(
             interaction,
             logmessage,
@@ -355,25 +310,23 @@ class ReasonSelect(discord.ui.View):
     Zeigt ein Select-Menü an. Entscheidet je nach self.action, ob wir "MESSAGE" oder "REASON" verwenden.
     Anschließend öffnet sich ein Modal zum Bestätigen/Anpassen des Textes.
     """
-    def __init__(self, user_lang, api_client, player_id, action, author_player_id, author_name, original_report_message,
-                 self_report):
+
+    def __init__(self, context, player_id, action, original_report_message):
         super().__init__(timeout=600)
-        self.user_lang = user_lang
-        self.api_client = api_client
+        self.context = context
         self.player_id = player_id
         self.reasons = []
         self.action = action
-        self.author_player_id = author_player_id
-        self.author_name = author_name
         self.player_name = ""
         self.reason = ""
         self.original_report_message = original_report_message
-        self.self_report = self_report
 
-    async def initialize_view(self):
-        select_label = get_translation(self.user_lang, "select_reason")
+    async def initialize_view(self, report_store=None):
+        texts = self.context.texts
+        api_client = self.context.api_client
+        select_label = texts["select_reason"]
         # 1) Templates vom neuen Endpunkt holen
-        templates = await self.api_client.get_all_message_templates()
+        templates = await api_client.get_all_message_templates()
         # 2) Je nach Aktion entweder "MESSAGE" oder "REASON" wählen
         if self.action == "Message":
             all_entries = templates.get("MESSAGE", [])
@@ -381,14 +334,18 @@ class ReasonSelect(discord.ui.View):
             # Für Kick, Temp-Ban, Perma-Ban, Punish => REASON
             all_entries = templates.get("REASON", [])
         self.reasons = all_entries
-        self.player_name = await get_playername(self.player_id, self.api_client)
+        # Spielername aus dem lokalen Report-Store, nur falls unbekannt über CRCON
+        if report_store is not None:
+            self.player_name = await report_store.get_player_name(self.original_report_message.id, self.player_id)
+        if not self.player_name:
+            self.player_name = await get_playername(self.player_id, api_client)
         selectinst = Select(placeholder=select_label)
         selectinst.min_values = 1
         selectinst.max_values = 1
         options = []
         # Option für "eigene Reason" oder "eigene Nachricht"
         options.append(discord.SelectOption(
-            label=get_translation(self.user_lang, "own_reason"),
+            label=texts["own_reason"],
             value="empty"
         ))
         entries = 0
@@ -404,6 +361,7 @@ class ReasonSelect(discord.ui.View):
         selectinst.callback = self.callback
         self.add_item(selectinst)
 
+    @traced("select.reason")
     async def callback(self, interaction):
         value = interaction.data["values"][0]
         if value != "empty":
@@ -412,17 +370,18 @@ class ReasonSelect(discord.ui.View):
             reason_text = reason_obj.get("content", "")
         else:
             reason_text = "empty"
+        texts = self.context.texts
         # Passenden Titel je nach Aktion
         if self.action == "Message":
-            title = get_translation(self.user_lang, "message_player_modal_title").format(self.player_name)
+            title = texts["message_player_modal_title"].format(self.player_name)
         elif self.action == "Punish":
-            title = get_translation(self.user_lang, "punish_name_player").format(self.player_name)
+            title = texts["punish_name_player"].format(self.player_name)
         elif self.action == "Kick":
-            title = get_translation(self.user_lang, "kick_name_player").format(self.player_name)
+            title = texts["kick_name_player"].format(self.player_name)
         elif self.action == "Temp-Ban":
-            title = get_translation(self.user_lang, "tempban_name_player").format(self.player_name)
+            title = texts["tempban_name_player"].format(self.player_name)
         elif self.action == "Perma-Ban":
-            title = get_translation(self.user_lang, "perma_name_player").format(self.player_name)
+            title = texts["perma_name_player"].format(self.player_name)
         else:
             title = "Reason Input"
         await interaction.response.send_modal(
@@ -430,13 +389,9 @@ class ReasonSelect(discord.ui.View):
                 reason_text,
                 self.action,
                 self.player_id,
-                self.user_lang,
-                self.api_client,
+                self.context,
                 self.player_name,
-                self.author_player_id,
-                self.author_name,
                 self.original_report_message,
-                self.self_report,
                 title=title
             )
         )
@@ -447,31 +402,27 @@ class ReasonInput(discord.ui.Modal):
     Bei Temp-Ban zusätzlich ein Feld für die Dauer.
     """
     def __init__(
-        self, reason_text, action, player_id, user_lang, api_client, player_name, author_player_id,
-        author_name, original_report_message, self_report, *args, **kwargs
+        self, reason_text, action, player_id, context, player_name, original_report_message, *args, **kwargs
     ) -> None:
         super().__init__(timeout=600, custom_id="reason_input", *args, **kwargs)
-        self.user_lang = user_lang
-        self.api_client = api_client
+        self.context = context
+        texts = context.texts
         self.player_id = player_id
         self.player_name = player_name
         self.action = action
-        self.author_player_id = author_player_id
-        self.author_name = author_name
         self.original_report_message = original_report_message
-        self.self_report = self_report
 
         # TextInput für den Grund / die Nachricht
         if reason_text != "empty":
             self.add_item(discord.ui.TextInput(
-                label=get_translation(self.user_lang, "input_reason"),
+                label=texts["input_reason"],
                 style=discord.TextStyle.long,
                 default=reason_text,
                 max_length=300
             ))
         else:
             self.add_item(discord.ui.TextInput(
-                label=get_translation(self.user_lang, "input_reason"),
+                label=texts["input_reason"],
                 style=discord.TextStyle.long,
                 default="_",
                 max_length=300
@@ -479,36 +430,38 @@ class ReasonInput(discord.ui.Modal):
         # Falls "Temp-Ban", ein weiteres Feld für die Dauer
         if action == "Temp-Ban":
             self.add_item(discord.ui.TextInput(
-                label=get_translation(user_lang, "temp_ban_duration_label"),
-                placeholder=get_translation(user_lang, "temp_ban_duration_placeholder"),
+                label=texts["temp_ban_duration_label"],
+                placeholder=texts["temp_ban_duration_placeholder"],
                 style=discord.TextStyle.short,
                 max_length=5
             ))
 
+    @traced("modal.reason")
     async def on_submit(self, interaction: discord.Interaction):
         self.reason = self.children[0].value
+        texts = self.context.texts
         duration = 0
 
         if self.action == "Temp-Ban":
             duration = self.children[1].value
 
         description = (
-            get_translation(self.user_lang, "player_name").format(self.player_name) + "\n" +
-            get_translation(self.user_lang, "steam_id") + f": `{self.player_id}`\n" +
-            get_translation(self.user_lang, "action").format(self.action) + "\n"
+            texts["player_name"].format(self.player_name) + "\n" +
+            texts["steam_id"] + f": `{self.player_id}`\n" +
+            texts["action"].format(self.action) + "\n"
         )
         if self.action == "Temp-Ban":
             description += (
-                get_translation(self.user_lang, "temp_ban_duration_label") +
+                texts["temp_ban_duration_label"] +
                 f": `{duration}`\n"
             )
         description += (
-            get_translation(self.user_lang, "reason") + f": `{self.reason}`\n\n" +
-            get_translation(self.user_lang, "discard_hint")
+            texts["reason"] + f": `{self.reason}`\n\n" +
+            texts["discard_hint"]
         )
 
         embed = discord.Embed(
-            title=get_translation(self.user_lang, "confirm_action"),
+            title=texts["confirm_action"],
             description=description,
             color=discord.Colour.red()
         )
@@ -519,16 +472,12 @@ class ReasonInput(discord.ui.Modal):
                 embeds=[embed],
                 ephemeral=True,
                 view=Confirm_Action_Button(
-                    self.user_lang,
-                    self.api_client,
+                    self.context,
                     self.player_id,
                     self.player_name,
                     self.action,
                     self.reason,
-                    self.author_player_id,
-                    self.author_name,
                     self.original_report_message,
-                    self.self_report,
                     duration
                 )
             )
@@ -539,13 +488,9 @@ class ReasonInput(discord.ui.Modal):
                 self.reason,
                 self.player_name,
                 self.player_id,
-                self.author_name,
-                self.author_player_id,
+                self.context,
                 self.original_report_message,
-                self.user_lang,
-                self.api_client,
                 interaction,
-                self.self_report,
                 duration
             )
         elif self.action == "Perma-Ban":
@@ -553,16 +498,12 @@ class ReasonInput(discord.ui.Modal):
                 embeds=[embed],
                 ephemeral=True,
                 view=Confirm_Action_Button(
-                    self.user_lang,
-                    self.api_client,
+                    self.context,
                     self.player_id,
                     self.player_name,
                     self.action,
                     self.reason,
-                    self.author_player_id,
-                    self.author_name,
-                    self.original_report_message,
-                    self.self_report
+                    self.original_report_message
                 )
             )
         else:
@@ -573,47 +514,33 @@ class ReasonInput(discord.ui.Modal):
                 self.reason,
                 self.player_name,
                 self.player_id,
-                self.author_name,
-                self.author_player_id,
+                self.context,
                 self.original_report_message,
-                self.user_lang,
-                self.api_client,
-                interaction,
-                self.self_report
+                interaction
             )
 
 class Confirm_Action_Button(discord.ui.View):
     """Button, um Temp-Ban >72h oder Perma-Ban endgültig zu bestätigen."""
-    def __init__(
-        self, user_lang, api_client, player_id, player_name, action, reason,
-        author_player_id, author_name, original_report_message, self_report, duration=0
-    ):
-        super().__init__(timeout=3600)
-        self.user_lang = user_lang
-        self.api_client = api_client
+
+    def __init__(self, context, player_id, player_name, action, reason, original_report_message, duration=0):
+        # Gleiche Lebensdauer wie ReasonSelect, danach wird die Bestätigung verworfen
+        super().__init__(timeout=600)
+        self.context = context
         self.player_id = player_id
         self.player_name = player_name
         self.action = action
         self.reason = reason
-        self.author_player_id = author_player_id
-        self.author_name = author_name
         self.duration = duration
-        self.self_report = self_report
         self.original_report_message = original_report_message
         self.add_buttons()
 
-    async def on_timeout(self) -> None:
-        for item in self.children:
-            item.disabled = True
-        if hasattr(self, 'message') and self.message:
-            await self.message.edit(view=self)
-
     def add_buttons(self):
-        button_label = get_translation(self.user_lang, "confirm")
+        button_label = self.context.texts["confirm"]
         button = Button(label=button_label, style=discord.ButtonStyle.green, custom_id="confirm_action")
         button.callback = self.button_callback
         self.add_item(button)
 
+    @traced("button.confirm")
     async def button_callback(self, interaction: discord.Interaction):
         await interaction.response.defer(ephemeral=False)
         await interaction.edit_original_response(view=None)
@@ -622,122 +549,156 @@ class Confirm_Action_Button(discord.ui.View):
             self.reason,
             self.player_name,
             self.player_id,
-            self.author_name,
-            self.author_player_id,
+            self.context,
             self.original_report_message,
-            self.user_lang,
-            self.api_client,
             interaction,
-            self.self_report,
             self.duration
         )
 
+async def call_action(api_client, action, player_id, player_name, reason, duration=0):
+    """Eine Aktion über CRCON gegen einen Spieler ausführen. True bei Erfolg."""
+    if action == "Message":
+        return bool(await api_client.do_message_player(player_name, player_id, reason))
+    if action == "Punish":
+        return await api_client.do_punish(player_id, player_name, reason)
+    if action == "Kick":
+        return await api_client.do_kick(player_name, player_id, reason)
+    if action == "Temp-Ban":
+        expires_at = (datetime.utcnow() + timedelta(hours=int(duration))).strftime("%Y-%m-%dT%H:%M")
+        return await api_client.add_blacklist_record(player_id, reason, expires_at)
+    if action == "Perma-Ban":
+        return await api_client.add_blacklist_record(player_id, reason)
+    raise ValueError(f"Unknown action {action}")
+
+async def call_action_once(client, api_client, action, player_id, player_name, reason, duration=0):
+    """
+    call_action über die ActionRegistry des Bots: (Erfolg, True), bzw. (Ergebnis der schon laufenden
+    oder eben erfolgreichen gleichen Aktion, False), ohne CRCON erneut aufzurufen.
+    """
+    key = (api_client.server_name, player_id, action)
+    if action == "Message":
+        key += (reason,)  # eine andere Nachricht an denselben Spieler ist kein Duplikat
+    return await client.action_registry.run(
+        key, call_action, api_client, action, player_id, player_name, reason, duration
+    )
+
 async def perform_action(
-    action, reason, player_name, player_id, author_name, author_player_id,
-    original_report_message, user_lang, api_client, interaction, self_report, duration=0
+    action, reason, player_name, player_id, context, original_report_message, interaction, duration=0
 ):
+    api_client, user_lang, texts, author_name, author_player_id, self_report = context
     good_result = True
 
+    # Kick und Nachricht brauchen den Spielernamen, ohne ihn wird nichts an CRCON geschickt
+    if player_name or action not in ("Message", "Kick"):
+        success, first = await call_action_once(
+            interaction.client, api_client, action, player_id, player_name, reason, duration
+        )
+        if not first:
+            # Doppelklick oder zweiter Admin: kein zweiter Modlog, Kommentar oder Reporter-Nachricht
+            await interaction.followup.send(texts["action_already_done"].format(action, player_name), ephemeral=True)
+            return
+
     if action == "Message":
         message_content = reason
         if player_name:
-            success = await api_client.do_message_player(player_name, player_id, message_content)
             if success:
-                modlog = get_translation(user_lang, "log_message").format(
+                modlog = texts["log_message"].format(
                     interaction.user.display_name, player_name, message_content,
                     original_message=original_report_message
                 )
-                confirmation_message = get_translation(user_lang, "message_sent_successfully").format(
+                confirmation_message = texts["message_sent_successfully"].format(
                     player_name, message_content
                 )
             else:
                 good_result = False
-                confirmation_message = get_translation(user_lang, "error_sending_message")
+                confirmation_message = texts["error_sending_message"]
 
     elif action == "Punish":
-        success = await api_client.do_punish(player_id, player_name, reason)
         if success:
-            modlog = get_translation(user_lang, "log_punish").format(
+            modlog = texts["log_punish"].format(
                 interaction.user.display_name, player_name, reason,
                 original_message=original_report_message
             )
-            confirmation_message = get_translation(user_lang, "punish_confirmed")
+            confirmation_message = texts["punish_confirmed"]
         else:
-            confirmation_message = get_translation(user_lang, "error_action")
+            confirmation_message = texts["error_action"]
             good_result = False
 
     elif action == "Kick":
         if player_name:
-            success = await api_client.do_kick(player_name, player_id, reason)
             if success:
-                confirmation_message = get_translation(user_lang, "player_kicked_successfully").format(player_name)
-                modlog = get_translation(user_lang, "log_kick").format(
+                confirmation_message = texts["player_kicked_successfully"].format(player_name)
+                modlog = texts["log_kick"].format(
                     interaction.user.display_name,
-                    await get_playername(player_id, api_client),
+                    player_name,
                     reason
                 )
                 if self_report is False:
-                    message_to_author = get_translation(user_lang, "message_to_author_kicked").format(player_name)
-                    await api_client.do_message_player(author_name, author_player_id, message_to_author)
+                    message_to_author = texts["message_to_author_kicked"].format(player_name)
+                    await queue_player_message(interaction, api_client, author_name, author_player_id,
+                                               message_to_author)
             else:
                 good_result = False
-                confirmation_message = get_translation(user_lang, "error_kicking_player")
+                confirmation_message = texts["error_kicking_player"]
         else:
             good_result = False
-            confirmation_message = get_translation(user_lang, "player_name_not_retrieved")
+            confirmation_message = texts["player_name_not_retrieved"]
 
     elif action == "Temp-Ban":
-        expire_time = datetime.utcnow() + timedelta(hours=int(duration))
-        expires_at = expire_time.strftime("%Y-%m-%dT%H:%M")
-        success = await api_client.add_blacklist_record(player_id, reason, expires_at)
         if success:
-            confirmation_message = get_translation(user_lang, "player_temp_banned_successfully").format(
+            confirmation_message = texts["player_temp_banned_successfully"].format(
                 player_name, duration, reason
             )
             if author_player_id and self_report is False:
-                message_to_author = get_translation(user_lang, "message_to_author_temp_banned").format(player_name)
-                await api_client.do_message_player(author_name, author_player_id, message_to_author)
+                message_to_author = texts["message_to_author_temp_banned"].format(player_name)
+                await queue_player_message(interaction, api_client, author_name, author_player_id, message_to_author)
         else:
             good_result = False
-            confirmation_message = get_translation(user_lang, "error_temp_banning_player")
+            confirmation_message = texts["error_temp_banning_player"]
 
-        modlog = get_translation(user_lang, "log_tempban").format(
+        modlog = texts["log_tempban"].format(
             interaction.user.display_name, player_name, duration, reason
         )
 
     elif action == "Perma-Ban":
-        success = await api_client.add_blacklist_record(player_id, reason)
         if success:
-            confirmation_message = get_translation(user_lang, "player_perma_banned_successfully").format(player_name, reason)
-            modlog = get_translation(user_lang, "log_perma").format(
+            confirmation_message = texts["player_perma_banned_successfully"].format(player_name, reason)
+            modlog = texts["log_perma"].format(
                 interaction.user.display_name,
-                await get_playername(player_id, api_client),
+                player_name,
                 reason
             )
             if author_player_id and self_report is False:
-                message_to_author = get_translation(user_lang, "message_to_author_perma_banned").format(player_name)
-                await api_client.do_message_player(author_name, author_player_id, message_to_author)
+                message_to_author = texts["message_to_author_perma_banned"].format(player_name)
+                await queue_player_message(interaction, api_client, author_name, author_player_id, message_to_author)
             
             # Zusätzliche Embed mit den Spielerinformationen als Code-Block:
             # Die Labels für Grund und Beweise werden aus den Translations bezogen.
-            reason_label = get_translation(user_lang, "reason")
-            evidence_label = get_translation(user_lang, "evidence")
+            reason_label = texts["reason"]
+            evidence_label = texts["evidence"]
             code_block = f"```\
 Name: {player_name}\n\
 ID: {player_id}\n\
 {reason_label}: {reason}\n\
 {evidence_label}:\n\
 ```"
-            note = get_translation(user_lang, "hack_let_loose_note")
+            note = texts["hack_let_loose_note"]
             extra_embed = discord.Embed(
-                title=get_translation(user_lang, "banned_player_data_title"),
+                title=texts["banned_player_data_title"],
                 description=f"{code_block}\n{note}",
                 color=discord.Colour.blue()
             )
             await interaction.followup.send(embed=extra_embed)
         else:
             good_result = False
-            confirmation_message = get_translation(user_lang, "error_perma_banning_player")
+            confirmation_message = texts["error_perma_banning_player"]
+
+    report_store = interaction.client.report_store
+    await report_store.record_action(
+        original_report_message.id, api_client.server_name, player_id, action,
+        interaction.user.display_name, reason, good_result
+    )
+    await record_outcome(interaction, action if good_result else "failed", original_report_message.id)
 
     if not good_result:
         await interaction.followup.send(confirmation_message, ephemeral=True)
@@ -751,3 +712,355 @@ ID: {player_id}\n\
                 original_message=original_report_message
             )
         await add_check_to_messages(interaction, original_report_message)
+
+
+BATCH_ACTIONS = ("Message", "Punish", "Kick", "Temp-Ban")
+
+
+class BatchActionButton(discord.ui.Button):
+    """Unit-Report: eine Aktion für mehrere Spieler des Reports gleichzeitig (BatchActionView)."""
+
+    def __init__(self, custom_id, context, players):
+        super().__init__(style=discord.ButtonStyle.blurple, label=context.texts["batch_action_button"],
+                         custom_id=custom_id)
+        self.context = context
+        self.players = players
+
+    @traced("button.batch_action")
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_message(
+            self.context.texts["batch_action_button"],
+            view=BatchActionView(self.context, self.players, interaction.message),
+            ephemeral=True
+        )
+
+
+class BatchActionView(discord.ui.View):
+    """Auswahl der Spieler (vorausgewählt: alle) und der Aktion, danach Grund im BatchReasonInput."""
+
+    def __init__(self, context, players, original_report_message):
+        super().__init__(timeout=600)
+        self.context = context
+        self.players = players
+        self.original_report_message = original_report_message
+        texts = context.texts
+
+        self.player_select = Select(
+            placeholder=texts["batch_select_players"],
+            min_values=1,
+            max_values=len(players),
+            options=[
+                discord.SelectOption(label=name[:100], value=str(index), default=True)
+                for index, (_, name) in enumerate(players)
+            ]
+        )
+        self.action_select = Select(
+            placeholder=texts["batch_select_action"],
+            min_values=1,
+            max_values=1,
+            options=[discord.SelectOption(label=action, value=action) for action in BATCH_ACTIONS]
+        )
+        # Auswahl nur merken, ausgeführt wird erst über "Weiter"
+        self.player_select.callback = self.acknowledge
+        self.action_select.callback = self.acknowledge
+        self.add_item(self.player_select)
+        self.add_item(self.action_select)
+
+        continue_button = Button(label=texts["batch_continue"], style=discord.ButtonStyle.green)
+        continue_button.callback = self.continue_callback
+        self.add_item(continue_button)
+
+    async def acknowledge(self, interaction: discord.Interaction):
+        await interaction.response.defer()
+
+    @traced("button.batch_continue")
+    async def continue_callback(self, interaction: discord.Interaction):
+        if not self.action_select.values:
+            await interaction.response.send_message(self.context.texts["batch_select_action"], ephemeral=True)
+            return
+        indexes = self.player_select.values or [str(index) for index in range(len(self.players))]
+        players = [self.players[int(index)] for index in indexes]
+        await interaction.response.send_modal(
+            BatchReasonInput(self.context, players, self.action_select.values[0], self.original_report_message)
+        )
+
+
+class BatchReasonInput(discord.ui.Modal):
+    """Grund (und bei Temp-Ban die Dauer) für eine Aktion gegen mehrere Spieler."""
+    def __init__(self, context, players, action, original_report_message):
+        texts = context.texts
+        super().__init__(title=texts["batch_title"].format(action, len(players))[:45], timeout=600)
+        self.context = context
+        self.players = players
+        self.action = action
+        self.original_report_message = original_report_message
+        self.reason = discord.ui.TextInput(
+            label=texts["input_reason"],
+            style=discord.TextStyle.long,
+            default="_",
+            max_length=300
+        )
+        self.add_item(self.reason)
+        self.duration = None
+        if action == "Temp-Ban":
+            self.duration = discord.ui.TextInput(
+                label=texts["temp_ban_duration_label"],
+                placeholder=texts["temp_ban_duration_placeholder"],
+                style=discord.TextStyle.short,
+                max_length=5
+            )
+            self.add_item(self.duration)
+
+    @traced("modal.batch_reason")
+    async def on_submit(self, interaction: discord.Interaction):
+        texts = self.context.texts
+        reason = self.reason.value
+        duration = 0
+        if self.duration is not None:
+            if not self.duration.value.strip().isdigit():
+                await interaction.response.send_message(texts["invalid_duration"], ephemeral=True)
+                return
+            duration = int(self.duration.value)
+
+        # Wie bei einzelnen Aktionen: Temp-Ban über 72h muss bestätigt werden
+        if self.action == "Temp-Ban" and duration > 72:
+            description = (
+                texts["batch_players"].format(", ".join(name for _, name in self.players)) + "\n" +
+                texts["action"].format(self.action) + "\n" +
+                texts["temp_ban_duration_label"] + f": `{duration}`\n" +
+                texts["reason"] + f": `{reason}`\n\n" +
+                texts["discard_hint"]
+            )
+            embed = discord.Embed(title=texts["confirm_action"], description=description, color=discord.Colour.red())
+            view = ConfirmBatchView(self.context, self.players, self.action, reason, self.original_report_message,
+                                    duration)
+            await interaction.response.send_message(embeds=[embed], view=view, ephemeral=True)
+            return
+
+        await interaction.response.defer(ephemeral=True)
+        await perform_batch_action(self.action, reason, self.players, self.context, self.original_report_message,
+                                   interaction, duration)
+
+
+class ConfirmBatchView(discord.ui.View):
+    """Bestätigung einer Batch-Aktion (Temp-Ban über 72h)."""
+
+    def __init__(self, context, players, action, reason, original_report_message, duration=0):
+        super().__init__(timeout=600)
+        self.context = context
+        self.players = players
+        self.action = action
+        self.reason = reason
+        self.original_report_message = original_report_message
+        self.duration = duration
+        button = Button(label=context.texts["confirm"], style=discord.ButtonStyle.green)
+        button.callback = self.button_callback
+        self.add_item(button)
+
+    @traced("button.batch_confirm")
+    async def button_callback(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        await interaction.edit_original_response(view=None)
+        await perform_batch_action(self.action, self.reason, self.players, self.context,
+                                   self.original_report_message, interaction, self.duration)
+
+
+async def perform_batch_action(action, reason, players, context, original_report_message, interaction, duration=0):
+    """
+    Aktion gegen mehrere Spieler gleichzeitig ausführen (höchstens BATCH_ACTION_CONCURRENCY CRCON-Aufrufe
+    parallel), danach ein gemeinsames Ergebnis-Embed und ein einziger Modlog-Eintrag.
+    """
+    api_client, user_lang, texts, author_name, author_player_id, self_report = context
+    admin = interaction.user.display_name
+    limit = asyncio.Semaphore(BATCH_ACTION_CONCURRENCY)
+
+    async def run(player_id, player_name):
+        async with limit:
+            try:
+                return await call_action_once(interaction.client, api_client, action, player_id, player_name,
+                                              reason, duration)
+            except Exception as e:
+                logging.error(f"Batch {action} failed for {player_id}: {e}")
+                return False, True
+
+    results = await asyncio.gather(*(run(player_id, player_name) for player_id, player_name in players))
+    # Von einem anderen Admin gerade ausgeführte Aktionen zählen hier weder als Erfolg noch als Fehler
+    succeeded = [(player_id, name) for (player_id, name), (success, first) in zip(players, results)
+                 if success and first]
+    failed = [(player_id, name) for (player_id, name), (success, first) in zip(players, results)
+              if not success and first]
+
+    report_store = interaction.client.report_store
+    for (player_id, _), (success, first) in zip(players, results):
+        if first:
+            await report_store.record_action(original_report_message.id, api_client.server_name, player_id, action,
+                                             admin, reason, success)
+    if succeeded or failed:
+        outcome = action if not failed else ("failed" if not succeeded else "partial")
+        await record_outcome(interaction, outcome, original_report_message.id)
+
+    embed = discord.Embed(
+        title=texts["batch_result_title"].format(action, len(succeeded), len(players)),
+        description="\n".join(
+            f"{('✅' if success else '❌') if first else '⏭️'} {name} (`{player_id}`)"
+            for (player_id, name), (success, first) in zip(players, results)
+        ),
+        color=discord.Colour.green() if not failed else discord.Colour.orange()
+    )
+    await interaction.followup.send(embed=embed, ephemeral=True)
+    if not succeeded and not failed:
+        return  # alles schon von einem anderen Admin erledigt, dessen Modlog genügt
+
+    if succeeded and self_report is False and author_player_id and action in ("Kick", "Temp-Ban"):
+        key = "message_to_author_kicked" if action == "Kick" else "message_to_author_temp_banned"
+        names = ", ".join(name for _, name in succeeded)
+        await queue_player_message(interaction, api_client, author_name, author_player_id, texts[key].format(names))
+
+    modlog = texts["log_batch"].format(admin, action, ", ".join(name for _, name in succeeded) or "-", reason)
+    if failed:
+        modlog += " " + texts["log_batch_failed"].format(", ".join(name for _, name in failed))
+
+    # Spielerkommentare für alle erfolgreichen Spieler, der Modlog selbst nur einmal im Report
+    for player_id, _ in succeeded:
+        await queue_player_comment(interaction, api_client, player_id, modlog)
+    # Bei Fehlschlägen bleiben die Buttons für einen zweiten Versuch stehen
+    await add_modlog(interaction, modlog, False, user_lang, api_client, original_message=original_report_message,
+                     delete_buttons=not failed)
+    if failed:
+        await add_emojis_to_messages(interaction, original_message=original_report_message)
+    else:
+        await add_check_to_messages(interaction, original_report_message)
+
+
+BROADCAST_TARGETS = ("squad", "team", "reporters")
+
+
+class BroadcastButton(discord.ui.Button):
+    """Eine Nachricht an Squad oder Team der gemeldeten Spieler bzw. an alle Reporter (BroadcastView)."""
+
+    def __init__(self, custom_id, context, player_ids):
+        super().__init__(style=discord.ButtonStyle.grey, label=context.texts["broadcast_button"], emoji="📢",
+                         custom_id=custom_id)
+        self.context = context
+        self.player_ids = player_ids
+
+    @traced("button.broadcast")
+    async def callback(self, interaction: discord.Interaction):
+        await interaction.response.send_message(
+            self.context.texts["broadcast_select_target"],
+            view=BroadcastView(self.context, self.player_ids, interaction.message),
+            ephemeral=True
+        )
+
+
+class BroadcastView(discord.ui.View):
+    """Auswahl der Empfänger, danach die Nachricht im BroadcastMessageModal."""
+
+    def __init__(self, context, player_ids, original_report_message):
+        super().__init__(timeout=600)
+        self.context = context
+        self.player_ids = player_ids
+        self.original_report_message = original_report_message
+        target_select = Select(
+            placeholder=context.texts["broadcast_select_target"],
+            min_values=1,
+            max_values=1,
+            options=[
+                discord.SelectOption(label=context.texts[f"broadcast_target_{target}"], value=target)
+                for target in BROADCAST_TARGETS
+            ]
+        )
+        target_select.callback = self.callback
+        self.add_item(target_select)
+
+    @traced("select.broadcast_target")
+    async def callback(self, interaction: discord.Interaction):
+        target = interaction.data["values"][0]
+        await interaction.response.send_modal(
+            BroadcastMessageModal(self.context, self.player_ids, target, self.original_report_message)
+        )
+
+
+class BroadcastMessageModal(discord.ui.Modal):
+    def __init__(self, context, player_ids, target, original_report_message):
+        texts = context.texts
+        super().__init__(title=texts[f"broadcast_target_{target}"][:45], timeout=600)
+        self.context = context
+        self.player_ids = player_ids
+        self.target = target
+        self.original_report_message = original_report_message
+        self.message = discord.ui.TextInput(
+            label=texts["message_label"],
+            placeholder=texts["message_placeholder"],
+            style=discord.TextStyle.long,
+            required=True,
+            max_length=300
+        )
+        self.add_item(self.message)
+
+    @traced("modal.broadcast")
+    async def on_submit(self, interaction: discord.Interaction):
+        await interaction.response.defer(ephemeral=True)
+        await perform_broadcast(self.target, self.message.value, self.player_ids, self.context,
+                                self.original_report_message, interaction)
+
+
+async def broadcast_recipients(target, player_ids, api_client, client, original_report_message):
+    """
+    Empfänger [(player_id, name)] einer Sammelnachricht. Squad und Team ohne die gemeldeten Spieler
+    selbst (für die gibt es eigene Buttons); Reporter ohne gespeicherte ID über den Namensindex des Servers.
+    """
+    roster_cache = client.get_roster_cache(api_client)
+    if target == "reporters":
+        recipients = []
+        for name, player_id in await client.report_store.get_reporters(original_report_message.id):
+            player_id = player_id or await roster_cache.resolve_player_id(name)
+            if player_id:
+                recipients.append((player_id, name))
+        return recipients
+
+    squad_index = await roster_cache.get_squad_index()
+    if squad_index is None:
+        return []
+    lookup = squad_index.squad_of if target == "squad" else squad_index.team_of
+    recipients = {}
+    for player_id in player_ids:
+        for player in lookup(player_id):
+            if player.player_id not in player_ids:
+                recipients[player.player_id] = player.name
+    return list(recipients.items())
+
+
+async def perform_broadcast(target, message, player_ids, context, original_report_message, interaction):
+    """Sammelnachricht senden, Zustellung pro Empfänger melden und einen Modlog-Eintrag schreiben."""
+    api_client, user_lang, texts = context.api_client, context.user_lang, context.texts
+    target_label = texts[f"broadcast_target_{target}"]
+    recipients = await broadcast_recipients(target, player_ids, api_client, interaction.client,
+                                            original_report_message)
+    if not recipients:
+        await interaction.followup.send(texts["broadcast_no_recipients"], ephemeral=True)
+        return
+
+    results = await api_client.message_players(recipients, message, BATCH_ACTION_CONCURRENCY)
+    delivered = sum(results.values())
+    admin = interaction.user.display_name
+    await interaction.client.report_store.record_actions(original_report_message.id, api_client.server_name,
+                                                         "Broadcast", admin, message, results)
+
+    lines = [f"{'✅' if results[player_id] else '❌'} {name}" for player_id, name in recipients]
+    description = "\n".join(lines)
+    if len(description) > 4000:
+        # Ein ganzes Team passt nicht immer in ein Embed, Fehlschläge zuerst
+        lines.sort(key=lambda line: not line.startswith('❌'))
+        description = "\n".join(lines)[:4000] + "\n..."
+    embed = discord.Embed(
+        title=texts["broadcast_result_title"].format(target_label, delivered, len(recipients)),
+        description=description,
+        color=discord.Colour.green() if delivered == len(recipients) else discord.Colour.orange()
+    )
+    await interaction.followup.send(embed=embed, ephemeral=True)
+
+    modlog = texts["log_broadcast"].format(admin, target_label, delivered, len(recipients), message)
+    # Eine Sammelnachricht schließt den Report nicht ab, die Buttons bleiben
+    await add_modlog(interaction, modlog, False, user_lang, api_client, original_message=original_report_message,
+                     delete_buttons=False)
@@ -0,0 +1,115 @@
+import asyncio
+import json
+import logging
+import time
+
+from metrics import registry
+
+OUTBOX_ITEMS = registry.counter(
+    "outbox_items_total", "Outbox side effects by kind and result (delivered/retry/failed)", ("kind", "result"))
+
+
+class Outbox:
+    """
+    Dauerhafte Warteschlange für Nebenwirkungen einer Moderationsaktion (Spielerkommentar,
+    Nachricht an den Reporter, Modlog im Report), gespeichert im ReportStore.
+    Der Button-Callback wartet nur auf das Eintragen, ein Hintergrund-Task führt die Einträge aus
+    und wiederholt fehlgeschlagene mit wachsendem Abstand, auch über einen Neustart hinweg.
+
+    Ein Handler bekommt den Payload und gibt True zurück, wenn der Eintrag erledigt ist
+    (auch bei endgültigen Fehlern wie einer gelöschten Nachricht); False oder eine Exception
+    bedeutet: später erneut versuchen.
+    """
+    def __init__(self, store, max_attempts=8, retry_seconds=5, max_retry_seconds=600, batch_size=50):
+        self.store = store
+        self.max_attempts = max_attempts
+        self.retry_seconds = retry_seconds
+        self.max_retry_seconds = max_retry_seconds
+        self.batch_size = batch_size
+        self.handlers = {}
+        self.wakeup = None
+        self.task = None
+
+    def register(self, kind, handler):
+        self.handlers[kind] = handler
+
+    async def put(self, kind, payload, sequence_key=None):
+        """
+        Eintrag dauerhaft speichern und den Worker wecken; führt selbst nichts aus.
+        Einträge mit gleichem sequence_key laufen streng nacheinander: ein späterer erst,
+        wenn der frühere erledigt oder aufgegeben ist (auch über Wiederholungen hinweg).
+        """
+        await self.store.outbox_add(kind, json.dumps(payload, separators=(',', ':'), ensure_ascii=False),
+                                    sequence_key)
+        if self.wakeup is not None:
+            self.wakeup.set()
+
+    def start(self):
+        # Event und Task müssen im laufenden Event-Loop angelegt werden
+        if self.task is None:
+            self.wakeup = asyncio.Event()
+            self.task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self.task is not None:
+            self.task.cancel()
+            await asyncio.gather(self.task, return_exceptions=True)
+            self.task = None
+
+    async def _run(self):
+        while True:
+            self.wakeup.clear()
+            try:
+                next_due = await self.drain()
+                # Nichts offen: schlafen, bis put() weckt
+                timeout = None if next_due is None else min(max(0.0, next_due - time.time()), self.max_retry_seconds)
+            except Exception as e:
+                logging.exception(f"Outbox drain failed: {e}")
+                timeout = self.retry_seconds
+            try:
+                await asyncio.wait_for(self.wakeup.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def drain(self):
+        """
+        Alle fälligen Einträge ausführen. Pro Ziel (CRCON-Server bzw. Discord) der Reihe nach,
+        verschiedene Ziele parallel. Die Reihenfolge z.B. der Modlog-Einträge einer Nachricht sichert
+        der sequence_key: pro Schlüssel liefert der Store nur den ältesten offenen Eintrag.
+        Gibt den Zeitpunkt des nächsten wartenden Eintrags zurück (None: keiner).
+        """
+        while True:
+            entries = await self.store.outbox_due(time.time(), self.batch_size)
+            if not entries:
+                return await self.store.outbox_next_due()
+            groups = {}
+            for entry_id, kind, payload, attempts in entries:
+                payload = json.loads(payload)
+                groups.setdefault(payload.get("server"), []).append((entry_id, kind, payload, attempts))
+            await asyncio.gather(*(self._process(group) for group in groups.values()))
+
+    async def _process(self, entries):
+        for entry_id, kind, payload, attempts in entries:
+            handler = self.handlers.get(kind)
+            error = None
+            try:
+                if handler is None:
+                    raise LookupError(f"no handler for outbox kind '{kind}'")
+                done = await handler(payload)
+            except Exception as e:
+                done, error = False, f"{type(e).__name__}: {e}"
+            if done:
+                OUTBOX_ITEMS.inc(kind, "delivered")
+                await self.store.outbox_done(entry_id)
+                continue
+            attempts += 1
+            error = error or "not delivered"
+            if attempts >= self.max_attempts:
+                OUTBOX_ITEMS.inc(kind, "failed")
+                logging.error(f"Outbox {kind} {entry_id} given up after {attempts} attempts ({error}): {payload}")
+                await self.store.outbox_fail(entry_id, attempts, error)
+                continue
+            OUTBOX_ITEMS.inc(kind, "retry")
+            delay = min(self.retry_seconds * 2 ** (attempts - 1), self.max_retry_seconds)
+            logging.warning(f"Outbox {kind} {entry_id} failed (attempt {attempts}, {error}), retry in {delay}s")
+            await self.store.outbox_retry(entry_id, attempts, time.time() + delay, error)
@@ -0,0 +1,120 @@
+import asyncio
+import cProfile
+import io
+import logging
+import pstats
+import sys
+import threading
+import time
+import traceback
+
+from metrics import registry
+
+EVENT_LOOP_LAG_SECONDS = registry.histogram(
+    "event_loop_lag_seconds", "Delay of the event loop heartbeat beyond its scheduled time",
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0))
+EVENT_LOOP_BLOCKED = registry.counter(
+    "event_loop_blocked_total", "Event loop stalls longer than LOOP_BLOCK_THRESHOLD_MS")
+
+
+class LoopProfiler:
+    """
+    cProfile über alle Callbacks des Event-Loops für ein Zeitfenster. Kostet nur, solange
+    ein Profil läuft; es läuft immer höchstens eines.
+    """
+    def __init__(self):
+        self.running = False
+
+    async def profile(self, seconds):
+        if self.running:
+            raise RuntimeError("A profile is already running")
+        self.running = True
+        profile = cProfile.Profile()
+        profile.enable()
+        try:
+            await asyncio.sleep(seconds)
+        finally:
+            profile.disable()
+            self.running = False
+        return pstats.Stats(profile)
+
+
+def top_functions(stats, limit=10):
+    """[(Funktion, Aufrufe, eigene Zeit, kumulierte Zeit)], sortiert nach eigener Zeit."""
+    rows = []
+    for (filename, line, function), (_, calls, tottime, cumtime, _) in stats.stats.items():
+        location = f"{filename.rsplit('/', 1)[-1]}:{line}" if line else filename
+        rows.append((f"{function} ({location})", calls, tottime, cumtime))
+    rows.sort(key=lambda row: row[2], reverse=True)
+    return rows[:limit]
+
+
+def format_summary(stats, seconds, limit=10):
+    """Kurzfassung für eine Discord-Nachricht (unter 2000 Zeichen)."""
+    lines = [f"{'tottime':>8} {'cumtime':>8} {'calls':>8}  function"]
+    for function, calls, tottime, cumtime in top_functions(stats, limit):
+        lines.append(f"{tottime:8.3f} {cumtime:8.3f} {calls:8d}  {function[:70]}")
+    return f"Profile of {seconds}s, top {limit} by own time:\n```\n" + "\n".join(lines) + "\n```"
+
+
+def format_report(stats, limit=50):
+    """Vollständiger pstats-Bericht (nach eigener und nach kumulierter Zeit) als Datei-Inhalt."""
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats('tottime').print_stats(limit)
+    stats.sort_stats('cumulative').print_stats(limit)
+    return stream.getvalue()
+
+
+class LoopWatchdog:
+    """
+    Erkennt Blockaden des Event-Loops: ein Heartbeat-Task setzt regelmäßig einen Zeitstempel,
+    ein Hintergrund-Thread prüft ihn. Bleibt er länger als threshold Sekunden stehen, wird der
+    Stack des Loop-Threads geloggt, also genau der Code, der gerade blockiert.
+    """
+    def __init__(self, threshold):
+        self.threshold = threshold
+        self.interval = threshold / 4
+        self.beat = time.monotonic()
+        self.loop_thread_id = None
+        self.heartbeat_task = None
+        self.thread = None
+        self.stopped = threading.Event()
+
+    def start(self):
+        self.loop_thread_id = threading.get_ident()
+        self.beat = time.monotonic()
+        self.heartbeat_task = asyncio.get_running_loop().create_task(self._heartbeat())
+        self.thread = threading.Thread(target=self._watch, name="loop-watchdog", daemon=True)
+        self.thread.start()
+
+    def stop(self):
+        self.stopped.set()
+        if self.heartbeat_task is not None:
+            self.heartbeat_task.cancel()
+            self.heartbeat_task = None
+
+    async def _heartbeat(self):
+        while True:
+            expected = time.monotonic() + self.interval
+            await asyncio.sleep(self.interval)
+            self.beat = time.monotonic()
+            EVENT_LOOP_LAG_SECONDS.observe(max(0.0, self.beat - expected))
+
+    def _watch(self):
+        blocked_since = None
+        while not self.stopped.wait(self.interval):
+            beat = self.beat
+            stalled = time.monotonic() - beat
+            if stalled <= self.threshold + self.interval:
+                if blocked_since is not None:
+                    logging.warning(f"Event loop was blocked for about {beat - blocked_since:.2f}s")
+                    blocked_since = None
+                continue
+            if blocked_since == beat:
+                continue  # dieselbe Blockade nur einmal melden
+            blocked_since = beat
+            EVENT_LOOP_BLOCKED.inc()
+            frame = sys._current_frames().get(self.loop_thread_id)
+            stack = "".join(traceback.format_stack(frame)) if frame is not None else "(no frame)"
+            logging.warning(f"Event loop blocked for more than {stalled:.2f}s, current stack:\n{stack}")
@@ -0,0 +1,104 @@
+import sys
+
+from helpers import remove_clantags
+
+
+def _intern(value):
+    return sys.intern(value) if value else value
+
+
+class Player:
+    """
+    Spieler aus get_players bzw. get_detailed_players (dort mit Team, Einheit, Rolle und Stats).
+    Kleingeschriebene Felder und die Namenswörter für den Abgleich werden einmal beim Anlegen
+    berechnet, nicht bei jedem Report und jeder Suche erneut.
+    """
+    __slots__ = ("player_id", "name", "name_lower", "name_words", "level", "team", "team_lower",
+                 "unit_name", "unit_lower", "role", "role_lower", "kills", "deaths")
+
+    def __init__(self, player_id, name, level=0, team=None, unit_name=None, role=None, kills=0, deaths=0):
+        self.player_id = player_id
+        self.name = name
+        name_lower = name.lower()
+        self.name_lower = name if name_lower == name else name_lower
+        self.name_words = tuple(remove_clantags(self.name_lower).split())
+        self.level = level
+        # Team, Einheit und Rolle haben nur wenige Werte: eine Instanz pro Wert für alle Spieler
+        self.team = _intern(team)
+        self.team_lower = _intern((team or "").lower())
+        self.unit_name = _intern(unit_name)
+        self.unit_lower = _intern((unit_name or "").lower())
+        self.role = _intern(role)
+        self.role_lower = _intern((role or "").lower())
+        self.kills = kills
+        self.deaths = deaths
+
+    @classmethod
+    def from_api(cls, data):
+        return cls(data['player_id'], data['name'], data.get('level', 0), data.get('team'), data.get('unit_name'),
+                   data.get('role'), data.get('kills', 0), data.get('deaths', 0))
+
+    def __repr__(self):
+        return f"Player({self.player_id!r}, {self.name!r})"
+
+
+class PlayerStats:
+    """Live-Stats eines Spielers aus get_live_game_stats, nur die Felder des Spieler-Reports."""
+    __slots__ = ("player_id", "name", "kills", "kills_streak", "kill_death_ratio", "kills_per_minute",
+                 "deaths", "teamkills", "teamkills_streak", "realname")
+
+    def __init__(self, player_id, name=None, kills=0, kills_streak=0, kill_death_ratio=0, kills_per_minute=0,
+                 deaths=0, teamkills=0, teamkills_streak=0, realname=None):
+        self.player_id = player_id
+        self.name = name
+        self.kills = kills
+        self.kills_streak = kills_streak
+        self.kill_death_ratio = kill_death_ratio
+        self.kills_per_minute = kills_per_minute
+        self.deaths = deaths
+        self.teamkills = teamkills
+        self.teamkills_streak = teamkills_streak
+        self.realname = realname
+
+    @classmethod
+    def from_api(cls, data):
+        profile = (data.get('steaminfo') or {}).get('profile') or {}
+        return cls(data['player_id'], data.get('player'), data.get('kills', 0), data.get('kills_streak', 0),
+                   data.get('kill_death_ratio', 0), data.get('kills_per_minute', 0), data.get('deaths', 0),
+                   data.get('teamkills', 0), data.get('teamkills_streak', 0), profile.get('realname'))
+
+
+class PlayerProfile:
+    """Profil aus get_player_profile: erster bekannter Name und Spielzeit."""
+    __slots__ = ("player_id", "name", "total_playtime_seconds", "sessions_count")
+
+    def __init__(self, player_id, name=None, total_playtime_seconds=0, sessions_count=0):
+        self.player_id = player_id
+        self.name = name
+        self.total_playtime_seconds = total_playtime_seconds
+        self.sessions_count = sessions_count
+
+    @property
+    def total_playtime_hours(self):
+        return self.total_playtime_seconds / 3600
+
+    @classmethod
+    def from_api(cls, data):
+        names = data.get('names') or []
+        return cls(data.get('player_id'), names[0]['name'] if names else None,
+                   data.get('total_playtime_seconds') or 0, data.get('sessions_count') or 0)
+
+
+class LogEntry:
+    """Eine Zeile aus get_structured_logs."""
+    __slots__ = ("timestamp_ms", "action", "player_name_1", "message")
+
+    def __init__(self, timestamp_ms, action, player_name_1=None, message=""):
+        self.timestamp_ms = timestamp_ms
+        self.action = action
+        self.player_name_1 = player_name_1
+        self.message = message
+
+    @classmethod
+    def from_api(cls, data):
+        return cls(data['timestamp_ms'], data.get('action'), data.get('player_name_1'), data.get('message', ""))
@@ -0,0 +1,36 @@
+import logging
+import os
+
+
+class ReportChannel:
+    """Ein Report-Kanal (in beliebiger Guild) mit Sprache und den Servern, deren Reports er bearbeitet."""
+    __slots__ = ("channel_id", "lang", "servers")
+
+    def __init__(self, channel_id, lang, servers=None):
+        self.channel_id = channel_id
+        self.lang = lang
+        self.servers = frozenset(servers or ())  # leer = alle konfigurierten Server
+
+    def accepts(self, server_name):
+        return not self.servers or server_name in self.servers
+
+
+def load_report_channels(max_channels, default_channel_id, default_lang):
+    """
+    Kanäle aus CHANNEL_ID_n, CHANNEL_LANG_n und CHANNEL_SERVERS_n (Servernamen, durch Komma getrennt)
+    für n = 1..max_channels. Ohne MAX_CHANNELS gilt wie bisher nur ALLOWED_CHANNEL_ID mit USER_LANG.
+    Gibt {channel_id: ReportChannel} zurück.
+    """
+    channels = {}
+    for i in range(1, max_channels + 1):
+        channel_id = os.getenv(f"CHANNEL_ID_{i}")
+        if not channel_id:
+            continue
+        servers = [name.strip() for name in os.getenv(f"CHANNEL_SERVERS_{i}", "").split(",") if name.strip()]
+        channel = ReportChannel(int(channel_id), os.getenv(f"CHANNEL_LANG_{i}") or default_lang, servers)
+        if channel.channel_id in channels:
+            logging.warning(f"CHANNEL_ID_{i} {channel.channel_id} is configured twice, using the last entry")
+        channels[channel.channel_id] = channel
+    if not channels and default_channel_id:
+        channels[default_channel_id] = ReportChannel(default_channel_id, default_lang)
+    return channels
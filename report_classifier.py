@@ -0,0 +1,79 @@
+import json
+
+REPORT_EMPTY = "empty"
+REPORT_AUTORESPOND = "autorespond"
+REPORT_WATCHLIST = "watchlist"
+REPORT_UNIT = "unit"
+REPORT_PLAYER = "player"
+
+
+class ReportClassification:
+    def __init__(self, kind, parts, unit_name=None, priority=False):
+        self.kind = kind
+        self.parts = parts
+        self.unit_name = unit_name
+        self.priority = priority
+
+
+class ReportClassifier:
+    """
+    Einmal beim Start gebauter Klassifizierer für Reporttexte.
+    Alle Vokabulare liegen als Sets vor, ein Report wird in einem Durchlauf über die Wörter eingeordnet.
+    """
+    def __init__(self, unit_words, command_words, priority_words, autorespond_phrases, watchlist_markers):
+        self.unit_words = frozenset(word.lower() for word in unit_words)
+        self.command_words = frozenset(word.lower() for word in command_words)
+        # Kommandanten-Wörter lösen ebenfalls einen Unit-Report aus
+        self.trigger_words = self.unit_words | self.command_words
+        self.priority_words = frozenset(word.lower() for word in priority_words)
+        self.autorespond_phrases = frozenset(phrase.lower() for phrase in autorespond_phrases)
+        self.watchlist_markers = tuple(marker.lower() for marker in watchlist_markers)
+
+    @classmethod
+    def from_files(cls, trigger_file, autorespond_file, languages=None):
+        """
+        Vokabulare aus trigger_words.json (pro Sprache) und autorespond_trigger.json laden.
+        languages=None => alle Sprachen aus der Datei.
+        """
+        with open(trigger_file, 'r', encoding='utf8') as file:
+            triggers = json.load(file)
+        with open(autorespond_file, 'r', encoding='utf8') as file:
+            autorespond_phrases = json.load(file)
+
+        unit_words, command_words, priority_words = set(), set(), set()
+        for lang, vocabulary in triggers.items():
+            if not isinstance(vocabulary, dict) or (languages and lang not in languages):
+                continue
+            unit_words.update(vocabulary.get("units", []))
+            command_words.update(vocabulary.get("command", []))
+            priority_words.update(vocabulary.get("priority", []))
+        return cls(unit_words, command_words, priority_words, autorespond_phrases,
+                   triggers.get("watchlist_markers", []))
+
+    def classify(self, clean_description):
+        """Reporttyp, betroffene Einheit und Priorität für eine bereits bereinigte Beschreibung bestimmen."""
+        description = clean_description.lower()
+        parts = description.split()
+        if not parts:
+            return ReportClassification(REPORT_EMPTY, parts)
+        if description in self.autorespond_phrases:
+            return ReportClassification(REPORT_AUTORESPOND, parts)
+        if any(marker in description for marker in self.watchlist_markers):
+            return ReportClassification(REPORT_WATCHLIST, parts)
+
+        unit_name = None
+        command = False
+        priority = False
+        for part in parts:
+            if part in self.trigger_words:
+                if unit_name is None:
+                    unit_name = part
+                if part in self.command_words:
+                    command = True
+            if part in self.priority_words:
+                priority = True
+
+        if unit_name is None:
+            return ReportClassification(REPORT_PLAYER, parts, priority=priority)
+        # Accept 'commander' and 'kommandant' as trigger words
+        return ReportClassification(REPORT_UNIT, parts, "command" if command else unit_name, priority)
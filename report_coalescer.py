@@ -0,0 +1,82 @@
+import asyncio
+import time
+
+
+class CoalescedReport:
+    """Ein bereits (oder gerade) beantworteter Report, an den weitere Meldungen angehängt werden."""
+    def __init__(self, key):
+        self.key = key
+        self.keys = [key]
+        self.created_at = time.monotonic()
+        self.response_message = None
+        self.reporters = []
+        self.ready = asyncio.Event()
+
+
+class ReportCoalescer:
+    """
+    Fasst Reports zusammen, die innerhalb von window_seconds auf denselben Spieler
+    (player_id) auf demselben Server (bzw. Schlüssel aus Kanal und Server) zeigen. Der erste Report wird normal bearbeitet,
+    alle weiteren warten auf dessen Antwortnachricht und werden dort angehängt.
+    Reports werden zuerst über ihr gemeldetes Ziel (Name bzw. Einheit) zusammengefasst, noch vor den
+    CRCON-Abfragen; erst der erste Report ermittelt die player_id und bindet seinen Eintrag daran (bind).
+    """
+    def __init__(self, window_seconds=60):
+        self.window_seconds = window_seconds
+        self.reports = {}
+
+    def _purge(self):
+        now = time.monotonic()
+        expired = [key for key, entry in self.reports.items() if now - entry.created_at > self.window_seconds]
+        for key in expired:
+            del self.reports[key]
+
+    def claim(self, server, target):
+        """
+        (entry, True), wenn dies der erste Report für das Ziel im Zeitfenster ist,
+        sonst (bestehender entry, False).
+        """
+        if self.window_seconds <= 0:
+            return CoalescedReport((server, target)), True
+        self._purge()
+        key = (server, target)
+        entry = self.reports.get(key)
+        if entry is not None:
+            return entry, False
+        entry = CoalescedReport(key)
+        self.reports[key] = entry
+        return entry, True
+
+    def bind(self, entry, player_id):
+        """
+        Eintrag zusätzlich unter der ermittelten player_id führen. Gibt den Eintrag eines anderen
+        Reports zurück, der (anders formuliert) schon auf diesen Spieler zeigt, sonst None.
+        """
+        if self.window_seconds <= 0:
+            return None
+        key = (entry.key[0], player_id)
+        existing = self.reports.get(key)
+        if existing is not None and existing is not entry:
+            return existing
+        self.reports[key] = entry
+        entry.keys.append(key)
+        return None
+
+    def forward(self, entry, target):
+        """Erster Report wurde an target angehängt: seine Wartenden hängen sich ebenfalls dort an."""
+        entry.reporters = target.reporters
+        entry.response_message = target.response_message
+        entry.ready.set()
+
+    def publish(self, entry, response_message, reporter):
+        """Antwortnachricht des ersten Reports hinterlegen; wartende Reports werden freigegeben."""
+        entry.response_message = response_message
+        entry.reporters.append(reporter)
+        entry.ready.set()
+
+    def release(self, entry):
+        """Erster Report hat keine Antwort erzeugt: Eintrag verwerfen, Wartende bearbeiten selbst."""
+        for key in entry.keys:
+            if self.reports.get(key) is entry:
+                del self.reports[key]
+        entry.ready.set()
@@ -0,0 +1,129 @@
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+
+import tracing
+from metrics import REPORTS_PROCESSED, REPORT_PROCESSING_SECONDS, REPORT_QUEUE_WAIT_SECONDS
+
+PRIORITY_HIGH = 0
+PRIORITY_NORMAL = 1
+
+
+class ReportQueue:
+    """
+    Begrenzte Arbeitswarteschlange für Reports.
+    - feste Anzahl Worker statt einer CRCON-Aufrufkette pro Nachricht
+    - max. per_server_limit gleichzeitige Reports pro Server
+    - identische, noch offene Reports werden nur einmal bearbeitet
+    - niedrigere Priorität wird zuerst bearbeitet (PRIORITY_HIGH vor PRIORITY_NORMAL)
+    Jeder Server hat eine eigene Teil-Queue. Ein Worker nimmt nur Reports von Servern mit freiem Platz,
+    ein ausgelasteter Server blockiert also keine Worker und hält Reports anderer Server nicht auf.
+    Ist die Queue voll, wartet submit() (Backpressure), bis wieder Platz ist.
+    """
+    def __init__(self, maxsize=100, workers=4, per_server_limit=2):
+        self.maxsize = maxsize
+        self.worker_count = workers
+        self.per_server_limit = per_server_limit
+        self.server_queues = {}  # server_name -> Heap aus (priority, sequence, ...)
+        self.running = {}  # server_name -> Reports in Bearbeitung
+        self.size = 0
+        self.changed = asyncio.Condition()
+        self.pending_keys = set()
+        self.workers = []
+        self._sequence = itertools.count()
+
+    @property
+    def depth(self):
+        return self.size
+
+    def full(self):
+        return 0 < self.maxsize <= self.size
+
+    def start(self):
+        if not self.workers:
+            self.workers = [asyncio.create_task(self._worker(i)) for i in range(self.worker_count)]
+
+    async def stop(self):
+        for worker in self.workers:
+            worker.cancel()
+        await asyncio.gather(*self.workers, return_exceptions=True)
+        self.workers = []
+
+    async def submit(self, server_name, dedup_key, priority, handler, *args, span=None):
+        """
+        Reiht handler(*args) ein. Gibt False zurück, wenn ein identischer Report bereits offen ist.
+        span: Trace des Reports; handler läuft darin, der Span endet mit der Bearbeitung.
+        """
+        if dedup_key in self.pending_keys:
+            logging.info(f"Duplicate report ignored: {dedup_key}")
+            if span:
+                span.set("duplicate", True)
+                span.end()
+            return False
+        self.pending_keys.add(dedup_key)
+        try:
+            async with self.changed:
+                if self.full():
+                    logging.warning(f"Report queue full ({self.maxsize}), waiting for a free slot")
+                    await self.changed.wait_for(lambda: not self.full())
+                self._push(server_name, dedup_key, priority, handler, args, span)
+        except BaseException:
+            # Warten abgebrochen (z.B. beim Herunterfahren): Report gilt nicht mehr als offen
+            self.pending_keys.discard(dedup_key)
+            if span:
+                span.set("cancelled", True)
+                span.end()
+            raise
+        logging.info(f"Report queued (priority {priority}, depth {self.depth}): {dedup_key}")
+        return True
+
+    def _push(self, server_name, dedup_key, priority, handler, args, span):
+        heapq.heappush(self.server_queues.setdefault(server_name, []),
+                       (priority, next(self._sequence), server_name, dedup_key, handler, args, time.monotonic(), span))
+        self.size += 1
+        self.changed.notify_all()
+
+    def _ready_servers(self):
+        return [server_name for server_name, queue in self.server_queues.items()
+                if queue and self.running.get(server_name, 0) < self.per_server_limit]
+
+    def _take(self):
+        """Wichtigsten Report unter allen Servern mit freiem Platz entnehmen und den Platz belegen."""
+        server_name = min(self._ready_servers(), key=lambda name: self.server_queues[name][0][:2])
+        item = heapq.heappop(self.server_queues[server_name])
+        self.running[server_name] = self.running.get(server_name, 0) + 1
+        self.size -= 1
+        return item
+
+    async def _release(self, server_name):
+        async with self.changed:
+            self.running[server_name] -= 1
+            self.changed.notify_all()
+
+    async def _worker(self, number):
+        while True:
+            async with self.changed:
+                await self.changed.wait_for(self._ready_servers)
+                priority, _, server_name, dedup_key, handler, args, queued_at, span = self._take()
+                self.changed.notify_all()  # wartende submit()-Aufrufe: wieder Platz
+            result = "ok"
+            try:
+                started = time.monotonic()
+                REPORT_QUEUE_WAIT_SECONDS.observe(started - queued_at)
+                if span:
+                    # Wartezeit nachträglich als eigener Abschnitt im Trace
+                    now = time.time()
+                    tracing.start_span("queue.wait", parent=span, start=now - (started - queued_at)).end()
+                    span.set("handler", handler.__name__)
+                with tracing.use_span(span):
+                    await handler(*args)
+                REPORT_PROCESSING_SECONDS.observe(time.monotonic() - started, handler.__name__)
+            except Exception as e:
+                result = "error"
+                logging.exception(f"Report worker {number} failed for {dedup_key}: {e}")
+            finally:
+                REPORTS_PROCESSED.inc(server_name, handler.__name__, result)
+                self.pending_keys.discard(dedup_key)
+                await asyncio.shield(self._release(server_name))
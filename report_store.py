@@ -0,0 +1,318 @@
+import asyncio
+import functools
+import json
+import os
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS reports (
+    message_id INTEGER PRIMARY KEY,
+    server TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    lang TEXT NOT NULL,
+    player_id TEXT,
+    player_name TEXT,
+    state TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'open',
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS reports_player_id ON reports (player_id);
+CREATE INDEX IF NOT EXISTS reports_server_status ON reports (server, status);
+
+CREATE TABLE IF NOT EXISTS reporters (
+    message_id INTEGER NOT NULL,
+    reporter_name TEXT NOT NULL,
+    reporter_player_id TEXT,
+    reported_at INTEGER NOT NULL,
+    PRIMARY KEY (message_id, reporter_name)
+);
+
+CREATE TABLE IF NOT EXISTS actions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id INTEGER,
+    server TEXT,
+    player_id TEXT,
+    action TEXT NOT NULL,
+    admin TEXT,
+    reason TEXT,
+    success INTEGER NOT NULL,
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS actions_message_id ON actions (message_id);
+CREATE INDEX IF NOT EXISTS actions_player_id ON actions (player_id);
+CREATE INDEX IF NOT EXISTS actions_server ON actions (server);
+
+CREATE TABLE IF NOT EXISTS outcomes (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    message_id INTEGER NOT NULL,
+    outcome TEXT NOT NULL,
+    admin TEXT,
+    created_at INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS outcomes_message_id ON outcomes (message_id);
+
+CREATE TABLE IF NOT EXISTS outbox (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    kind TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    status TEXT NOT NULL DEFAULT 'pending',
+    attempts INTEGER NOT NULL DEFAULT 0,
+    next_attempt_at REAL NOT NULL,
+    last_error TEXT,
+    created_at INTEGER NOT NULL,
+    sequence_key TEXT
+);
+CREATE INDEX IF NOT EXISTS outbox_status_due ON outbox (status, next_attempt_at);
+"""
+
+# Nur der älteste offene Eintrag je sequence_key ist ausführbar, die übrigen warten auf ihn
+OUTBOX_HEAD = (
+    "status = 'pending' AND (sequence_key IS NULL OR NOT EXISTS ("
+    "SELECT 1 FROM outbox AS earlier WHERE earlier.sequence_key = outbox.sequence_key "
+    "AND earlier.status = 'pending' AND earlier.id < outbox.id))"
+)
+
+
+class ReportStore:
+    """
+    Lokaler Report-Speicher (SQLite, WAL-Modus): Reports mit ihrem Button-Zustand,
+    Reporter, ausgeführte Aktionen und Ergebnisse sowie die Outbox für deren Nebenwirkungen.
+    Buttons und Folgeaktionen holen ihren Kontext mit einer lokalen Abfrage statt über
+    Discord/CRCON, offene Reports werden nach einem Neustart wieder registriert.
+    Alle Zugriffe laufen in einem eigenen Thread, damit der Event-Loop nie auf die Platte wartet.
+    """
+    def __init__(self, path, max_age=7 * 24 * 3600):
+        self.path = path
+        self.max_age = max_age
+        self.connection = None
+        # Ein einziger Thread: SQLite-Verbindung wird nie parallel benutzt
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="report-store")
+
+    async def _run(self, func, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, functools.partial(self._call, func, *args))
+
+    def _call(self, func, *args):
+        if self.connection is None:
+            self._connect()
+        with self.connection:
+            return func(*args)
+
+    def _connect(self):
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(self.path, check_same_thread=False)
+        self.connection.execute("PRAGMA journal_mode=WAL")
+        self.connection.execute("PRAGMA synchronous=NORMAL")
+        self.connection.executescript(SCHEMA)
+        # Ältere Datenbanken: Outbox ohne sequence_key
+        columns = {row[1] for row in self.connection.execute("PRAGMA table_info(outbox)")}
+        if "sequence_key" not in columns:
+            self.connection.execute("ALTER TABLE outbox ADD COLUMN sequence_key TEXT")
+        self.connection.execute(
+            "CREATE INDEX IF NOT EXISTS outbox_sequence ON outbox (sequence_key, status, id)"
+        )
+
+    async def load(self, limit=None):
+        """
+        Offene Reports der letzten max_age Sekunden, höchstens die limit neuesten:
+        {message_id: state}, älteste zuerst. Ältere Reports werden geschlossen.
+        """
+        return await self._run(self._load, limit)
+
+    def _load(self, limit=None):
+        cutoff = int(time.time()) - self.max_age
+        self.connection.execute(
+            "UPDATE reports SET status = 'expired' WHERE status = 'open' AND created_at < ?", (cutoff,)
+        )
+        # Discord-Message-IDs steigen mit der Zeit, die höchsten IDs sind die neuesten Reports
+        rows = self.connection.execute(
+            "SELECT message_id, kind, state FROM reports WHERE status = 'open' ORDER BY message_id DESC LIMIT ?",
+            (limit if limit is not None else -1,)
+        ).fetchall()
+        reports = {}
+        for message_id, kind, state in reversed(rows):
+            state = json.loads(state)
+            state["kind"] = kind
+            reports[message_id] = state
+        return reports
+
+    async def get(self, message_id, open_only=False):
+        return await self._run(self._get, message_id, open_only)
+
+    def _get(self, message_id, open_only=False):
+        query = "SELECT kind, state FROM reports WHERE message_id = ?"
+        if open_only:
+            query += " AND status = 'open'"
+        row = self.connection.execute(query, (message_id,)).fetchone()
+        if row is None:
+            return None
+        state = json.loads(row[1])
+        state["kind"] = row[0]
+        return state
+
+    async def save(self, message_id, state):
+        """Report (bzw. neuen Button-Zustand nach Spielerwechsel) speichern, Reporter mit eintragen."""
+        await self._run(self._save, message_id, state)
+
+    def _save(self, message_id, state):
+        now = int(time.time())
+        if state["kind"] == "unit":
+            player_id, player_name = state["players"][0] if state["players"] else (None, None)
+        else:
+            player_id, player_name = state["player_id"], state["name"]
+        self.connection.execute(
+            "INSERT OR REPLACE INTO reports "
+            "(message_id, server, kind, lang, player_id, player_name, state, status, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, 'open', ?)",
+            (message_id, state["server"], state["kind"], state["lang"], player_id, player_name,
+             json.dumps(state, separators=(',', ':'), ensure_ascii=False), now)
+        )
+        if state.get("author_name"):
+            self._add_reporter(message_id, state["author_name"], state.get("author_player_id"))
+
+    async def add_reporter(self, message_id, reporter_name, reporter_player_id=None):
+        await self._run(self._add_reporter, message_id, reporter_name, reporter_player_id)
+
+    def _add_reporter(self, message_id, reporter_name, reporter_player_id=None):
+        self.connection.execute(
+            "INSERT OR IGNORE INTO reporters (message_id, reporter_name, reporter_player_id, reported_at) "
+            "VALUES (?, ?, ?, ?)",
+            (message_id, reporter_name, reporter_player_id, int(time.time()))
+        )
+
+    async def get_reporters(self, message_id):
+        """Alle Reporter eines Reports als [(Name, Player-ID oder None)], in Meldereihenfolge."""
+        return await self._run(self._get_reporters, message_id)
+
+    def _get_reporters(self, message_id):
+        return self.connection.execute(
+            "SELECT reporter_name, reporter_player_id FROM reporters "
+            "WHERE message_id = ? ORDER BY reported_at, rowid",
+            (message_id,)
+        ).fetchall()
+
+    async def set_kind(self, message_id, kind):
+        """Art der Buttons ändern, z.B. "finish" nach manueller Bearbeitung."""
+        await self._run(self._set_kind, message_id, kind)
+
+    def _set_kind(self, message_id, kind):
+        self.connection.execute("UPDATE reports SET kind = ? WHERE message_id = ?", (kind, message_id))
+
+    async def close_report(self, message_id):
+        """Buttons des Reports wurden entfernt: beim Neustart nicht mehr registrieren."""
+        await self._run(self._close_report, message_id)
+
+    def _close_report(self, message_id):
+        self.connection.execute(
+            "UPDATE reports SET status = 'closed' WHERE message_id = ? AND status = 'open'", (message_id,)
+        )
+
+    async def get_player_name(self, message_id, player_id):
+        """Name eines Spielers aus dem gespeicherten Report, None wenn unbekannt."""
+        state = await self.get(message_id)
+        if state is None:
+            return None
+        if state["kind"] == "unit":
+            return next((name for unit_player_id, name in state["players"] if unit_player_id == player_id), None)
+        if state.get("player_found", True) and state.get("player_id") == player_id:
+            return state["name"]
+        return None
+
+    async def record_action(self, message_id, server, player_id, action, admin, reason, success):
+        await self._run(self._record_action, message_id, server, player_id, action, admin, reason, success)
+
+    def _record_action(self, message_id, server, player_id, action, admin, reason, success):
+        self.connection.execute(
+            "INSERT INTO actions (message_id, server, player_id, action, admin, reason, success, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            (message_id, server, player_id, action, admin, reason, int(bool(success)), int(time.time()))
+        )
+
+    async def record_actions(self, message_id, server, action, admin, reason, results):
+        """Eine Aktion gegen viele Spieler auf einmal, results = {player_id: Erfolg}."""
+        await self._run(self._record_actions, message_id, server, action, admin, reason, results)
+
+    def _record_actions(self, message_id, server, action, admin, reason, results):
+        now = int(time.time())
+        self.connection.executemany(
+            "INSERT INTO actions (message_id, server, player_id, action, admin, reason, success, created_at) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [(message_id, server, player_id, action, admin, reason, int(bool(success)), now)
+             for player_id, success in results.items()]
+        )
+
+    async def record_outcome(self, message_id, outcome, admin):
+        await self._run(self._record_outcome, message_id, outcome, admin)
+
+    def _record_outcome(self, message_id, outcome, admin):
+        self.connection.execute(
+            "INSERT INTO outcomes (message_id, outcome, admin, created_at) VALUES (?, ?, ?, ?)",
+            (message_id, outcome, admin, int(time.time()))
+        )
+
+    async def outbox_add(self, kind, payload, sequence_key=None):
+        await self._run(self._outbox_add, kind, payload, sequence_key)
+
+    def _outbox_add(self, kind, payload, sequence_key=None):
+        self.connection.execute(
+            "INSERT INTO outbox (kind, payload, next_attempt_at, created_at, sequence_key) VALUES (?, ?, ?, ?, ?)",
+            (kind, payload, time.time(), int(time.time()), sequence_key)
+        )
+
+    async def outbox_due(self, now, limit):
+        """
+        Fällige Einträge [(id, kind, payload, attempts)], älteste zuerst. Von Einträgen mit gleichem
+        sequence_key nur der älteste offene, auch wenn er selbst noch nicht wieder fällig ist.
+        """
+        return await self._run(self._outbox_due, now, limit)
+
+    def _outbox_due(self, now, limit):
+        return self.connection.execute(
+            f"SELECT id, kind, payload, attempts FROM outbox WHERE {OUTBOX_HEAD} AND next_attempt_at <= ? "
+            "ORDER BY id LIMIT ?",
+            (now, limit)
+        ).fetchall()
+
+    async def outbox_next_due(self):
+        """Zeitpunkt des nächsten ausführbaren Eintrags, None wenn keiner wartet."""
+        return await self._run(self._outbox_next_due)
+
+    def _outbox_next_due(self):
+        return self.connection.execute(
+            f"SELECT MIN(next_attempt_at) FROM outbox WHERE {OUTBOX_HEAD}"
+        ).fetchone()[0]
+
+    async def outbox_done(self, entry_id):
+        await self._run(self._outbox_done, entry_id)
+
+    def _outbox_done(self, entry_id):
+        self.connection.execute("DELETE FROM outbox WHERE id = ?", (entry_id,))
+
+    async def outbox_retry(self, entry_id, attempts, next_attempt_at, error):
+        await self._run(self._outbox_retry, entry_id, attempts, next_attempt_at, error)
+
+    def _outbox_retry(self, entry_id, attempts, next_attempt_at, error):
+        self.connection.execute(
+            "UPDATE outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE id = ?",
+            (attempts, next_attempt_at, error, entry_id)
+        )
+
+    async def outbox_fail(self, entry_id, attempts, error):
+        """Aufgegeben: bleibt zur Nachverfolgung mit status 'failed' stehen."""
+        await self._run(self._outbox_fail, entry_id, attempts, error)
+
+    def _outbox_fail(self, entry_id, attempts, error):
+        self.connection.execute(
+            "UPDATE outbox SET status = 'failed', attempts = ?, last_error = ? WHERE id = ?",
+            (attempts, error, entry_id)
+        )
+
+    def close(self):
+        self.executor.shutdown(wait=True)
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
@@ -0,0 +1,111 @@
+import time
+from collections import OrderedDict
+from email.utils import parsedate_to_datetime
+
+
+class CachedResponse:
+    """Rohe Antwort eines GET mit den Validatoren (ETag/Last-Modified) und ihrer Gültigkeit."""
+    __slots__ = ("body", "etag", "last_modified", "expires_at", "must_revalidate")
+
+    def __init__(self, body, etag, last_modified, expires_at, must_revalidate):
+        self.body = body
+        self.etag = etag
+        self.last_modified = last_modified
+        self.expires_at = expires_at
+        self.must_revalidate = must_revalidate
+
+    def is_fresh(self):
+        return not self.must_revalidate and time.monotonic() < self.expires_at
+
+    def conditional_headers(self):
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def parse_cache_control(value):
+    """'no-cache, max-age=60' -> {'no-cache': None, 'max-age': '60'}"""
+    directives = {}
+    for part in (value or "").split(","):
+        name, _, argument = part.strip().partition("=")
+        if name:
+            directives[name.lower()] = argument.strip('"') or None
+    return directives
+
+
+def freshness_seconds(headers, directives):
+    """Wie lange eine Antwort ohne Rückfrage gilt: max-age, sonst Expires - Date, sonst 0."""
+    if "max-age" in directives:
+        try:
+            return max(0, int(directives["max-age"]))
+        except (TypeError, ValueError):
+            return 0
+    if "Expires" in headers:
+        try:
+            expires = parsedate_to_datetime(headers["Expires"])
+            date = parsedate_to_datetime(headers["Date"]) if "Date" in headers else None
+            if date is None:
+                return max(0, int(expires.timestamp() - time.time()))
+            return max(0, int((expires - date).total_seconds()))
+        except (TypeError, ValueError):
+            return 0
+    return 0
+
+
+class ResponseCache:
+    """
+    HTTP-Cache für selten geänderte CRCON-Endpunkte (Profile, Nachrichtenvorlagen), Schlüssel ist die URL.
+    Gespeichert wird nur, was CRCON als cachebar kennzeichnet (ETag, Last-Modified oder max-age, kein
+    no-store). Frische Einträge werden direkt beantwortet, abgelaufene per If-None-Match/If-Modified-Since
+    nachgefragt; bei 304 gilt der gespeicherte Body weiter. Über max_bytes (Summe der Bodies) werden die
+    am längsten nicht benutzten Einträge verworfen.
+    """
+    def __init__(self, max_bytes=4 * 1024 * 1024):
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.size = 0
+        self.evicted = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is not None:
+            self.entries.move_to_end(key)
+        return entry
+
+    def store(self, key, body, headers):
+        """Antwort (200) übernehmen, falls sie cachebar ist und ins Budget passt. Eintrag oder None."""
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        lifetime = freshness_seconds(headers, directives)
+        if "no-store" in directives or not (etag or last_modified or lifetime):
+            self.discard(key)
+            return None
+        if len(body) > self.max_bytes:
+            self.discard(key)
+            return None
+        entry = CachedResponse(body, etag, last_modified, time.monotonic() + lifetime, "no-cache" in directives)
+        self.discard(key)
+        self.entries[key] = entry
+        self.size += len(body)
+        while self.size > self.max_bytes:
+            _, oldest = self.entries.popitem(last=False)
+            self.size -= len(oldest.body)
+            self.evicted += 1
+        return entry
+
+    def revalidated(self, key, entry, headers):
+        """304: Body bleibt, Validatoren und Gültigkeit kommen aus der neuen Antwort (falls gesendet)."""
+        directives = parse_cache_control(headers.get("Cache-Control"))
+        entry.etag = headers.get("ETag") or entry.etag
+        entry.last_modified = headers.get("Last-Modified") or entry.last_modified
+        entry.expires_at = time.monotonic() + freshness_seconds(headers, directives)
+        entry.must_revalidate = "no-cache" in directives
+
+    def discard(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.size -= len(entry.body)
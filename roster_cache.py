@@ -0,0 +1,165 @@
+import asyncio
+import logging
+import time
+
+from Levenshtein import jaro_winkler
+
+from helpers import remove_clantags
+from metrics import CACHE_REQUESTS
+
+
+class SquadIndex:
+    """
+    Index über get_detailed_players: (team, unit_name) -> Spieler der Einheit.
+    Wird einmal pro Abruf gebaut, danach ist jede Squad-Suche ein Dict-Zugriff.
+    """
+    def __init__(self, players):
+        self.units = {}
+        self.teams = {}
+        self.players = {}
+        for player in players:
+            if not player.team:
+                continue
+            self.units.setdefault((player.team_lower, player.unit_lower), []).append(player)
+            self.teams.setdefault(player.team_lower, []).append(player)
+            self.players[player.player_id] = player
+
+    def members(self, team, unit_name):
+        return self.units.get((team.lower(), (unit_name or "").lower()), [])
+
+    def squad_of(self, player_id):
+        """Alle Spieler im Squad von player_id; leer, wenn er keinem Squad angehört oder offline ist."""
+        player = self.players.get(player_id)
+        if player is None or not player.unit_name:
+            return []
+        return self.units.get((player.team_lower, player.unit_lower), [])
+
+    def team_of(self, player_id):
+        """Alle Spieler im Team von player_id."""
+        player = self.players.get(player_id)
+        if player is None:
+            return []
+        return self.teams.get(player.team_lower, [])
+
+    def leaders(self, team, unit_name, roles):
+        """Alle Spieler der Einheit, deren Rolle in roles enthalten ist."""
+        roles = {role.lower() for role in roles}
+        return [player for player in self.members(team, unit_name) if player.role_lower in roles]
+
+
+class NameIndex:
+    """
+    Spielername -> player_id für die Reporter-Auflösung: exakt über den kleingeschriebenen Namen als
+    Dict-Zugriff, sonst unscharf über den Namen ohne Clantags (nur bei einem eindeutig guten Treffer).
+    """
+    def __init__(self, players, fuzzy_threshold=0.9):
+        self.fuzzy_threshold = fuzzy_threshold
+        self.ids = {}
+        self.stripped = {}
+        for player in players:
+            self.ids.setdefault(player.name_lower, player.player_id)
+            self.stripped.setdefault(" ".join(player.name_words), player.player_id)
+
+    def resolve(self, name):
+        name = name.lower()
+        player_id = self.ids.get(name)
+        if player_id is not None:
+            return player_id
+        # Embed-Name weicht ab (Clantag, Sonderzeichen, abgeschnitten): bester Treffer ohne Clantags
+        key = " ".join(remove_clantags(name).split())
+        if key in self.stripped:
+            return self.stripped[key]
+        best_score, best_id = 0.0, None
+        for candidate, player_id in self.stripped.items():
+            score = jaro_winkler(key, candidate)
+            if score > best_score:
+                best_score, best_id = score, player_id
+        return best_id if best_score >= self.fuzzy_threshold else None
+
+
+class RosterCache:
+    """
+    Zwischenspeicher pro Server für get_detailed_players (schwerster Endpunkt).
+    Innerhalb von ttl Sekunden wird der Index wiederverwendet; gleichzeitige Anfragen
+    teilen sich einen einzigen Abruf.
+    Daneben der NameIndex für Reporter, gefüttert von jedem Roster-Abruf (auch dem
+    get_players des Spieler-Reports), sodass die Auflösung meist ohne eigenen Abruf auskommt.
+    Unbekannte Namen erzwingen einen neuen Abruf höchstens alle min_refresh_seconds.
+    """
+    def __init__(self, api_client, ttl=30, fuzzy_threshold=0.9, min_refresh_seconds=5):
+        self.api_client = api_client
+        self.ttl = ttl
+        self.min_refresh_seconds = min_refresh_seconds
+        self.fuzzy_threshold = fuzzy_threshold
+        self.squad_index = None
+        self.fetched_at = 0
+        self.lock = asyncio.Lock()
+        self.name_index = None
+        self.names_fetched_at = 0
+        self.names_lock = asyncio.Lock()
+
+    def _is_fresh(self):
+        return self.squad_index is not None and time.monotonic() - self.fetched_at < self.ttl
+
+    def _names_fresh(self):
+        return self.name_index is not None and time.monotonic() - self.names_fetched_at < self.ttl
+
+    def update_players(self, players):
+        """Neuen NameIndex aus einer gerade geholten Spielerliste [Player] (get_players oder get_detailed_players)."""
+        self.name_index = NameIndex(players, self.fuzzy_threshold)
+        self.names_fetched_at = time.monotonic()
+
+    async def _refresh_names(self):
+        players = await self.api_client.get_players()
+        if players is None:
+            logging.error("Failed to retrieve players list for reporter resolution")
+            return False
+        self.update_players(players)
+        return True
+
+    async def resolve_player_id(self, name):
+        """player_id eines Spielers (meist des Reporters) anhand seines Namens, None wenn nicht auf dem Server."""
+        if not name:
+            return None
+        refreshed = False
+        if not self._names_fresh():
+            async with self.names_lock:
+                if not self._names_fresh():
+                    CACHE_REQUESTS.inc("names", "miss")
+                    if not await self._refresh_names():
+                        return None
+                    refreshed = True
+        if not refreshed:
+            CACHE_REQUESTS.inc("names", "hit")
+        player_id = self.name_index.resolve(name)
+        if player_id is None and not refreshed:
+            # Reporter ist evtl. erst nach dem letzten Abruf beigetreten: neu laden, aber nicht für jeden
+            # unbekannten Namen (z.B. Sammelnachricht an Reporter, die den Server verlassen haben)
+            async with self.names_lock:
+                if time.monotonic() - self.names_fetched_at >= self.min_refresh_seconds:
+                    CACHE_REQUESTS.inc("names", "miss")
+                    await self._refresh_names()
+                player_id = self.name_index.resolve(name)
+        return player_id
+
+    async def get_squad_index(self):
+        if self._is_fresh():
+            CACHE_REQUESTS.inc("roster", "hit")
+            return self.squad_index
+        async with self.lock:
+            if self._is_fresh():
+                # Gleichzeitige Anfrage hat den Abruf schon erledigt
+                CACHE_REQUESTS.inc("roster", "hit")
+                return self.squad_index
+            CACHE_REQUESTS.inc("roster", "miss")
+            players = await self.api_client.get_detailed_players()
+            if players is None:
+                logging.error("Failed to retrieve player data or player data is incomplete.")
+                return None
+            self.squad_index = SquadIndex(players)
+            self.fetched_at = time.monotonic()
+            self.update_players(players)
+            return self.squad_index
+
+    def invalidate(self):
+        self.squad_index = None
@@ -0,0 +1,66 @@
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from outbox import Outbox  # noqa: E402
+from report_store import ReportStore  # noqa: E402
+
+
+class OutboxOrderTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.store = ReportStore(os.path.join(self.directory.name, "reports.db"))
+        self.outbox = Outbox(self.store, retry_seconds=60)
+        self.delivered = []
+        self.failures = {"first": 1}
+        self.outbox.register("modlog", self.modlog)
+
+    async def asyncTearDown(self):
+        self.store.close()
+        self.directory.cleanup()
+
+    async def modlog(self, payload):
+        if self.failures.get(payload["text"], 0):
+            self.failures[payload["text"]] -= 1
+            return False
+        self.delivered.append(payload["text"])
+        return True
+
+    async def test_later_entry_waits_for_failed_earlier_entry(self):
+        await self.outbox.put("modlog", {"text": "first"}, sequence_key="modlog:1:10")
+        await self.outbox.put("modlog", {"text": "second"}, sequence_key="modlog:1:10")
+        await self.outbox.put("modlog", {"text": "other"}, sequence_key="modlog:1:11")
+
+        await self.outbox.drain()
+        self.assertEqual(self.delivered, ["other"])
+
+        self.assertEqual(len(await self.store.outbox_due(float("inf"), 10)), 1)  # nur "first"
+        await self.store._run(lambda: self.store.connection.execute("UPDATE outbox SET next_attempt_at = 0"))
+        await self.outbox.drain()
+        self.assertEqual(self.delivered, ["other", "first", "second"])
+        self.assertIsNone(await self.store.outbox_next_due())
+
+    async def test_old_database_gets_sequence_key(self):
+        path = os.path.join(self.directory.name, "old.db")
+        connection = sqlite3.connect(path)
+        connection.execute(
+            "CREATE TABLE outbox (id INTEGER PRIMARY KEY AUTOINCREMENT, kind TEXT NOT NULL, payload TEXT NOT NULL, "
+            "status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0, "
+            "next_attempt_at REAL NOT NULL, last_error TEXT, created_at INTEGER NOT NULL)"
+        )
+        connection.commit()
+        connection.close()
+        store = ReportStore(path)
+        try:
+            await store.outbox_add("modlog", "{}", "modlog:1:10")
+            self.assertEqual(len(await store.outbox_due(float("inf"), 10)), 1)
+        finally:
+            store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,40 @@
+import os
+import re
+import sys
+import unittest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, REPO_ROOT)
+
+from messages import is_report_custom_id, report_custom_id, REPORT_BUTTON_ACTIONS  # noqa: E402
+
+# Nicht Teil einer Report-Nachricht: Modal bzw. ephemere Bestätigung
+NON_REPORT_CUSTOM_IDS = {"reason_input", "confirm_action"}
+
+
+def static_custom_ids(filename):
+    with open(os.path.join(REPO_ROOT, filename), encoding="utf-8") as f:
+        return set(re.findall(r'custom_id="([^"]+)"', f.read()))
+
+
+class ReportCustomIdTest(unittest.TestCase):
+    def test_static_custom_ids_of_report_views_are_recognised(self):
+        custom_ids = (static_custom_ids("modals.py") | static_custom_ids("messages.py")) - NON_REPORT_CUSTOM_IDS
+        self.assertIn("finished_processing", custom_ids)
+        for custom_id in custom_ids:
+            with self.subTest(custom_id=custom_id):
+                self.assertTrue(is_report_custom_id(custom_id))
+
+    def test_non_report_custom_ids_are_ignored(self):
+        for custom_id in NON_REPORT_CUSTOM_IDS | {"", "a1b2c3d4", "kick", "other_bot:1:2"}:
+            with self.subTest(custom_id=custom_id):
+                self.assertFalse(is_report_custom_id(custom_id))
+
+    def test_player_button_custom_ids_are_recognised(self):
+        for action in REPORT_BUTTON_ACTIONS:
+            with self.subTest(action=action):
+                self.assertTrue(is_report_custom_id(report_custom_id(action, "76561198000000000", "Server 1")))
+
+
+if __name__ == '__main__':
+    unittest.main()
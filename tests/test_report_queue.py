@@ -0,0 +1,72 @@
+import asyncio
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from report_queue import ReportQueue, PRIORITY_HIGH, PRIORITY_NORMAL  # noqa: E402
+
+
+class ReportQueueTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.queue = ReportQueue(maxsize=100, workers=4, per_server_limit=2)
+        self.release = asyncio.Event()
+        self.started = []
+
+    async def asyncTearDown(self):
+        self.release.set()
+        await self.queue.stop()
+
+    async def blocking_report(self, name):
+        self.started.append(name)
+        await self.release.wait()
+
+    async def wait_started(self, name):
+        while name not in self.started:
+            await asyncio.sleep(0)
+
+    async def test_flooded_server_does_not_stall_other_servers(self):
+        self.queue.start()
+        for i in range(10):
+            await self.queue.submit("server-a", f"a-{i}", PRIORITY_HIGH, self.blocking_report, f"a-{i}")
+        await self.queue.submit("server-b", "b-0", PRIORITY_NORMAL, self.blocking_report, "b-0")
+
+        await asyncio.wait_for(self.wait_started("b-0"), timeout=1)
+        self.assertEqual(sum(name.startswith("a-") for name in self.started), 2)
+        self.assertEqual(self.queue.depth, 8)
+
+    async def test_higher_priority_first_within_server(self):
+        self.queue = ReportQueue(maxsize=100, workers=1, per_server_limit=1)
+        await self.queue.submit("server-a", "normal", PRIORITY_NORMAL, self.blocking_report, "normal")
+        await self.queue.submit("server-a", "high", PRIORITY_HIGH, self.blocking_report, "high")
+        self.queue.start()
+
+        await asyncio.wait_for(self.wait_started("high"), timeout=1)
+        self.assertEqual(self.started, ["high"])
+        self.release.set()
+        await asyncio.wait_for(self.wait_started("normal"), timeout=1)
+
+    async def test_duplicate_report_is_ignored_while_pending(self):
+        self.assertTrue(await self.queue.submit("server-a", "key", PRIORITY_NORMAL, self.blocking_report, "x"))
+        self.assertFalse(await self.queue.submit("server-a", "key", PRIORITY_NORMAL, self.blocking_report, "x"))
+        self.assertEqual(self.queue.depth, 1)
+
+    async def test_cancelled_submit_on_full_queue_releases_key(self):
+        self.queue = ReportQueue(maxsize=1, workers=1, per_server_limit=1)
+        await self.queue.submit("server-a", "first", PRIORITY_NORMAL, self.blocking_report, "first")
+        waiting = asyncio.create_task(
+            self.queue.submit("server-a", "second", PRIORITY_NORMAL, self.blocking_report, "second"))
+        await asyncio.sleep(0)
+        waiting.cancel()
+        with self.assertRaises(asyncio.CancelledError):
+            await waiting
+
+        self.assertNotIn("second", self.queue.pending_keys)
+        self.queue.start()
+        await asyncio.wait_for(self.wait_started("first"), timeout=1)
+        self.assertTrue(await self.queue.submit("server-a", "second", PRIORITY_NORMAL, self.blocking_report, "x"))
+
+
+if __name__ == '__main__':
+    unittest.main()
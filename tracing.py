@@ -0,0 +1,266 @@
+import asyncio
+import contextlib
+import contextvars
+import functools
+import json
+import logging
+import random
+import time
+
+import aiohttp
+
+_current_span = contextvars.ContextVar("current_span", default=None)
+
+
+class Span:
+    """Ein Abschnitt eines Reports (CRCON-Aufruf, Matching, Embed, Discord-Antwort, Button, ...)."""
+    __slots__ = ("tracer", "name", "trace_id", "span_id", "parent_id", "start", "end_time", "attributes", "error")
+
+    def __init__(self, tracer, name, parent=None, attributes=None, start=None):
+        self.tracer = tracer
+        self.name = name
+        self.trace_id = parent.trace_id if parent is not None else f"{random.getrandbits(128):032x}"
+        self.span_id = f"{random.getrandbits(64):016x}"
+        self.parent_id = parent.span_id if parent is not None else None
+        self.start = start if start is not None else time.time()
+        self.end_time = None
+        self.attributes = attributes or {}
+        self.error = None
+
+    def set(self, key, value):
+        self.attributes[key] = value
+
+    def end(self, error=None, end_time=None):
+        """Span abschließen und exportieren; weitere Aufrufe werden ignoriert."""
+        if self.end_time is not None:
+            return
+        self.end_time = end_time if end_time is not None else time.time()
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+        self.tracer.export(self)
+
+    def to_dict(self):
+        return {
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "name": self.name,
+            "start": self.start,
+            "duration_ms": round((self.end_time - self.start) * 1000, 3),
+            "attributes": self.attributes,
+            "error": self.error,
+        }
+
+
+class JsonLinesExporter:
+    """Ein JSON-Objekt pro Span und Zeile; geschrieben wird gesammelt im Executor."""
+    def __init__(self, path):
+        self.path = path
+
+    async def export(self, spans):
+        loop = asyncio.get_running_loop()
+        await loop.run_in_executor(None, self.write, spans)
+
+    def write(self, spans):
+        with open(self.path, 'a', encoding='utf8') as file:
+            for span in spans:
+                file.write(json.dumps(span.to_dict(), ensure_ascii=False, default=str) + "\n")
+
+    async def close(self):
+        pass
+
+
+def _otlp_value(value):
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+class OtlpHttpExporter:
+    """OTLP/HTTP mit JSON-Kodierung an einen lokalen Collector (z.B. http://localhost:4318)."""
+    def __init__(self, endpoint, service_name="discord-reports"):
+        self.url = endpoint.rstrip('/') + "/v1/traces"
+        self.service_name = service_name
+        self.session = None
+
+    def payload(self, spans):
+        return {"resourceSpans": [{
+            "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": self.service_name}}]},
+            "scopeSpans": [{"scope": {"name": "discord-reports"}, "spans": [
+                {
+                    "traceId": span.trace_id,
+                    "spanId": span.span_id,
+                    "parentSpanId": span.parent_id or "",
+                    "name": span.name,
+                    "kind": 1,
+                    "startTimeUnixNano": str(int(span.start * 1e9)),
+                    "endTimeUnixNano": str(int(span.end_time * 1e9)),
+                    "attributes": [{"key": key, "value": _otlp_value(value)} for key, value in span.attributes.items()],
+                    "status": {"code": 2, "message": span.error} if span.error else {"code": 1},
+                }
+                for span in spans
+            ]}],
+        }]}
+
+    async def export(self, spans):
+        if self.session is None:
+            # Eigene Session ohne TraceConfig, der Export erzeugt selbst keine Spans
+            self.session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=10))
+        async with self.session.post(self.url, json=self.payload(spans)) as response:
+            if response.status >= 300:
+                logging.error(f"OTLP export failed: {response.status} {await response.text()}")
+
+    async def close(self):
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
+
+
+class Tracer:
+    """
+    Sammelt abgeschlossene Spans und gibt sie alle flush_interval Sekunden an den Exporter.
+    Ohne Exporter (Standard) ist Tracing aus und span() kostet praktisch nichts.
+    """
+    def __init__(self, max_buffer=10000):
+        self.exporter = None
+        self.buffer = []
+        self.max_buffer = max_buffer
+        self.dropped = 0
+        self.flusher = None
+
+    @property
+    def enabled(self):
+        return self.exporter is not None
+
+    def configure(self, exporter):
+        self.exporter = exporter
+
+    def export(self, span):
+        if len(self.buffer) >= self.max_buffer:
+            self.dropped += 1
+            return
+        self.buffer.append(span)
+
+    async def flush(self):
+        if not self.buffer or self.exporter is None:
+            return
+        spans, self.buffer = self.buffer, []
+        try:
+            await self.exporter.export(spans)
+        except Exception as e:
+            logging.error(f"Exporting {len(spans)} spans failed: {e}")
+
+    def start(self, flush_interval=1.0):
+        if self.enabled and self.flusher is None:
+            self.flusher = asyncio.create_task(self._flush_loop(flush_interval))
+
+    async def _flush_loop(self, interval):
+        while True:
+            await asyncio.sleep(interval)
+            await self.flush()
+
+    async def close(self):
+        if self.flusher is not None:
+            self.flusher.cancel()
+            self.flusher = None
+        await self.flush()
+        if self.exporter is not None:
+            await self.exporter.close()
+
+
+tracer = Tracer()
+
+
+def current_span():
+    return _current_span.get()
+
+
+def set_attribute(key, value):
+    """Attribut am aktuellen Span setzen (ohne aktiven Span: nichts)."""
+    span = _current_span.get()
+    if span is not None:
+        span.set(key, value)
+
+
+def start_span(name, parent=None, start=None, **attributes):
+    """Span ohne ihn aktiv zu setzen; None, wenn Tracing aus ist. Endet mit span.end()."""
+    if not tracer.enabled:
+        return None
+    return Span(tracer, name, parent if parent is not None else _current_span.get(), attributes, start)
+
+
+@contextlib.contextmanager
+def use_span(span, end=True):
+    """span für den Block zum aktuellen Span machen und danach (optional) beenden."""
+    if span is None:
+        yield None
+        return
+    token = _current_span.set(span)
+    try:
+        yield span
+    except BaseException as e:
+        if end:
+            span.end(error=e)
+        raise
+    finally:
+        _current_span.reset(token)
+        if end:
+            span.end()
+
+
+@contextlib.contextmanager
+def span(name, **attributes):
+    """Kind-Span des aktuellen Spans (oder neuer Trace) für die Dauer des Blocks."""
+    if not tracer.enabled:
+        yield None
+        return
+    with use_span(Span(tracer, name, _current_span.get(), attributes)) as new_span:
+        yield new_span
+
+
+def traced(name):
+    """Decorator für Button-/Modal-Callbacks: eigener Span pro Interaktion, mit der Message-ID des Reports."""
+    def decorator(func):
+        @functools.wraps(func)
+        async def wrapper(self, interaction, *args, **kwargs):
+            if not tracer.enabled:
+                return await func(self, interaction, *args, **kwargs)
+            attributes = {"user": str(interaction.user)}
+            custom_id = (interaction.data or {}).get("custom_id")
+            if custom_id:
+                attributes["custom_id"] = custom_id
+            if interaction.message is not None:
+                attributes["message_id"] = interaction.message.id
+            with span(name, **attributes):
+                return await func(self, interaction, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def http_spans(trace_config, prefix):
+    """
+    HTTP-Anfragen einer aiohttp-Session als Kind-Spans aufzeichnen. Anfragen ohne aktiven
+    Span (z.B. Gateway-Verbindung) erzeugen keine eigenen Traces.
+    """
+    async def on_request_start(session, context, params):
+        parent = _current_span.get()
+        context.span = Span(tracer, f"{prefix} {params.method}", parent, {"url.path": params.url.path}) \
+            if tracer.enabled and parent is not None else None
+
+    async def on_request_end(session, context, params):
+        if context.span is not None:
+            context.span.set("http.status", params.response.status)
+            context.span.end()
+
+    async def on_request_exception(session, context, params):
+        if context.span is not None:
+            context.span.end(error=params.exception)
+
+    trace_config.on_request_start.append(on_request_start)
+    trace_config.on_request_end.append(on_request_end)
+    trace_config.on_request_exception.append(on_request_exception)
+    return trace_config
@@ -0,0 +1,121 @@
+import asyncio
+import json
+import logging
+import os
+import string
+
+_formatter = string.Formatter()
+
+
+def placeholders(text):
+    """Platzhalter eines Format-Strings als (Positionen, Namen); {} und {0} zählen gleich."""
+    positions, names = set(), set()
+    auto_index = 0
+    for _, field_name, _, _ in _formatter.parse(text):
+        if field_name is None:
+            continue
+        field_name = field_name.split('.')[0].split('[')[0]
+        if field_name == "":
+            positions.add(auto_index)
+            auto_index += 1
+        elif field_name.isdigit():
+            positions.add(int(field_name))
+        else:
+            names.add(field_name)
+    return positions, names
+
+
+class LanguageBundle(dict):
+    """Alle Texte einer Sprache. Unbekannte Keys ergeben "" (wie bisher get_translation)."""
+    __slots__ = ("lang",)
+
+    def __init__(self, lang, texts=()):
+        super().__init__(texts)
+        self.lang = lang
+
+    def __missing__(self, key):
+        return ""
+
+
+class TranslationCatalog:
+    """
+    Einmal geladene Übersetzungen aus languages.json mit einem festen LanguageBundle pro Sprache.
+    Beim Laden wird geprüft, dass alle Sprachen dieselben Keys und dieselben {}-Platzhalter
+    wie die Referenzsprache haben. Bei einem Reload werden die bestehenden Bundles an Ort und
+    Stelle aktualisiert, Views mit einem Bundle sehen also sofort die neuen Texte.
+    """
+    def __init__(self, path, reference_lang="en"):
+        self.path = path
+        self.reference_lang = reference_lang
+        self.bundles = {}
+        self.mtime = None
+        self.version = 0  # wird bei jedem (Re-)Load erhöht, z.B. für abgeleitete Caches
+        self.load()
+
+    def load(self):
+        """Datei laden und prüfen. Wirft ValueError, wenn die Sprachen nicht zusammenpassen."""
+        mtime = os.path.getmtime(self.path)
+        with open(self.path, 'r', encoding='utf8') as file:
+            data = json.load(file)
+        errors = self.validate(data)
+        if errors:
+            raise ValueError(f"Invalid translations in {self.path}:\n" + "\n".join(errors))
+        for lang, texts in data.items():
+            bundle = self.bundles.get(lang)
+            if bundle is None:
+                self.bundles[lang] = LanguageBundle(lang, texts)
+            else:
+                bundle.clear()
+                bundle.update(texts)
+        self.mtime = mtime
+        self.version += 1
+
+    def validate(self, data):
+        errors = []
+        reference = data.get(self.reference_lang)
+        if reference is None:
+            return [f"reference language '{self.reference_lang}' missing"]
+        for lang, texts in data.items():
+            for key in sorted(set(reference) - set(texts)):
+                errors.append(f"{lang}: missing key '{key}'")
+            for key in sorted(set(texts) - set(reference)):
+                errors.append(f"{lang}: unknown key '{key}'")
+            for key, text in texts.items():
+                try:
+                    text_placeholders = placeholders(text)
+                    if key in reference and text_placeholders != placeholders(reference[key]):
+                        errors.append(f"{lang}: placeholders of '{key}' differ from '{self.reference_lang}'")
+                except ValueError as e:
+                    errors.append(f"{lang}: '{key}' is not a valid format string ({e})")
+        return errors
+
+    def bundle(self, lang):
+        """Texte einer Sprache; für unbekannte Sprachen ein leeres Bundle."""
+        bundle = self.bundles.get(lang)
+        if bundle is None:
+            bundle = self.bundles[lang] = LanguageBundle(lang)
+        return bundle
+
+    def reload_if_changed(self):
+        """Neu laden, wenn sich die Datei geändert hat. Ungültige Dateien werden verworfen, die alten Texte bleiben."""
+        try:
+            mtime = os.path.getmtime(self.path)
+        except OSError as e:
+            logging.error(f"Translations not reloaded: {e}")
+            return False
+        if mtime == self.mtime:
+            return False
+        try:
+            self.load()
+        except (OSError, ValueError) as e:
+            logging.error(f"Translations not reloaded: {e}")
+            self.mtime = mtime  # erst nach der nächsten Änderung erneut versuchen
+            return False
+        logging.info(f"Translations reloaded from {self.path}")
+        return True
+
+    async def watch(self, interval):
+        """Datei alle interval Sekunden auf Änderungen prüfen (für eine gemountete languages.json)."""
+        while True:
+            await asyncio.sleep(interval)
+            self.reload_if_changed()
@@ -0,0 +1,54 @@
+from collections import OrderedDict
+
+
+class ViewRegistry:
+    """
+    LRU-begrenzte Verwaltung der aktiven Report-Views (message_id -> View).
+    Über max_views hinaus wird die am längsten nicht benutzte View gestoppt und damit aus
+    dem ViewStore von discord.py entfernt. Ihr Zustand liegt im ReportStore, bei einem
+    späteren Klick wird sie von dort neu aufgebaut.
+    """
+    def __init__(self, max_views=500):
+        self.max_views = max_views
+        self.views = OrderedDict()
+        self.evicted = 0
+        self.restored = 0
+
+    def __contains__(self, message_id):
+        return message_id in self.views
+
+    @property
+    def live(self):
+        return len(self.views)
+
+    def register(self, message_id, view):
+        """
+        View einer Nachricht merken. Beim Ersetzen einer View vor dem Anhängen an die Nachricht
+        aufrufen, damit die alte View gestoppt ist, bevor discord.py die neue einträgt.
+        """
+        previous = self.views.pop(message_id, None)
+        if previous is not None and previous is not view:
+            previous.stop()
+        self.views[message_id] = view
+        while len(self.views) > self.max_views:
+            _, oldest = self.views.popitem(last=False)
+            oldest.stop()
+            self.evicted += 1
+
+    def touch(self, message_id):
+        if message_id in self.views:
+            self.views.move_to_end(message_id)
+
+    def discard(self, message_id):
+        """Report abgeschlossen: View stoppen und vergessen."""
+        view = self.views.pop(message_id, None)
+        if view is not None:
+            view.stop()
+
+    def stats(self):
+        return {
+            "live_views": self.live,
+            "max_views": self.max_views,
+            "evicted": self.evicted,
+            "restored": self.restored,
+        }